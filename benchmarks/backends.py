@@ -0,0 +1,152 @@
+"""Compare the time taken to parse maps with each installed JSON and XML backend.
+
+A map with several large tile layers and object layers is generated in both the JSON
+and TMX formats, and each is parsed repeatedly with every installed backend for its
+format. The best time of the repeats is reported.
+
+    python benchmarks/backends.py --side 256 --repeat 5
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from pytiled_parser import parse_map
+from pytiled_parser.backends import available_json_backends, available_xml_backends
+
+
+def make_objects(count: int) -> list:
+    return [
+        {
+            "id": object_id,
+            "name": f"Object {object_id}",
+            "type": "",
+            "x": object_id * 8.0,
+            "y": object_id * 4.0,
+            "width": 16.0,
+            "height": 16.0,
+            "rotation": 0,
+            "visible": True,
+        }
+        for object_id in range(1, count + 1)
+    ]
+
+
+def write_json_map(path: Path, side: int, layers: int, objects: int) -> None:
+    data = [index % 48 + 1 for index in range(side * side)]
+    raw_layers = [
+        {
+            "data": data,
+            "height": side,
+            "id": layer_id,
+            "name": f"Layer {layer_id}",
+            "opacity": 1,
+            "type": "tilelayer",
+            "visible": True,
+            "width": side,
+            "x": 0,
+            "y": 0,
+        }
+        for layer_id in range(1, layers + 1)
+    ]
+    raw_layers.append(
+        {
+            "draworder": "topdown",
+            "id": layers + 1,
+            "name": "Objects",
+            "objects": make_objects(objects),
+            "opacity": 1,
+            "type": "objectgroup",
+            "visible": True,
+            "x": 0,
+            "y": 0,
+        }
+    )
+    path.write_text(
+        json.dumps(
+            {
+                "height": side,
+                "width": side,
+                "infinite": False,
+                "layers": raw_layers,
+                "nextlayerid": layers + 2,
+                "nextobjectid": objects + 1,
+                "orientation": "orthogonal",
+                "renderorder": "right-down",
+                "tiledversion": "1.9.0",
+                "tileheight": 32,
+                "tilewidth": 32,
+                "tilesets": [],
+                "type": "map",
+                "version": "1.9",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def write_tmx_map(path: Path, side: int, layers: int, objects: int) -> None:
+    row = ",".join(str(x % 48 + 1) for x in range(side))
+    csv = ",\n".join([row] * side)
+
+    with open(path, "w", encoding="utf-8") as map_file:
+        map_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+            f'renderorder="right-down" width="{side}" height="{side}" '
+            f'tilewidth="32" tileheight="32" infinite="0" '
+            f'nextlayerid="{layers + 2}" nextobjectid="{objects + 1}">\n'
+        )
+        for layer_id in range(1, layers + 1):
+            map_file.write(
+                f' <layer id="{layer_id}" name="Layer {layer_id}" '
+                f'width="{side}" height="{side}">\n'
+                f'  <data encoding="csv">\n{csv}\n</data>\n'
+                " </layer>\n"
+            )
+        map_file.write(f' <objectgroup id="{layers + 1}" name="Objects">\n')
+        for raw_object in make_objects(objects):
+            map_file.write(
+                f'  <object id="{raw_object["id"]}" name="{raw_object["name"]}" '
+                f'x="{raw_object["x"]}" y="{raw_object["y"]}" '
+                f'width="{raw_object["width"]}" height="{raw_object["height"]}"/>\n'
+            )
+        map_file.write(" </objectgroup>\n</map>\n")
+
+
+def best_time(path: Path, repeat: int, **backends: str) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_map(path, **backends)  # type: ignore
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--side", type=int, default=256)
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_map = Path(directory) / "map.json"
+        tmx_map = Path(directory) / "map.tmx"
+        write_json_map(json_map, args.side, args.layers, args.objects)
+        write_tmx_map(tmx_map, args.side, args.layers, args.objects)
+
+        for name in available_json_backends():
+            seconds = best_time(json_map, args.repeat, json_backend=name)
+            print(f"json {name:>8}: {seconds * 1000:.1f} ms")
+
+        for name in available_xml_backends():
+            seconds = best_time(tmx_map, args.repeat, xml_backend=name)
+            print(f" tmx {name:>8}: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Measure the memory held by a parsed map with a large number of objects.
+
+A map with a single object layer holding the given number of rectangle, ellipse,
+point and polygon objects is generated in both the JSON and TMX formats. Each is
+parsed in a fresh process, which reports the memory held by the parsed map as traced
+by tracemalloc, per object, along with the time taken to parse it.
+
+With `--templates`, every object is instead created from one object template with a
+number of properties, and every tenth object overrides one of them. With
+`--properties`, every object has a few properties drawn from a small set of values.
+
+With `--interning`, the map is parsed with an interner which shares equal values
+within it, for comparison.
+
+    python benchmarks/object_memory.py --objects 100000
+    python benchmarks/object_memory.py --objects 100000 --templates
+    python benchmarks/object_memory.py --objects 100000 --properties --interning
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pytiled_parser import parse_map
+from pytiled_parser.interning import Interner
+
+FORMATS = ["json", "tmx"]
+
+SHAPES = ["rectangle", "ellipse", "point", "polygon"]
+
+TEMPLATE_PROPERTIES = {f"property_{index}": f"value {index}" for index in range(8)}
+
+KINDS = ["crate", "barrel", "chest", "sign"]
+
+
+def make_objects(count: int, properties: bool = False) -> list:
+    objects = []
+    for object_id in range(1, count + 1):
+        raw_object = {
+            "id": object_id,
+            "name": "",
+            "type": "",
+            "x": float(object_id % 1000 * 16),
+            "y": float(object_id // 1000 * 16),
+            "width": 16.0,
+            "height": 16.0,
+            "rotation": 0,
+            "visible": True,
+        }
+        shape = SHAPES[object_id % len(SHAPES)]
+        if shape == "ellipse":
+            raw_object["ellipse"] = True
+        elif shape == "point":
+            raw_object["point"] = True
+        elif shape == "polygon":
+            raw_object["polygon"] = [
+                {"x": 0, "y": 0},
+                {"x": 16, "y": 0},
+                {"x": 8, "y": 16},
+            ]
+        if properties:
+            raw_object["properties"] = [
+                {"name": "kind", "type": "string", "value": KINDS[object_id % 4]},
+                {"name": "health", "type": "int", "value": object_id % 3 * 10},
+                {"name": "locked", "type": "bool", "value": object_id % 2 == 0},
+            ]
+        objects.append(raw_object)
+    return objects
+
+
+def make_template_instances(count: int, template: str) -> list:
+    objects = []
+    for object_id in range(1, count + 1):
+        raw_object = {
+            "id": object_id,
+            "template": template,
+            "x": float(object_id % 1000 * 16),
+            "y": float(object_id // 1000 * 16),
+        }
+        if object_id % 10 == 0:
+            raw_object["properties"] = [
+                {"name": "property_0", "type": "string", "value": str(object_id)}
+            ]
+        objects.append(raw_object)
+    return objects
+
+
+def write_json_template(path: Path) -> None:
+    properties = [
+        {"name": name, "type": "string", "value": value}
+        for name, value in TEMPLATE_PROPERTIES.items()
+    ]
+    path.write_text(
+        json.dumps(
+            {
+                "object": {
+                    "height": 16,
+                    "id": 1,
+                    "name": "crate",
+                    "properties": properties,
+                    "rotation": 0,
+                    "type": "",
+                    "visible": True,
+                    "width": 16,
+                },
+                "type": "template",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def write_tmx_template(path: Path) -> None:
+    properties = "".join(
+        f'<property name="{name}" value="{value}"/>'
+        for name, value in TEMPLATE_PROPERTIES.items()
+    )
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<template><object name="crate" width="16" height="16">'
+        f"<properties>{properties}</properties></object></template>\n",
+        encoding="utf-8",
+    )
+
+
+def write_json_map(path: Path, objects: list) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "height": 100,
+                "width": 1000,
+                "infinite": False,
+                "layers": [
+                    {
+                        "draworder": "topdown",
+                        "id": 1,
+                        "name": "Objects",
+                        "objects": objects,
+                        "opacity": 1,
+                        "type": "objectgroup",
+                        "visible": True,
+                        "x": 0,
+                        "y": 0,
+                    }
+                ],
+                "nextlayerid": 2,
+                "nextobjectid": len(objects) + 1,
+                "orientation": "orthogonal",
+                "renderorder": "right-down",
+                "tiledversion": "1.9.0",
+                "tileheight": 16,
+                "tilewidth": 16,
+                "tilesets": [],
+                "type": "map",
+                "version": "1.9",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def write_tmx_map(path: Path, objects: list) -> None:
+    with open(path, "w", encoding="utf-8") as map_file:
+        map_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+            'renderorder="right-down" width="1000" height="100" '
+            'tilewidth="16" tileheight="16" infinite="0" '
+            f'nextlayerid="2" nextobjectid="{len(objects) + 1}">\n'
+            ' <objectgroup id="1" name="Objects">\n'
+        )
+        for raw_object in objects:
+            map_file.write(
+                f'  <object id="{raw_object["id"]}" '
+                f'x="{raw_object["x"]}" y="{raw_object["y"]}"'
+            )
+            if "template" in raw_object:
+                map_file.write(f' template="{raw_object["template"]}"')
+            else:
+                map_file.write(
+                    f' width="{raw_object["width"]}" height="{raw_object["height"]}"'
+                )
+
+            children = ""
+            if "properties" in raw_object:
+                properties = "".join(
+                    f'<property name="{raw_property["name"]}" '
+                    f'type="{raw_property["type"]}" value="{raw_property["value"]}"/>'
+                    for raw_property in raw_object["properties"]
+                )
+                children += f"<properties>{properties}</properties>"
+            if raw_object.get("ellipse"):
+                children += "<ellipse/>"
+            elif raw_object.get("point"):
+                children += "<point/>"
+            elif "polygon" in raw_object:
+                points = " ".join(
+                    f"{point['x']},{point['y']}" for point in raw_object["polygon"]
+                )
+                children += f'<polygon points="{points}"/>'
+
+            if children:
+                map_file.write(f">{children}</object>\n")
+            else:
+                map_file.write("/>\n")
+        map_file.write(" </objectgroup>\n</map>\n")
+
+
+def measure(path: Path, interning: bool) -> dict:
+    """Parse the map in this process, and report the memory held by it."""
+    interner = Interner() if interning else None
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    parsed = parse_map(path, interner=interner)
+    del interner
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    model = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "objects": len(parsed.layers[0].tiled_objects),  # type: ignore
+        "seconds": elapsed,
+        "model": model,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--templates", action="store_true")
+    parser.add_argument("--properties", action="store_true")
+    parser.add_argument("--interning", action="store_true")
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        print(json.dumps(measure(args.measure, args.interning)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in FORMATS:
+            path = Path(directory) / f"map.{extension}"
+            if not args.templates:
+                objects = make_objects(args.objects, args.properties)
+            elif extension == "json":
+                write_json_template(Path(directory) / "crate.json")
+                objects = make_template_instances(args.objects, "crate.json")
+            else:
+                write_tmx_template(Path(directory) / "crate.tx")
+                objects = make_template_instances(args.objects, "crate.tx")
+
+            if extension == "json":
+                write_json_map(path, objects)
+            else:
+                write_tmx_map(path, objects)
+
+            command = [sys.executable, __file__, "--measure", str(path)]
+            if args.interning:
+                command.append("--interning")
+            output = subprocess.run(
+                command,
+                check=True,
+                stdout=subprocess.PIPE,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{extension:>4}: {result['seconds']:.2f}s, "
+                f"model {result['model'] / 2**20:.1f} MiB, "
+                f"{result['model'] / result['objects']:.0f} bytes per object"
+            )
+
+
+if __name__ == "__main__":
+    main()
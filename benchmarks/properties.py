@@ -0,0 +1,144 @@
+"""Measure the time taken to parse a map with many properties, and to read them.
+
+A map with a single object layer is generated in both the JSON and TMX formats, where
+every object has a property of each type, with values which differ between objects.
+Properties are converted from their raw values when they are first read, so the
+time taken to parse the map and the time taken to then read every property are
+reported separately. The best time of the repeats is reported.
+
+    python benchmarks/properties.py --objects 20000 --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from pytiled_parser import parse_map
+
+
+def make_properties(object_id: int) -> list:
+    return [
+        {"name": "bool", "type": "bool", "value": object_id % 2 == 0},
+        {"name": "color", "type": "color", "value": f"#ff{object_id % 256:02x}8040"},
+        {"name": "file", "type": "file", "value": f"images/{object_id}.png"},
+        {"name": "float", "type": "float", "value": object_id / 4},
+        {"name": "int", "type": "int", "value": object_id},
+        {"name": "string", "type": "string", "value": f"object {object_id}"},
+    ]
+
+
+def write_json_map(path: Path, count: int) -> None:
+    objects = [
+        {
+            "id": object_id,
+            "name": "",
+            "type": "",
+            "x": float(object_id),
+            "y": 0.0,
+            "width": 16.0,
+            "height": 16.0,
+            "rotation": 0,
+            "visible": True,
+            "properties": make_properties(object_id),
+        }
+        for object_id in range(1, count + 1)
+    ]
+    path.write_text(
+        json.dumps(
+            {
+                "height": 100,
+                "width": 100,
+                "infinite": False,
+                "layers": [
+                    {
+                        "draworder": "topdown",
+                        "id": 1,
+                        "name": "Objects",
+                        "objects": objects,
+                        "opacity": 1,
+                        "type": "objectgroup",
+                        "visible": True,
+                        "x": 0,
+                        "y": 0,
+                    }
+                ],
+                "nextlayerid": 2,
+                "nextobjectid": count + 1,
+                "orientation": "orthogonal",
+                "renderorder": "right-down",
+                "tiledversion": "1.9.0",
+                "tileheight": 16,
+                "tilewidth": 16,
+                "tilesets": [],
+                "type": "map",
+                "version": "1.9",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def write_tmx_map(path: Path, count: int) -> None:
+    with open(path, "w", encoding="utf-8") as map_file:
+        map_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+            'renderorder="right-down" width="100" height="100" '
+            'tilewidth="16" tileheight="16" infinite="0" '
+            f'nextlayerid="2" nextobjectid="{count + 1}">\n'
+            ' <objectgroup id="1" name="Objects">\n'
+        )
+        for object_id in range(1, count + 1):
+            properties = "".join(
+                f'<property name="{raw_property["name"]}" '
+                f'type="{raw_property["type"]}" '
+                f'value="{json.dumps(raw_property["value"]).strip(chr(34))}"/>'
+                for raw_property in make_properties(object_id)
+            )
+            map_file.write(
+                f'  <object id="{object_id}" x="{object_id}" y="0" width="16" '
+                f'height="16"><properties>{properties}</properties></object>\n'
+            )
+        map_file.write(" </objectgroup>\n</map>\n")
+
+
+def measure(path: Path, repeat: int) -> tuple:
+    parse_times = []
+    read_times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        tiled_map = parse_map(path)
+        parse_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for tiled_object in tiled_map.layers[0].tiled_objects:  # type: ignore
+            dict(tiled_object.properties)
+        read_times.append(time.perf_counter() - start)
+        gc.enable()
+    return min(parse_times), min(read_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, write_map in (("json", write_json_map), ("tmx", write_tmx_map)):
+            path = Path(directory) / f"map.{extension}"
+            write_map(path, args.objects)
+            parse_seconds, read_seconds = measure(path, args.repeat)
+            print(
+                f"{extension:>4}: parse {parse_seconds * 1000:.1f} ms, "
+                f"read every property {read_seconds * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Measure the peak memory used while parsing a large TMX map.
+
+A map with several large base64 encoded tile layers is generated, and then parsed both
+by building the ElementTree of the whole document first, and with the streaming parser
+used by `parse_map`, which parses each layer as soon as it has been read. Each parse
+runs in a fresh process, and reports the peak of the memory traced by tracemalloc,
+the peak resident set size of the process, and the memory held by the parsed map.
+
+    python benchmarks/tmx_memory.py --megabytes 100
+"""
+
+import argparse
+import base64
+import gc
+import json
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pytiled_parser.context import ParseContext
+from pytiled_parser.parsers.tmx import tiled_map
+from pytiled_parser.util import parse_xml
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+MODES = ["tree", "stream"]
+
+# Characters of base64 text per tile, plus some slack for the line breaks
+_CHARACTERS_PER_TILE = 16 / 3
+
+
+def write_map(path: Path, megabytes: int, layers: int = 8) -> None:
+    """Write a map of roughly the given size, made of square tile layers."""
+    tiles = int(megabytes * 1024 * 1024 / _CHARACTERS_PER_TILE / layers)
+    side = int(tiles**0.5)
+
+    row = struct.pack(f"<{side}I", *((x % 48) + 1 for x in range(side)))
+    layer_data = base64.b64encode(row * side).decode("ascii")
+
+    with open(path, "w", encoding="utf-8") as map_file:
+        map_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+            f'renderorder="right-down" width="{side}" height="{side}" '
+            f'tilewidth="32" tileheight="32" infinite="0" '
+            f'nextlayerid="{layers + 1}" nextobjectid="1">\n'
+        )
+        for layer_id in range(1, layers + 1):
+            map_file.write(
+                f' <layer id="{layer_id}" name="Layer {layer_id}" '
+                f'width="{side}" height="{side}">\n'
+                f'  <data encoding="base64">\n{layer_data}\n  </data>\n'
+                " </layer>\n"
+            )
+        map_file.write("</map>\n")
+
+
+def measure(path: Path, mode: str) -> dict:
+    """Parse the map in this process, and report the memory used."""
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    data = path.read_bytes()
+    context = ParseContext()
+    if mode == "tree":
+        parsed = tiled_map.parse(path, "utf-8", parse_xml(data, "utf-8"), context)
+    else:
+        parsed = tiled_map.parse_stream(path, "utf-8", data, context)
+
+    elapsed = time.perf_counter() - start
+    del data
+    gc.collect()
+    model, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "mode": mode,
+        "layers": len(parsed.layers),
+        "seconds": elapsed,
+        "peak_traced": peak,
+        "model": model,
+    }
+    if resource is not None:
+        # Kilobytes on Linux, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        result["peak_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=100)
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--map", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        print(json.dumps(measure(args.map, args.measure)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "map.tmx"
+        write_map(path, args.megabytes)
+        size = path.stat().st_size
+        print(f"map file: {size / 2**20:.1f} MiB")
+
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--measure", mode, "--map", str(path)],
+                check=True,
+                stdout=subprocess.PIPE,
+            ).stdout
+            result = json.loads(output)
+            line = (
+                f"{mode:>6}: {result['seconds']:.1f}s, "
+                f"model {result['model'] / 2**20:.1f} MiB, "
+                f"peak traced {result['peak_traced'] / 2**20:.1f} MiB "
+                f"({result['peak_traced'] / result['model']:.2f}x model)"
+            )
+            if "peak_rss" in result:
+                line += f", peak RSS {result['peak_rss'] / 2**20:.1f} MiB"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
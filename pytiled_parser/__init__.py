@@ -11,10 +11,20 @@ PyTiled Parser is not tied to any particular graphics library or game engine.
 
 # pylint: disable=too-few-public-methods
 
+from .async_parser import parse_map_async, parse_tileset_async, parse_world_async
 from .common_types import Color, OrderedPair, Size
 from .exception import UnknownFormat
 from .layer import Chunk, ImageLayer, Layer, LayerGroup, ObjectLayer, TileLayer
-from .parser import parse_map, parse_world, parse_tileset
+from .layer_filter import LayerFilter, LayerInfo
+from .parser import (
+    load_world_maps,
+    parse_map,
+    parse_map_data,
+    parse_tileset,
+    parse_tileset_data,
+    parse_world,
+    parse_world_data,
+)
 from .properties import Properties, Property
 from .tiled_map import TiledMap
 from .tileset import Frame, Grid, Tile, Tileset, Transformations
@@ -31,9 +41,18 @@ __all__ = [
     "LayerGroup",
     "ObjectLayer",
     "TileLayer",
+    "LayerFilter",
+    "LayerInfo",
+    "load_world_maps",
     "parse_map",
+    "parse_map_data",
     "parse_world",
+    "parse_world_data",
     "parse_tileset",
+    "parse_tileset_data",
+    "parse_map_async",
+    "parse_tileset_async",
+    "parse_world_async",
     "Properties",
     "Property",
     "TiledMap",
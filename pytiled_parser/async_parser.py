@@ -0,0 +1,188 @@
+"""Asynchronous versions of the parse functions, for use within an asyncio event loop.
+
+Reading files and parsing them both block, so each of these functions reads the file
+and parses it within an executor, leaving the event loop free to run other tasks.
+By default the event loop's default thread pool is used.
+
+The tileset and template caches coalesce loads of the same file from multiple
+threads, so maps which share tilesets can be loaded concurrently with each shared
+file only being read and parsed once, when `cache_tilesets` is set:
+
+    level_one, level_two = await asyncio.gather(
+        parse_map_async(Path("level_one.tmx"), cache_tilesets=True),
+        parse_map_async(Path("level_two.tmx"), cache_tilesets=True),
+    )
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from pytiled_parser.backends import JSONBackendLike, XMLBackendLike
+from pytiled_parser.context import ParseContext
+from pytiled_parser.interning import Interner
+from pytiled_parser.layer_filter import LayerFilterLike
+from pytiled_parser.parser import _parse_map, _parse_tileset
+from pytiled_parser.property_types import PropertyTypes
+from pytiled_parser.resolver import ResolverLike
+from pytiled_parser.snapshot import load_cached_map
+from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.tileset import Tileset
+from pytiled_parser.world import World
+from pytiled_parser.world import parse_world as _parse_world
+
+
+async def parse_map_async(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    cache_dir: Optional[Path] = None,
+    executor: Optional[Executor] = None,
+    metadata_only: bool = False,
+    layer_filter: Optional[LayerFilterLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    interner: Optional[Interner] = None,
+    property_types: Optional[PropertyTypes] = None,
+    resolve_objects: bool = False,
+    cache_tilesets: bool = False,
+) -> TiledMap:
+    """Parse the raw Tiled map into a pytiled_parser type without blocking.
+
+    Args:
+        file: Path to the map file
+        encoding: The character encoding set to use when opening the file
+        resolver: Reads the map and every file it references. Defaults to reading
+            from the filesystem.
+        cache_dir: Optional directory to cache snapshots of parsed maps in, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        executor: The executor to read and parse the files in. Defaults to the
+            default executor of the event loop.
+        metadata_only: Only parse the skeleton of each layer, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        layer_filter: Selects which layers to parse, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        json_backend: The backend to decode JSON files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: The backend to decode XML files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        interner: Shares equal values within the map, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        resolve_objects: Give `object` properties as references to the objects
+            of the map, see [parse_map][pytiled_parser.parser.parse_map].
+        cache_tilesets: Share external tilesets with earlier maps, see
+            [parse_map][pytiled_parser.parser.parse_map].
+
+    Returns:
+        TiledMap: A parsed and typed TiledMap
+    """
+    loop = asyncio.get_running_loop()
+    context = ParseContext(
+        resolver=resolver,
+        metadata_only=metadata_only,
+        layer_filter=layer_filter,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        interner=interner,
+        property_types=property_types,
+        resolve_objects=resolve_objects,
+        cache_tilesets=cache_tilesets,
+    )
+
+    if cache_dir is not None:
+        return await loop.run_in_executor(
+            executor,
+            partial(load_cached_map, file, encoding, context, cache_dir, _parse_map),
+        )
+
+    data = await loop.run_in_executor(executor, context.resolver.read, file)
+    return await loop.run_in_executor(
+        executor, _parse_map, data, file, encoding, context
+    )
+
+
+async def parse_tileset_async(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    executor: Optional[Executor] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    property_types: Optional[PropertyTypes] = None,
+) -> Tileset:
+    """Parse the raw Tiled Tileset into a pytiled_parser type without blocking.
+
+    Args:
+        file: Path to the tileset file
+        encoding: The character encoding set to use when opening the file
+        resolver: Reads the tileset and every file it references. Defaults to
+            reading from the filesystem.
+        executor: The executor to read and parse the files in. Defaults to the
+            default executor of the event loop.
+        json_backend: The backend to decode JSON files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: The backend to decode XML files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
+
+    Returns:
+        Tileset: A parsed and typed Tileset
+    """
+    loop = asyncio.get_running_loop()
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        property_types=property_types,
+    )
+
+    data = await loop.run_in_executor(executor, context.resolver.read, file)
+    return await loop.run_in_executor(
+        executor, _parse_tileset, data, file, encoding, context
+    )
+
+
+async def parse_world_async(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    executor: Optional[Executor] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    cache_listing: bool = False,
+) -> World:
+    """Parse the raw world file into a pytiled_parser type without blocking.
+
+    Args:
+        file: Path to the world file
+        encoding: The character encoding set to use when opening the file
+        resolver: Reads the world file and lists the directory for pattern matched
+            maps. Defaults to the filesystem.
+        executor: The executor to read and parse the files in. Defaults to the
+            default executor of the event loop.
+        json_backend: The backend to decode the world file with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: Unused, accepted for consistency with the other parse
+            functions.
+        cache_listing: Reuse the listing of the directory searched by patterns,
+            see [parse_world][pytiled_parser.parser.parse_world].
+
+    Returns:
+        World: A parsed and typed World
+    """
+    loop = asyncio.get_running_loop()
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        cache_listing=cache_listing,
+    )
+
+    return await loop.run_in_executor(
+        executor, partial(_parse_world, file, encoding, context=context)
+    )
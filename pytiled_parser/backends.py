@@ -0,0 +1,438 @@
+"""Backends decode the raw contents of JSON and XML files.
+
+By default the standard library's json and ElementTree modules are used. The faster
+orjson and lxml libraries are optional, and are only used when they are chosen. Every
+backend produces the same parsed maps.
+
+A backend can be chosen for a single call with the `json_backend` and `xml_backend`
+arguments of the parse functions, or for every call with
+[set_json_backend][pytiled_parser.backends.set_json_backend] and
+[set_xml_backend][pytiled_parser.backends.set_xml_backend]:
+
+    set_json_backend("json")
+    tiled_map = parse_map(Path("level_01.tmx"), xml_backend="etree")
+
+Backends are given by the names in `JSON_BACKENDS` and `XML_BACKENDS`, or as instances
+of [JSONBackend][pytiled_parser.backends.JSONBackend] and
+[XMLBackend][pytiled_parser.backends.XMLBackend].
+"""
+
+import codecs
+import importlib.util
+import io
+import json
+import re
+import xml.etree.ElementTree as etree
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+# The optional backends are imported only if they are installed. The tests which use
+# them are skipped when they are not.
+if importlib.util.find_spec("orjson"):
+    import orjson
+else:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+if importlib.util.find_spec("lxml"):  # pragma: no cover
+    from lxml import etree as lxml_etree
+else:
+    lxml_etree = None
+
+if importlib.util.find_spec("ijson"):  # pragma: no cover
+    import ijson
+else:
+    ijson = None
+
+# Size of the pieces documents are fed to incremental parsers in.
+_CHUNK_SIZE = 64 * 1024
+
+# Matches the whitespace allowed between JSON tokens
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+class JSONBackend:
+    """Decodes JSON documents with the standard library's json module.
+
+    Subclasses implement `loads`, and may implement `iterparse` if they can decode
+    documents incrementally.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes, encoding: str) -> Any:
+        """Decode a whole JSON document.
+
+        Args:
+            data: The raw contents of the file.
+            encoding: The character encoding set to decode the contents with.
+
+        Returns:
+            The decoded JSON document.
+
+        Raises:
+            ValueError: If the contents are not valid JSON.
+        """
+        return json.loads(data.decode(encoding))
+
+    def iterparse(
+        self, data: bytes, encoding: str, stream_key: str
+    ) -> Iterator[Tuple[str, Any]]:
+        """Decode a JSON object incrementally, yielding its members one at a time.
+
+        Each member of the object is yielded as a (key, value) pair, except for the
+        array under `stream_key`, whose items are each yielded as a (stream_key, item)
+        pair as soon as they have been decoded. So only one item needs to be held at
+        once, if each is released before the next is requested.
+
+        If ijson is installed it is used to read the contents without decoding them
+        as a whole, otherwise the contents are decoded to a string and each value is
+        decoded from that in turn.
+
+        Args:
+            data: The raw contents of the file.
+            encoding: The character encoding set to decode the contents with.
+            stream_key: The key of the array whose items are yielded individually.
+
+        Yields:
+            Tuple[str, Any]: The key and decoded value of each member, or item.
+
+        Raises:
+            ValueError: If the contents are not a valid JSON object.
+        """
+        if ijson is not None:
+            return _iterparse_json_ijson(data, encoding, stream_key)
+        return _iterparse_json_text(data.decode(encoding), stream_key)
+
+
+class OrjsonBackend(JSONBackend):
+    """Decodes JSON documents with orjson.
+
+    orjson has no incremental decoder, so `iterparse` decodes the whole document at
+    once, and then releases the items of the streamed array as they are consumed.
+    This is much faster than the json module, at the cost of holding the decoded
+    data of every layer of a map at the start of parsing it.
+    """
+
+    name = "orjson"
+
+    def loads(self, data: bytes, encoding: str) -> Any:
+        if _is_utf8(encoding):
+            return orjson.loads(data)
+        return orjson.loads(data.decode(encoding))  # pragma: no cover
+
+    def iterparse(
+        self, data: bytes, encoding: str, stream_key: str
+    ) -> Iterator[Tuple[str, Any]]:
+        document = self.loads(data, encoding)
+        if not isinstance(document, dict):
+            raise json.JSONDecodeError("Expecting a JSON object", "", 0)
+
+        for key, value in document.items():
+            if key != stream_key or not isinstance(value, list):
+                yield key, value
+                continue
+            # Items are yielded from the end of a reversed list so that each can be
+            # released as soon as it has been consumed
+            value.reverse()
+            while value:
+                yield key, value.pop()
+
+
+class XMLBackend:
+    """Decodes XML documents with the standard library's ElementTree.
+
+    Subclasses implement both `fromstring` and `iterparse`. The elements produced
+    must support the ElementTree API.
+    """
+
+    name = "etree"
+
+    def fromstring(self, data: bytes, encoding: str) -> etree.Element:
+        """Decode a whole XML document.
+
+        Args:
+            data: The raw contents of the file.
+            encoding: The character encoding set to decode the contents with.
+
+        Returns:
+            etree.Element: The root element.
+        """
+        return etree.fromstring(data.decode(encoding))
+
+    def iterparse(
+        self, data: bytes, encoding: str
+    ) -> Iterator[Tuple[str, etree.Element]]:
+        """Decode an XML document incrementally, yielding each element as it is read.
+
+        The contents are decoded and parsed in small pieces, so the document is never
+        held in memory as a whole string. The tree is built as usual, so elements
+        which are no longer needed should be removed from their parent once they
+        have ended.
+
+        Args:
+            data: The raw contents of the file.
+            encoding: The character encoding set to decode the contents with.
+
+        Yields:
+            Tuple[str, etree.Element]: A "start" event for each element once its
+                attributes have been read, and an "end" event once its children have.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        parser: "etree.XMLPullParser[etree.Element]" = etree.XMLPullParser(
+            events=("start", "end")
+        )
+        # Only start and end events are requested, so each event holds an element.
+        events = cast(
+            Callable[[], Iterator[Tuple[str, etree.Element]]], parser.read_events
+        )
+        for start in range(0, len(data), _CHUNK_SIZE):
+            parser.feed(decoder.decode(data[start : start + _CHUNK_SIZE]))
+            yield from events()
+
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        yield from events()
+
+
+class LxmlBackend(XMLBackend):
+    """Decodes XML documents with lxml.
+
+    The raw bytes are given to lxml along with the encoding, so the contents are
+    never decoded to a string.
+    """
+
+    name = "lxml"
+
+    def fromstring(self, data: bytes, encoding: str) -> etree.Element:
+        parser = lxml_etree.XMLParser(encoding=encoding, huge_tree=True)
+        return lxml_etree.fromstring(data, parser)
+
+    def iterparse(
+        self, data: bytes, encoding: str
+    ) -> Iterator[Tuple[str, etree.Element]]:
+        parser = lxml_etree.XMLPullParser(
+            events=("start", "end"), encoding=encoding, huge_tree=True
+        )
+        for start in range(0, len(data), _CHUNK_SIZE):
+            parser.feed(data[start : start + _CHUNK_SIZE])
+            yield from parser.read_events()
+
+        parser.close()
+        yield from parser.read_events()
+
+
+def _iterparse_json_text(text: str, stream_key: str) -> Iterator[Tuple[str, Any]]:
+    decoder = json.JSONDecoder()
+
+    def skip(index: int) -> int:
+        return _JSON_WHITESPACE.match(text, index).end()  # type: ignore
+
+    def expect(index: int, characters: str) -> Tuple[str, int]:
+        index = skip(index)
+        if not text.startswith(tuple(characters), index):
+            raise json.JSONDecodeError(f"Expecting one of {characters!r}", text, index)
+        return text[index], index + 1
+
+    def start(index: int, opening: str, closing: str) -> Tuple[str, int]:
+        # Returns the closing character if the object or array is empty
+        _, index = expect(index, opening)
+        if text.startswith(closing, skip(index)):
+            return closing, skip(index) + 1
+        return ",", index
+
+    separator, index = start(0, "{", "}")
+    while separator == ",":
+        key, index = decoder.raw_decode(text, skip(index))
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", text, index)
+        _, index = expect(index, ":")
+        index = skip(index)
+
+        if key == stream_key and text.startswith("[", index):
+            item_separator, index = start(index, "[", "]")
+            while item_separator == ",":
+                item, index = decoder.raw_decode(text, skip(index))
+                yield key, item
+                # Release the item before the next one is decoded
+                del item
+                item_separator, index = expect(index, ",]")
+        else:
+            value, index = decoder.raw_decode(text, index)
+            yield key, value
+            del value
+
+        separator, index = expect(index, ",}")
+
+    if skip(index) != len(text):
+        raise json.JSONDecodeError("Extra data", text, skip(index))
+
+
+def _iterparse_json_ijson(
+    data: bytes, encoding: str, stream_key: str
+) -> Iterator[Tuple[str, Any]]:
+    if not _is_utf8(encoding):
+        data = data.decode(encoding).encode("utf-8")
+
+    key = None
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(io.BytesIO(data), use_float=True):
+        if builder is None:
+            if prefix == "":
+                # The start and end of the document, and each of its keys
+                if event == "map_key":
+                    key = value
+                elif event not in ("start_map", "end_map"):
+                    raise json.JSONDecodeError("Expecting a JSON object", "", 0)
+                continue
+            if prefix == stream_key and event in ("start_array", "end_array"):
+                continue
+            builder = ijson.ObjectBuilder()
+
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+
+        if depth == 0:
+            yield key, builder.value  # type: ignore
+            builder = None
+
+
+# Every JSON backend by name, fastest first.
+JSON_BACKENDS: Dict[str, Type[JSONBackend]] = {
+    "orjson": OrjsonBackend,
+    "json": JSONBackend,
+}
+
+# Every XML backend by name, fastest first.
+XML_BACKENDS: Dict[str, Type[XMLBackend]] = {
+    "lxml": LxmlBackend,
+    "etree": XMLBackend,
+}
+
+# The module each optional backend needs, which is None if it is not installed
+_REQUIRES = {"orjson": orjson, "lxml": lxml_etree}
+
+JSONBackendLike = Union[str, JSONBackend]
+XMLBackendLike = Union[str, XMLBackend]
+
+_json_backend: Optional[JSONBackend] = None
+_xml_backend: Optional[XMLBackend] = None
+
+
+def _is_available(name: str) -> bool:
+    return name not in _REQUIRES or _REQUIRES[name] is not None
+
+
+def available_json_backends() -> List[str]:
+    """Get the names of the JSON backends which are installed.
+
+    Returns:
+        List[str]: The names, fastest first.
+    """
+    return [name for name in JSON_BACKENDS if _is_available(name)]
+
+
+def available_xml_backends() -> List[str]:
+    """Get the names of the XML backends which are installed.
+
+    Returns:
+        List[str]: The names, fastest first.
+    """
+    return [name for name in XML_BACKENDS if _is_available(name)]
+
+
+def _create(backends: Dict[str, Type[Any]], name: str) -> Any:
+    if name not in backends:
+        raise ValueError(
+            f"Unknown backend {name!r}, expected one of {', '.join(backends)}"
+        )
+    if not _is_available(name):
+        raise ValueError(f"The {name} backend requires {name} to be installed")
+    return backends[name]()
+
+
+def get_json_backend(backend: Optional[JSONBackendLike] = None) -> JSONBackend:
+    """Convert any of the accepted JSON backend arguments into a JSONBackend.
+
+    Args:
+        backend: A backend, the name of one, or None for the global default.
+
+    Returns:
+        JSONBackend: The backend to use.
+
+    Raises:
+        ValueError: If the named backend is unknown or not installed.
+    """
+    global _json_backend
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is not None:
+        return _create(JSON_BACKENDS, backend)
+    if _json_backend is None:
+        _json_backend = JSONBackend()
+    return _json_backend
+
+
+def get_xml_backend(backend: Optional[XMLBackendLike] = None) -> XMLBackend:
+    """Convert any of the accepted XML backend arguments into an XMLBackend.
+
+    Args:
+        backend: A backend, the name of one, or None for the global default.
+
+    Returns:
+        XMLBackend: The backend to use.
+
+    Raises:
+        ValueError: If the named backend is unknown or not installed.
+    """
+    global _xml_backend
+    if isinstance(backend, XMLBackend):
+        return backend
+    if backend is not None:
+        return _create(XML_BACKENDS, backend)
+    if _xml_backend is None:
+        _xml_backend = XMLBackend()
+    return _xml_backend
+
+
+def set_json_backend(backend: Optional[JSONBackendLike] = None) -> None:
+    """Set the JSON backend used when none is given to a parse function.
+
+    Args:
+        backend: A backend, the name of one, or None to use the standard library.
+
+    Raises:
+        ValueError: If the named backend is unknown or not installed.
+    """
+    global _json_backend
+    _json_backend = None if backend is None else get_json_backend(backend)
+
+
+def set_xml_backend(backend: Optional[XMLBackendLike] = None) -> None:
+    """Set the XML backend used when none is given to a parse function.
+
+    Args:
+        backend: A backend, the name of one, or None to use the standard library.
+
+    Raises:
+        ValueError: If the named backend is unknown or not installed.
+    """
+    global _xml_backend
+    _xml_backend = None if backend is None else get_xml_backend(backend)
@@ -0,0 +1,307 @@
+"""Asset bundles which allow loading maps and everything they reference from one file.
+
+Two bundle formats are supported:
+
+- Zip files, which can be created with any zip tool. Entries may be stored or
+  compressed.
+- Pack files, a minimal indexed format created with
+  [write_pack][pytiled_parser.bundle.write_pack]. Every file is stored uncompressed
+  and is read with a single slice of the memory-mapped archive.
+
+In both cases the archive is memory-mapped, so loading a file from a bundle is a
+matter of a few seeks instead of opening a file. Bundles are resolvers, so paths are
+relative to the root of the archive, and the `source` and `template` references
+within a map are resolved inside the bundle:
+
+    with open_bundle(Path("levels.zip")) as bundle:
+        level = bundle.parse_map("maps/level_01.tmx")
+"""
+
+import mmap
+import os
+import posixpath
+import struct
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple, Union
+
+from pytiled_parser.parser import parse_map, parse_tileset, parse_world
+from pytiled_parser.resolver import FileStamp, Resolver
+from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.tileset import Tileset
+from pytiled_parser.world import World
+
+PACK_MAGIC = b"PTPACK01"
+
+# Little endian: magic, number of entries
+_PACK_HEADER = struct.Struct("<8sI")
+# Little endian: length of the name, followed by the name itself, then offset, size
+_PACK_NAME_LENGTH = struct.Struct("<H")
+_PACK_ENTRY = struct.Struct("<QQ")
+
+
+# Little endian: the fields of a zip local file header which precede the file name
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+class _MappedFile:
+    """A minimal file object over a memory map, as `zipfile` requires `seekable`."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mmap = mapped
+        self.read = mapped.read
+        self.seek = mapped.seek
+        self.tell = mapped.tell
+
+    def seekable(self) -> bool:
+        return True
+
+
+def _normalize(path: Union[str, Path]) -> str:
+    name = posixpath.normpath(PurePosixPath(Path(path)).as_posix())
+    return "" if name == "." else name
+
+
+class Bundle(Resolver):
+    """Base class for memory-mapped bundles.
+
+    Args:
+        file: Path to the archive.
+    """
+
+    def __init__(self, file: Path):
+        self.file = Path(file)
+
+        with open(self.file, "rb") as archive:
+            stat = os.fstat(archive.fileno())
+            self._version = (stat.st_mtime_ns, stat.st_size)
+            self._mmap = mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._key = os.path.realpath(self.file)
+
+    def __enter__(self) -> "Bundle":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the memory map of the archive."""
+        self._mmap.close()
+
+    def names(self) -> List[str]:
+        """List the path of every file within the bundle.
+
+        Returns:
+            List[str]: The paths, relative to the root of the bundle.
+        """
+        raise NotImplementedError
+
+    def _size(self, name: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def list_dir(self, path: Path) -> List[str]:
+        directory = _normalize(path)
+        return [
+            posixpath.basename(name)
+            for name in self.names()
+            if posixpath.dirname(name) == directory
+        ]
+
+    def key(self, path: Path) -> Optional[Hashable]:
+        return (self._key, _normalize(path))
+
+    def stamp(self, path: Path) -> Optional[FileStamp]:
+        name = _normalize(path)
+        size = self._size(name)
+        if size is None:
+            return None
+        return FileStamp((self._key, name), self._version, size)
+
+    def parse_map(
+        self,
+        path: Union[str, Path],
+        encoding: str = "utf-8",
+        cache_tilesets: bool = False,
+    ) -> TiledMap:
+        """Parse a map from the bundle.
+
+        Args:
+            path: Path to the map within the bundle.
+            encoding: The character encoding set to use when decoding files.
+            cache_tilesets: Share external tilesets with earlier maps, see
+                [parse_map][pytiled_parser.parser.parse_map].
+
+        Returns:
+            TiledMap: A parsed and typed TiledMap
+        """
+        return parse_map(
+            Path(path), encoding, resolver=self, cache_tilesets=cache_tilesets
+        )
+
+    def parse_tileset(self, path: Union[str, Path], encoding: str = "utf-8") -> Tileset:
+        """Parse a tileset from the bundle.
+
+        Args:
+            path: Path to the tileset within the bundle.
+            encoding: The character encoding set to use when decoding files.
+
+        Returns:
+            Tileset: A parsed and typed Tileset
+        """
+        return parse_tileset(Path(path), encoding, resolver=self)
+
+    def parse_world(self, path: Union[str, Path], encoding: str = "utf-8") -> World:
+        """Parse a world from the bundle.
+
+        Args:
+            path: Path to the world within the bundle.
+            encoding: The character encoding set to use when decoding files.
+
+        Returns:
+            World: A parsed and typed World
+        """
+        return parse_world(Path(path), encoding, resolver=self)
+
+
+class ZipBundle(Bundle):
+    """A bundle backed by a zip file.
+
+    Args:
+        file: Path to the zip file.
+    """
+
+    def __init__(self, file: Path):
+        super().__init__(file)
+        self._zip = zipfile.ZipFile(_MappedFile(self._mmap))  # type: ignore
+        self._entries = {
+            _normalize(info.filename): info
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        }
+
+    def close(self) -> None:
+        self._zip.close()
+        super().close()
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def _size(self, name: str) -> Optional[int]:
+        info = self._entries.get(name)
+        if info is None:
+            return None
+        return info.file_size
+
+    def read(self, path: Path) -> bytes:
+        info = self._entries.get(_normalize(path))
+        if info is None:
+            raise FileNotFoundError(f"No such file in {self.file}: '{path}'")
+
+        if info.compress_type != zipfile.ZIP_STORED:
+            return self._zip.read(info)
+
+        # Stored files are sliced straight out of the archive, the offset of the data
+        # depends on the length of the name and extra field in the local header.
+        header = _ZIP_LOCAL_HEADER.unpack_from(self._mmap, info.header_offset)
+        offset = info.header_offset + _ZIP_LOCAL_HEADER.size + header[-2] + header[-1]
+        return self._mmap[offset : offset + info.file_size]
+
+
+class PackBundle(Bundle):
+    """A bundle backed by a pack file created with `write_pack`.
+
+    Args:
+        file: Path to the pack file.
+
+    Raises:
+        ValueError: If the file is not a pack file.
+    """
+
+    def __init__(self, file: Path):
+        super().__init__(file)
+
+        magic, count = _PACK_HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"{file} is not a pytiled-parser pack file")
+
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        position = _PACK_HEADER.size
+        for _ in range(count):
+            (name_length,) = _PACK_NAME_LENGTH.unpack_from(self._mmap, position)
+            position += _PACK_NAME_LENGTH.size
+            name = self._mmap[position : position + name_length].decode("utf-8")
+            position += name_length
+            self._entries[name] = _PACK_ENTRY.unpack_from(self._mmap, position)
+            position += _PACK_ENTRY.size
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def _size(self, name: str) -> Optional[int]:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        return entry[1]
+
+    def read(self, path: Path) -> bytes:
+        entry = self._entries.get(_normalize(path))
+        if entry is None:
+            raise FileNotFoundError(f"No such file in {self.file}: '{path}'")
+        offset, size = entry
+        return self._mmap[offset : offset + size]
+
+
+def write_pack(
+    output: Path, files: Union[Path, Mapping[Union[str, Path], bytes]]
+) -> None:
+    """Write a pack file which can be loaded with `PackBundle`.
+
+    Args:
+        output: Path to write the pack file to.
+        files: Either a directory, in which case every file beneath it is packed
+            relative to it, or a mapping of paths to the contents of each file.
+    """
+    if isinstance(files, Mapping):
+        contents = {_normalize(name): data for name, data in files.items()}
+    else:
+        contents = {}
+        for root, _, names in os.walk(files):
+            for name in names:
+                path = Path(root) / name
+                contents[_normalize(path.relative_to(files))] = path.read_bytes()
+
+    encoded_names = [name.encode("utf-8") for name in contents]
+    index_size = sum(
+        _PACK_NAME_LENGTH.size + len(encoded_name) + _PACK_ENTRY.size
+        for encoded_name in encoded_names
+    )
+
+    offset = _PACK_HEADER.size + index_size
+    with open(output, "wb") as pack:
+        pack.write(_PACK_HEADER.pack(PACK_MAGIC, len(contents)))
+        for encoded_name, data in zip(encoded_names, contents.values()):
+            pack.write(_PACK_NAME_LENGTH.pack(len(encoded_name)))
+            pack.write(encoded_name)
+            pack.write(_PACK_ENTRY.pack(offset, len(data)))
+            offset += len(data)
+        for data in contents.values():
+            pack.write(data)
+
+
+def open_bundle(file: Path) -> Bundle:
+    """Open a zip or pack file as a bundle.
+
+    Args:
+        file: Path to the archive.
+
+    Returns:
+        Bundle: A ZipBundle or PackBundle depending on the type of the archive.
+    """
+    with open(file, "rb") as archive:
+        magic = archive.read(len(PACK_MAGIC))
+
+    if magic == PACK_MAGIC:
+        return PackBundle(file)
+    return ZipBundle(file)
@@ -0,0 +1,269 @@
+"""Process-wide caches for files which are shared between maps.
+
+Maps within a project will very often reference the same external tilesets and
+object templates. Rather than re-reading and re-parsing those files for every map
+that uses them, the loaders within pytiled-parser consult the caches in this module.
+
+Entries are keyed by the resolved path of the file, and are validated against the
+file's modification time and size on every lookup, so an edited file will always be
+re-parsed. The caches are bounded both by a number of entries and by an approximate
+memory budget, the least recently used entries are evicted first once either limit
+is exceeded.
+
+The budget is measured in bytes of the source files, which is used as a cheap proxy
+for the size of the parsed result. Setting either limit to 0 disables a cache.
+
+Files read through a [Resolver][pytiled_parser.resolver.Resolver] other than the
+filesystem are identified and validated by the stamp the resolver provides for them.
+Files from resolvers which can't provide a stamp are never cached.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from pytiled_parser.resolver import FileStamp, Resolver, default_resolver
+
+T = TypeVar("T")
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class _Entry(NamedTuple):
+    version: Hashable
+    size: int
+    value: Any
+
+
+class _Pending:
+    """A load which is in progress, which other threads can wait for."""
+
+    def __init__(self, stamp: FileStamp):
+        self.stamp = stamp
+        self.thread = threading.get_ident()
+        self.done = threading.Event()
+        self.value: Any = None
+        self.failed = False
+
+
+class FileCache:
+    """A thread-safe LRU cache of values derived from files on disk.
+
+    Loads of the same file from multiple threads at once are coalesced, so that only
+    the first thread loads the file and the others wait for its result.
+
+    Attributes:
+        max_entries: The maximum number of entries to hold.
+        max_bytes: The approximate memory budget, measured in bytes of source files.
+        hits: The number of lookups which were served from the cache.
+        misses: The number of lookups which had to load the file.
+        coalesced: The number of lookups which waited for a load in another thread.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._pending: Dict[CacheKey, _Pending] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """The approximate number of bytes currently held by the cache."""
+        return self._total_bytes
+
+    def get(
+        self,
+        file: Path,
+        extra: Tuple[Hashable, ...] = (),
+        resolver: Resolver = default_resolver,
+    ) -> Optional[Any]:
+        """Get the cached value for a file if it is still up to date.
+
+        Args:
+            file: Path to the file.
+            extra: Additional values which the cached value depends on, such as the
+                encoding the file was loaded with.
+            resolver: The resolver the file is read through.
+
+        Returns:
+            The cached value, or None if there is no valid entry for the file.
+        """
+        stamp = resolver.stamp(file)
+        if stamp is None:
+            return None
+
+        with self._lock:
+            return self._lookup((stamp.key,) + extra, stamp)
+
+    def _lookup(self, key: CacheKey, stamp: FileStamp) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.version != stamp.version or entry.size != stamp.size:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        file: Path,
+        value: Any,
+        extra: Tuple[Hashable, ...] = (),
+        resolver: Resolver = default_resolver,
+    ) -> None:
+        """Store the value derived from a file.
+
+        Args:
+            file: Path to the file the value was loaded from.
+            value: The value to cache.
+            extra: Additional values which the cached value depends on.
+            resolver: The resolver the file was read through.
+        """
+        stamp = resolver.stamp(file)
+        if stamp is None:
+            return
+
+        self._store((stamp.key,) + extra, stamp, value)
+
+    def _store(self, key: CacheKey, stamp: FileStamp, value: Any) -> None:
+        if stamp.size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(stamp.version, stamp.size, value)
+            self._total_bytes += stamp.size
+            self._evict()
+
+    def get_or_load(
+        self,
+        file: Path,
+        loader: Callable[[], T],
+        extra: Tuple[Hashable, ...] = (),
+        resolver: Resolver = default_resolver,
+    ) -> T:
+        """Get the cached value for a file, calling `loader` to create it on a miss.
+
+        Args:
+            file: Path to the file.
+            loader: Function which loads and returns the value for the file.
+            extra: Additional values which the cached value depends on.
+            resolver: The resolver the file is read through.
+
+        Returns:
+            The cached or newly loaded value.
+        """
+        stamp = resolver.stamp(file)
+        if stamp is None:
+            return loader()
+
+        key = (stamp.key,) + extra
+        with self._lock:
+            value = self._lookup(key, stamp)
+            if value is not None:
+                return value
+
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _Pending(stamp)
+                loading = True
+            else:
+                # A thread waiting on its own load would never finish.
+                loading = False
+                waiting = pending.thread != threading.get_ident()
+
+        if not loading:
+            if waiting:
+                pending.done.wait()
+                if not pending.failed and pending.stamp == stamp:
+                    with self._lock:
+                        self.coalesced += 1
+                    return pending.value
+            return loader()
+
+        try:
+            pending.value = loader()
+            self._store(key, stamp, pending.value)
+        except BaseException:
+            pending.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+
+        return pending.value
+
+    def invalidate(self, file: Path, resolver: Resolver = default_resolver) -> None:
+        """Remove every entry for a file, regardless of the extra key values.
+
+        Args:
+            file: Path to the file.
+            resolver: The resolver the file is read through.
+        """
+        file_key = resolver.key(file)
+        if file_key is None:
+            return
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == file_key]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+
+# External tilesets of maps parsed with `cache_tilesets`, stored with a firstgid of 1.
+# Each map receives a shallow copy with its own firstgid, so the tiles and wang sets
+# are shared between maps.
+tileset_cache = FileCache()
+
+# Object templates and the tilesets they reference, stored as the raw XML Element or
+# JSON dict. These are shared by every object using a template and must not be modified.
+template_cache = FileCache()
+
+# The names of the files within the directories searched by world patterns. Adding or
+# removing a file changes the modification time of its directory, which invalidates
+# the listing. These are shared and must not be modified.
+listing_cache = FileCache()
@@ -0,0 +1,205 @@
+"""The ParseContext holds the options for a single call to one of the parse functions.
+
+It is created by the top level parse functions and handed down through every parser
+alongside the `encoding`, so that options which affect how nested files are loaded
+apply to the whole chain of files. Internal parse functions accept `None` in place of
+a context, in which case the defaults are used.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import attr
+
+from pytiled_parser.backends import (
+    JSONBackend,
+    XMLBackend,
+    get_json_backend,
+    get_xml_backend,
+)
+from pytiled_parser.interning import Interner
+from pytiled_parser.layer_filter import LayerFilter, get_layer_filter
+from pytiled_parser.properties import ObjectReference
+from pytiled_parser.property_types import PropertyTypes
+from pytiled_parser.resolver import Resolver, get_resolver
+
+if TYPE_CHECKING:
+    from pytiled_parser.tiled_object import TiledObject
+
+T = TypeVar("T")
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class ParseContext:
+    """Options shared by every parser during a single parse.
+
+    Attributes:
+        resolver: Reads the files referenced by the map, such as external tilesets
+            and object templates. Defaults to reading from the filesystem.
+        metadata_only: Only parse the skeleton of each layer. Tile layers are left
+            without data or chunks, and object layers without objects.
+        layer_filter: Selects which layers of a map to parse, see
+            [pytiled_parser.layer_filter][]. Defaults to parsing every layer.
+        json_backend: Decodes JSON files, see [pytiled_parser.backends][]. Defaults
+            to the global default backend.
+        xml_backend: Decodes XML files, see [pytiled_parser.backends][]. Defaults
+            to the global default backend.
+        interner: Shares equal values between the layers, objects and tiles that are
+            parsed, see [pytiled_parser.interning][]. Defaults to no interning.
+        property_types: The custom property types of the project, which class
+            properties are filled in with, see [pytiled_parser.property_types][].
+        resolve_objects: Give the `object` properties of a map as
+            [ObjectReference][pytiled_parser.properties.ObjectReference]s, which
+            look up the objects of the map by ID.
+        cache_tilesets: Reuse external tilesets parsed for earlier maps from
+            [tileset_cache][pytiled_parser.cache.tileset_cache], sharing their
+            tiles, wang sets and properties between maps.
+        cache_listing: Reuse the listings of the directories searched by world
+            patterns from [listing_cache][pytiled_parser.cache.listing_cache].
+    """
+
+    resolver: Resolver = attr.ib(default=None, converter=get_resolver)
+    metadata_only: bool = False
+    layer_filter: Optional[LayerFilter] = attr.ib(
+        default=None, converter=get_layer_filter
+    )
+    json_backend: JSONBackend = attr.ib(default=None, converter=get_json_backend)
+    xml_backend: XMLBackend = attr.ib(default=None, converter=get_xml_backend)
+    interner: Optional[Interner] = attr.ib(default=None, repr=False, eq=False)
+    property_types: Optional[PropertyTypes] = None
+    resolve_objects: bool = False
+    cache_tilesets: bool = False
+    cache_listing: bool = False
+
+    # Values loaded with load_once, which are never carried over by attr.evolve
+    _loaded: Dict[Hashable, Any] = attr.ib(
+        factory=dict, init=False, repr=False, eq=False
+    )
+    # The objects of the map parsed so far by ID, when resolve_objects is set
+    _objects: Dict[int, "TiledObject"] = attr.ib(
+        factory=dict, init=False, repr=False, eq=False
+    )
+
+    def cache_key(self) -> Tuple[Hashable, ...]:
+        """Values of the options which change the result of parsing a file.
+
+        These are added to the keys of the process-wide caches, so that a file parsed
+        with different options is cached separately.
+
+        Returns:
+            Tuple[Hashable, ...]: The option values.
+        """
+        return (
+            self.metadata_only,
+            self.layer_filter,
+            self.property_types,
+            self.resolve_objects,
+        )
+
+    def tileset_cache_key(self) -> Tuple[Hashable, ...]:
+        """Values of the options which change the result of parsing a tileset.
+
+        Tilesets and templates are parsed with the context from `for_tiles`, so the
+        options which only apply to map layers are left out, and they are cached
+        once for maps parsed with any of them. The raw tilesets of templates are
+        kept as the values decoded by the backends, so these are included.
+
+        Returns:
+            Tuple[Hashable, ...]: The option values.
+        """
+        return (self.property_types, self.json_backend.name, self.xml_backend.name)
+
+    def load_once(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Get a value which is loaded at most once during this parse.
+
+        Files which a map uses many times, such as object templates, are loaded
+        through this, so that they are only looked up in the process-wide caches
+        once per map rather than once per use.
+
+        Args:
+            key: Identifies the value within this parse.
+            loader: Function which loads and returns the value.
+
+        Returns:
+            The value loaded earlier in this parse, or the newly loaded value.
+        """
+        if key not in self._loaded:
+            self._loaded[key] = loader()
+        return self._loaded[key]
+
+    def intern_attributes(self, value: T) -> T:
+        """Share the attributes of a parsed layer, object or tile, when interning.
+
+        Args:
+            value: The layer, object or tile to share the attributes of.
+
+        Returns:
+            The given value.
+        """
+        if self.interner is None:
+            return value
+        return self.interner.intern_attributes(value)
+
+    def add_objects(self, tiled_objects: Iterable["TiledObject"]) -> None:
+        """Add the objects of an object layer to the index of the map's objects.
+
+        Args:
+            tiled_objects: The objects to add.
+        """
+        if self.resolve_objects:
+            self._objects.update(
+                (tiled_object.id, tiled_object) for tiled_object in tiled_objects
+            )
+
+    def reference_object(self, object_id: int) -> ObjectReference:
+        """Get a reference to an object of the map being parsed.
+
+        The object is looked up when the reference is used, so it may refer to an
+        object which is parsed later on.
+
+        Args:
+            object_id: The ID of the object.
+
+        Returns:
+            ObjectReference: The reference to the object.
+        """
+        return ObjectReference(object_id, self._objects)
+
+    def for_tiles(self) -> "ParseContext":
+        """Get this context without the options which only apply to map layers.
+
+        The collision shapes of tiles are parsed as object layers, but are part of
+        tilesets, so these are always parsed in full. Tilesets and templates are
+        shared between maps, so the `object` properties within them are never
+        resolved against the objects of a map.
+
+        Returns:
+            ParseContext: The context to parse tilesets, templates and the object
+                groups of tiles with.
+        """
+        return attr.evolve(
+            self, metadata_only=False, layer_filter=None, resolve_objects=False
+        )
+
+
+def get_context(context: Optional[ParseContext] = None) -> ParseContext:
+    """Get the given context, or a default one if None was given.
+
+    Args:
+        context: The context to use, if any.
+
+    Returns:
+        ParseContext: The context to use.
+    """
+    if context is None:
+        return ParseContext()
+    return context
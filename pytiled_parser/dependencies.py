@@ -0,0 +1,160 @@
+"""Scanning of the files a map references, without parsing the map.
+
+Asset pipelines often only need to know which tilesets, templates and images a map
+uses. [scan_dependencies][pytiled_parser.dependencies.scan_dependencies] finds these
+by looking only at the `source`, `template` and `image` references of each file, and
+recursing into the tilesets and templates it finds. Layer data is never decoded and
+no pytiled-parser objects are created, so this is much cheaper than `parse_map`.
+
+The references found in each file are cached in `dependency_cache`, so tilesets and
+templates shared by many maps are only scanned once, and scanning the same files
+again is nearly free until they change.
+"""
+
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Set
+
+import attr
+
+from pytiled_parser.cache import FileCache
+from pytiled_parser.resolver import Resolver, ResolverLike, get_resolver
+from pytiled_parser.util import iterparse_xml, parse_json, sniff_format
+
+# The references found directly within each scanned file.
+dependency_cache = FileCache()
+
+# Keys within JSON files which hold layer data, which never contains references.
+_JSON_SKIPPED_KEYS = {"data", "chunks"}
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class Dependencies:
+    """The files referenced by a map, tileset or template, directly or indirectly.
+
+    Every path is normalized, and relative paths stay relative to the same directory
+    as the scanned file's path. Each file is listed once, in the order it was found.
+
+    Attributes:
+        tilesets: External tilesets, including those used by templates.
+        templates: Object templates.
+        images: Images used by tilesets, tiles and image layers.
+    """
+
+    tilesets: List[Path] = attr.Factory(list)
+    templates: List[Path] = attr.Factory(list)
+    images: List[Path] = attr.Factory(list)
+
+
+class _References(NamedTuple):
+    """The references found directly within one file, as written in that file."""
+
+    tilesets: List[str]
+    templates: List[str]
+    images: List[str]
+
+
+def _scan_xml(data: bytes, encoding: str) -> _References:
+    references = _References([], [], [])
+    for event, element in iterparse_xml(data, encoding):
+        if event == "end":
+            # Drop the text of data elements as soon as they are finished
+            element.clear()
+            continue
+
+        if element.tag == "tileset" and element.get("source"):
+            references.tilesets.append(element.attrib["source"])
+        elif element.tag == "image" and element.get("source"):
+            references.images.append(element.attrib["source"])
+        elif element.tag == "object" and element.get("template"):
+            references.templates.append(element.attrib["template"])
+
+    return references
+
+
+def _scan_json(value: Any, references: _References) -> None:
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, (dict, list)):
+                _scan_json(item, references)
+        return
+
+    for key, item in value.items():
+        if key in _JSON_SKIPPED_KEYS:
+            continue
+        if isinstance(item, str):
+            if not item:
+                continue
+            if key == "source":
+                references.tilesets.append(item)
+            elif key == "image":
+                references.images.append(item)
+            elif key == "template":
+                references.templates.append(item)
+        elif isinstance(item, (dict, list)):
+            _scan_json(item, references)
+
+
+def _load_references(file: Path, encoding: str, resolver: Resolver) -> _References:
+    data = resolver.read(file)
+    if sniff_format(data, file, encoding) == "tmx":
+        return _scan_xml(data, encoding)
+
+    references = _References([], [], [])
+    _scan_json(parse_json(data, encoding), references)
+    return references
+
+
+def _resolve(directory: Path, reference: str) -> Path:
+    return Path(os.path.normpath(directory / reference))
+
+
+def _append(paths: List[Path], seen: Set[Path], path: Path) -> bool:
+    if path in seen:
+        return False
+    seen.add(path)
+    paths.append(path)
+    return True
+
+
+def scan_dependencies(
+    file: Path, encoding: str = "utf-8", resolver: Optional[ResolverLike] = None
+) -> Dependencies:
+    """Find the tilesets, templates and images used by a map, tileset or template.
+
+    Args:
+        file: Path to the map, tileset or template file.
+        encoding: The character encoding set to use when opening the files.
+        resolver: Reads the files. Defaults to reading from the filesystem.
+
+    Returns:
+        Dependencies: Every file referenced, directly or through tilesets and
+            templates.
+    """
+    resolver = get_resolver(resolver)
+    dependencies = Dependencies()
+    seen: Set[Path] = set()
+
+    pending = deque([Path(os.path.normpath(file))])
+    while pending:
+        current = pending.popleft()
+        references = dependency_cache.get_or_load(
+            current,
+            lambda: _load_references(current, encoding, resolver),
+            (encoding,),
+            resolver,
+        )
+
+        for reference in references.tilesets:
+            path = _resolve(current.parent, reference)
+            if _append(dependencies.tilesets, seen, path):
+                pending.append(path)
+        for reference in references.templates:
+            path = _resolve(current.parent, reference)
+            if _append(dependencies.templates, seen, path):
+                pending.append(path)
+        for reference in references.images:
+            _append(dependencies.images, seen, _resolve(current.parent, reference))
+
+    return dependencies
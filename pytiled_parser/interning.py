@@ -0,0 +1,159 @@
+"""Interning shares a single instance between equal values across a parsed map.
+
+Large maps repeat the same values many times over, such as the class and size of
+objects, image paths and colors, and whole sets of properties. While parsing, each
+layer, object and tile has these values replaced with an equal instance seen earlier
+in the parse, so that the parsed map holds one instance of each distinct value.
+
+Interning is off by default, and is turned on by passing an
+[Interner][pytiled_parser.interning.Interner] to the parse functions. Passing the
+same one to several parse functions shares values between the maps they parse as
+well.
+
+Since equal property dicts are shared, the `properties` of a layer, object or tile
+of a map parsed with an interner must not be modified in place, as that would
+change the properties of every other one sharing them. Assign a copy of them
+instead.
+"""
+
+from pathlib import PurePath
+from typing import Any, Dict, Hashable, Tuple, TypeVar
+
+import attr
+
+from pytiled_parser.properties import LazyProperties, ObjectReference, Properties
+
+T = TypeVar("T")
+
+# Attributes which are unique to each layer, object or tile, so never shared
+_UNIQUE_ATTRIBUTES = {"id", "coordinates"}
+
+# Names of the attributes which may be shared, by class
+_shared_attributes: Dict[type, Tuple[str, ...]] = {}
+
+
+def _key(value: Any) -> Hashable:
+    """Get the key a value is interned by.
+
+    Values are only shared with values of the same type, including the items of
+    tuples, so that an int is never replaced with an equal float or bool.
+    """
+    if isinstance(value, tuple):
+        return (type(value), tuple(map(type, value)), value)
+    return (type(value), value)
+
+
+def _get_shared_attributes(cls: type) -> Tuple[str, ...]:
+    names = _shared_attributes.get(cls)
+    if names is None:
+        names = _shared_attributes[cls] = tuple(
+            field.name
+            for field in attr.fields(cls)
+            if field.name not in _UNIQUE_ATTRIBUTES
+        )
+    return names
+
+
+class Interner:
+    """Shares a single instance between equal values.
+
+    Values which can not be hashed are never shared, and are returned unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        """The number of distinct values seen."""
+        return len(self._values)
+
+    def intern(self, value: T) -> T:
+        """Get the instance shared by values equal to the given one.
+
+        Args:
+            value: The value to share.
+
+        Returns:
+            The first equal value which was interned, or the given value if it is
+                the first.
+        """
+        try:
+            return self._values.setdefault(_key(value), value)
+        except TypeError:
+            return value
+
+    def intern_properties(self, properties: Properties) -> Properties:
+        """Get the dict shared by properties equal to the given ones.
+
+        The values of the properties are interned as well, other than those of
+        [LazyProperties][pytiled_parser.properties.LazyProperties], which are shared
+        as they are. Properties holding values which can not be hashed, such as
+        class properties, and properties holding references to the objects of a map
+        are not shared.
+
+        Args:
+            properties: The properties to share.
+
+        Returns:
+            Properties: The shared properties.
+        """
+        # Lazy properties are keyed by their raw values, so they are not converted
+        lazy = isinstance(properties, LazyProperties)
+        values = tuple(dict.values(properties))
+        types = tuple(map(type, values))
+        if ObjectReference in types:
+            # References look up the objects of the map they were parsed with
+            return properties
+        key = (type(properties), tuple(properties), types, values)
+        if lazy:
+            key += (properties.convert,)  # type: ignore
+        try:
+            shared = self._values.get(key)
+        except TypeError:
+            return properties
+
+        if shared is None:
+            if not lazy:
+                properties = {
+                    self.intern(name): self.intern(value)
+                    for name, value in properties.items()
+                }
+            shared = self._values[key] = properties
+        return shared
+
+    def intern_attributes(self, value: T) -> T:
+        """Share the attributes of a parsed layer, object or tile with equal ones.
+
+        Strings, floats, tuples such as colors and sizes, paths and properties are
+        replaced in place with their shared instances. IDs and coordinates are left
+        alone, as they are rarely equal.
+
+        Args:
+            value: The layer, object or tile to share the attributes of.
+
+        Returns:
+            The given value.
+        """
+        values = self._values
+        for name in _get_shared_attributes(type(value)):
+            current = getattr(value, name)
+            kind = type(current)
+            if kind is str or kind is float or isinstance(current, PurePath):
+                key: Hashable = (kind, current)
+            elif isinstance(current, tuple):
+                key = (kind, tuple(map(type, current)), current)
+            elif name == "properties" and isinstance(current, dict):
+                shared = self.intern_properties(current)
+                if shared is not current:
+                    setattr(value, name, shared)
+                continue
+            else:
+                continue
+
+            try:
+                shared = values.setdefault(key, current)
+            except TypeError:
+                continue
+            if shared is not current:
+                setattr(value, name, shared)
+        return value
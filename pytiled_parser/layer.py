@@ -19,7 +19,7 @@ from pytiled_parser.properties import Properties
 from pytiled_parser.tiled_object import TiledObject
 
 
-@attr.s(repr=True, str=True, auto_attribs=True, kw_only=True)
+@attr.s(repr=True, str=True, auto_attribs=True, kw_only=True, slots=True)
 class Layer:
     """Base class that all layer types inherit from. Includes common attributes between
     the various types of layers. This class will never be returned directly by the parser.
@@ -72,7 +72,7 @@ class Layer:
 TileLayerGrid = List[List[int]]
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Chunk:
     """Chunk object for infinite maps. Stores `data` like you would have in a normal
     TileLayer but only for the area specified by `coordinates` and `size`.
@@ -101,7 +101,7 @@ class Chunk:
 LayerData = Union[TileLayerGrid, List[Chunk]]
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class TileLayer(Layer):
     """The base type of layer which stores tile data for an area of a map.
 
@@ -121,7 +121,7 @@ class TileLayer(Layer):
     data: Optional[List[List[int]]] = None
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class ObjectLayer(Layer):
     """A Layer type which stores a list of Tiled Objects
 
@@ -145,7 +145,7 @@ class ObjectLayer(Layer):
     draw_order: Optional[str] = "topdown"
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class ImageLayer(Layer):
     """A layer type which stores a single image
 
@@ -164,7 +164,7 @@ class ImageLayer(Layer):
     transparent_color: Optional[Color] = None
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class LayerGroup(Layer):
     """A layer that contains layers (potentially including other LayerGroups, nested infinitely).
 
@@ -0,0 +1,160 @@
+"""Selection of the layers of a map to parse.
+
+A [LayerFilter][pytiled_parser.layer_filter.LayerFilter] is given to `parse_map` to
+leave layers out of the parsed map. Layers are filtered by the name, type and class
+found on the layer itself, before its tile data is decoded or its objects are parsed,
+so layers which are left out cost almost nothing to parse:
+
+    server_map = parse_map(
+        Path("level_01.tmx"),
+        layer_filter=LayerFilter(exclude_classes=["decoration"]),
+    )
+
+The rules of a filter are applied as follows:
+
+- A layer matched by any of the exclude rules is left out, and for a layer group so is
+  everything inside it.
+- When there are include rules or a predicate, a layer is only kept if it matches one
+  of the include rules and the predicate returns True for it. Otherwise every layer
+  which is not excluded is kept.
+- Every layer within a layer group which is kept this way is kept as well, unless it
+  is excluded.
+- A layer group which is not kept itself is still searched, and is kept with only the
+  layers within it that are kept, if there are any.
+"""
+
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple, Type, Union
+
+import attr
+
+from pytiled_parser.layer import ImageLayer, Layer, LayerGroup, ObjectLayer, TileLayer
+
+# The type names used by Tiled for each kind of layer
+_LAYER_TYPES = {
+    TileLayer: "tilelayer",
+    ObjectLayer: "objectgroup",
+    ImageLayer: "imagelayer",
+    LayerGroup: "group",
+}
+
+# The TMX element tag of each type of layer
+TMX_LAYER_TYPES = {
+    "layer": "tilelayer",
+    "objectgroup": "objectgroup",
+    "imagelayer": "imagelayer",
+    "group": "group",
+}
+
+
+class LayerInfo(NamedTuple):
+    """The attributes of a layer that it can be filtered by.
+
+    Attributes:
+        name: The name of the layer.
+        type: The type of the layer as named by Tiled, one of "tilelayer",
+            "objectgroup", "imagelayer" or "group".
+        class_: The class of the layer, an empty string if it has none.
+    """
+
+    name: str
+    type: str
+    class_: str
+
+
+def _to_names(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    if values is None:
+        return ()
+    if isinstance(values, str):
+        values = [values]
+    return tuple(sorted(set(values)))
+
+
+def _to_types(values: Optional[Iterable[Union[str, Type[Layer]]]]) -> Tuple[str, ...]:
+    if values is None:
+        return ()
+    if isinstance(values, (str, type)):
+        values = [values]  # type: ignore
+    return _to_names(
+        _LAYER_TYPES[value] if isinstance(value, type) else value  # type: ignore
+        for value in values  # type: ignore
+    )
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class LayerFilter:
+    """Rules for which layers of a map to parse.
+
+    Every rule is optional, and a filter with no rules keeps every layer. Types may be
+    given either as the type names used by Tiled, or as the layer classes such as
+    `TileLayer`.
+
+    Attributes:
+        predicate: A function which is given the LayerInfo of each layer, and
+            returns whether to keep it.
+        include_names: Only keep layers with one of these names.
+        include_types: Only keep layers of one of these types.
+        include_classes: Only keep layers with one of these classes.
+        exclude_names: Leave out layers with any of these names.
+        exclude_types: Leave out layers of any of these types.
+        exclude_classes: Leave out layers with any of these classes.
+    """
+
+    predicate: Optional[Callable[[LayerInfo], bool]] = None
+    include_names: Tuple[str, ...] = attr.ib(default=(), converter=_to_names)
+    include_types: Tuple[str, ...] = attr.ib(default=(), converter=_to_types)
+    include_classes: Tuple[str, ...] = attr.ib(default=(), converter=_to_names)
+    exclude_names: Tuple[str, ...] = attr.ib(default=(), converter=_to_names)
+    exclude_types: Tuple[str, ...] = attr.ib(default=(), converter=_to_types)
+    exclude_classes: Tuple[str, ...] = attr.ib(default=(), converter=_to_names)
+
+    def excludes(self, info: LayerInfo) -> bool:
+        """Whether a layer is matched by any of the exclude rules.
+
+        Args:
+            info: The attributes of the layer.
+
+        Returns:
+            bool: True if the layer, and everything within it, is left out.
+        """
+        return (
+            info.name in self.exclude_names
+            or info.type in self.exclude_types
+            or info.class_ in self.exclude_classes
+        )
+
+    def selects(self, info: LayerInfo) -> bool:
+        """Whether a layer is matched by the include rules and the predicate.
+
+        Args:
+            info: The attributes of the layer.
+
+        Returns:
+            bool: True if the layer is kept, provided it is not excluded.
+        """
+        if self.include_names or self.include_types or self.include_classes:
+            if not (
+                info.name in self.include_names
+                or info.type in self.include_types
+                or info.class_ in self.include_classes
+            ):
+                return False
+        return self.predicate is None or self.predicate(info)
+
+
+LayerFilterLike = Union[LayerFilter, Callable[[LayerInfo], bool]]
+
+
+def get_layer_filter(
+    layer_filter: Optional[LayerFilterLike] = None,
+) -> Optional[LayerFilter]:
+    """Convert any of the accepted layer filter arguments into a LayerFilter.
+
+    Args:
+        layer_filter: A LayerFilter, a predicate function, or None.
+
+    Returns:
+        Optional[LayerFilter]: The filter, or None if every layer is kept.
+    """
+    if layer_filter is None or isinstance(layer_filter, LayerFilter):
+        return layer_filter
+    return LayerFilter(predicate=layer_filter)
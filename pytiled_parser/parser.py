@@ -1,80 +1,488 @@
 import json
-import xml.etree.ElementTree as etree
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
 
-from pytiled_parser import UnknownFormat
-from pytiled_parser.parsers.json.tiled_map import parse as json_map_parse
+import attr
+
+from pytiled_parser.backends import JSONBackendLike, XMLBackendLike
+from pytiled_parser.context import ParseContext
+from pytiled_parser.exception import UnknownFormat
+from pytiled_parser.interning import Interner
+from pytiled_parser.layer_filter import LayerFilterLike
+from pytiled_parser.parsers.json.tiled_map import parse_stream as json_map_parse_stream
 from pytiled_parser.parsers.json.tileset import parse as json_tileset_parse
-from pytiled_parser.parsers.tmx.tiled_map import parse as tmx_map_parse
+from pytiled_parser.parsers.tmx.tiled_map import parse_stream as tmx_map_parse_stream
 from pytiled_parser.parsers.tmx.tileset import parse as tmx_tileset_parse
+from pytiled_parser.property_types import PropertyTypes
+from pytiled_parser.resolver import ResolverLike
+from pytiled_parser.snapshot import dump_map, load_cached_map, load_map
 from pytiled_parser.tiled_map import TiledMap
 from pytiled_parser.tileset import Tileset
-from pytiled_parser.util import check_format
-from pytiled_parser.world import World
+from pytiled_parser.util import parse_json, parse_xml, sniff_format
+from pytiled_parser.world import World, WorldMap
 from pytiled_parser.world import parse_world as _parse_world
 
+# In-memory sources accepted by the `*_data` parse functions.
+Source = Union[bytes, bytearray, memoryview, str, BinaryIO]
 
-def parse_map(file: Path, encoding: str = "utf-8") -> TiledMap:
-    """Parse the raw Tiled map into a pytiled_parser type
+
+def _read_source(data: Source, encoding: str) -> bytes:
+    """Get the raw bytes of an in-memory source.
 
     Args:
-        file: Path to the map file
-        encoding: The character encoding set to use when opening the file
+        data: The bytes, text or binary file-like object to read.
+        encoding: The character encoding set to encode text with.
 
     Returns:
-        TiledMap: A parsed and typed TiledMap
+        bytes: The raw contents of the source.
     """
-    parser = check_format(file, encoding)
+    if isinstance(data, str):
+        return data.encode(encoding)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    return data.read()
+
 
+def _parse_map(
+    data: bytes, file: Path, encoding: str, context: ParseContext
+) -> TiledMap:
     # The type ignores are because mypy for some reason thinks those functions return Any
-    if parser == "tmx":
-        return tmx_map_parse(file, encoding)  # type: ignore
+    if sniff_format(data, file, encoding) == "tmx":
+        return tmx_map_parse_stream(file, encoding, data, context)  # type: ignore
     else:
         try:
-            return json_map_parse(file, encoding)  # type: ignore
-        except ValueError:
+            return json_map_parse_stream(file, encoding, data, context)  # type: ignore
+        except (json.JSONDecodeError, UnicodeDecodeError):
             raise UnknownFormat(
                 "Unknown Map Format, please use either the TMX or JSON format. "
                 "This message could also mean your map file is invalid or corrupted."
             )
 
 
-def parse_tileset(file: Path, encoding: str = "utf-8") -> Tileset:
+def _parse_tileset(
+    data: bytes, file: Path, encoding: str, context: ParseContext
+) -> Tileset:
+    if sniff_format(data, file, encoding) == "tmx":
+        raw_tileset = parse_xml(data, encoding, context.xml_backend)
+        return tmx_tileset_parse(raw_tileset, 1, encoding, context=context)
+    else:
+        try:
+            raw_tileset = parse_json(data, encoding, context.json_backend)
+        except ValueError:
+            raise UnknownFormat(
+                "Unknowm Tileset Format, please use either the TSX or JSON format. "
+                "This message could also mean your tileset file is invalid or corrupted."
+            )
+        return json_tileset_parse(raw_tileset, 1, encoding, context=context)
+
+
+def parse_map(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    cache_dir: Optional[Path] = None,
+    metadata_only: bool = False,
+    layer_filter: Optional[LayerFilterLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    interner: Optional[Interner] = None,
+    property_types: Optional[PropertyTypes] = None,
+    resolve_objects: bool = False,
+    cache_tilesets: bool = False,
+) -> TiledMap:
+    """Parse the raw Tiled map into a pytiled_parser type
+
+    Args:
+        file: Path to the map file
+        encoding: The character encoding set to use when opening the file
+        resolver: Reads the map and every file it references. This may be a
+            [Resolver][pytiled_parser.resolver.Resolver], or a function which takes
+            a Path and returns the contents of that file as bytes. Defaults to
+            reading from the filesystem.
+        cache_dir: Optional directory to cache snapshots of parsed maps in. If a
+            snapshot of the map is found there, and none of the files the map was
+            parsed from have changed, it is loaded instead of parsing the map. See
+            [pytiled_parser.snapshot][].
+        metadata_only: Only parse the skeleton of each layer, for when only the
+            size, properties, tilesets and layer names of a map are needed. Tile
+            layers are returned without data or chunks, and object layers without
+            objects, which skips decoding tile data and parsing objects entirely.
+        layer_filter: Selects which layers to parse, either a
+            [LayerFilter][pytiled_parser.layer_filter.LayerFilter] or a function
+            which is given the LayerInfo of each layer and returns whether to keep
+            it. Layers which are left out are skipped before their contents are
+            decoded. Maps parsed with a function are never cached in `cache_dir`.
+        json_backend: The backend to decode JSON files with, either a name or a
+            [JSONBackend][pytiled_parser.backends.JSONBackend]. Defaults to the
+            global default, see [pytiled_parser.backends][].
+        xml_backend: The backend to decode XML files with, either a name or an
+            [XMLBackend][pytiled_parser.backends.XMLBackend]. Defaults to the
+            global default, see [pytiled_parser.backends][].
+        interner: Shares equal values between the layers, objects and tiles of the
+            map, see [pytiled_parser.interning][]. Pass the same
+            [Interner][pytiled_parser.interning.Interner] when parsing several maps
+            to share values between them as well. The properties of a map parsed
+            with an interner must not be modified in place. Defaults to no
+            interning.
+        property_types: The custom property types of the Tiled project the map
+            belongs to, see [pytiled_parser.property_types][]. Class properties are
+            given every member of their class, with the defaults filled in, and
+            enum properties are converted to the type they are stored as. Without
+            them, class properties only hold the members which are set.
+        resolve_objects: Give `object` properties as
+            [ObjectReference][pytiled_parser.properties.ObjectReference]s rather
+            than plain IDs. A reference compares equal to the ID of the object, and
+            its `object` looks up the object in an index of the map's objects, which
+            is built while the map is parsed. The properties of tilesets and
+            templates are left as plain IDs, as these are shared between maps.
+        cache_tilesets: Reuse external tilesets which were parsed for earlier maps
+            from [tileset_cache][pytiled_parser.cache.tileset_cache], as long as
+            their files are unchanged. Each map gets its own copy of the tileset
+            with its firstgid, but the tiles, wang sets and properties within it
+            are shared with every other map parsed with this option, and must not
+            be modified. Defaults to parsing the tilesets of each map.
+
+    Returns:
+        TiledMap: A parsed and typed TiledMap
+    """
+    context = ParseContext(
+        resolver=resolver,
+        metadata_only=metadata_only,
+        layer_filter=layer_filter,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        interner=interner,
+        property_types=property_types,
+        resolve_objects=resolve_objects,
+        cache_tilesets=cache_tilesets,
+    )
+    if cache_dir is not None:
+        return load_cached_map(file, encoding, context, cache_dir, _parse_map)
+    return _parse_map(context.resolver.read(file), file, encoding, context)
+
+
+def parse_map_data(
+    data: Source,
+    file: Path = Path(),
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    metadata_only: bool = False,
+    layer_filter: Optional[LayerFilterLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    interner: Optional[Interner] = None,
+    property_types: Optional[PropertyTypes] = None,
+    resolve_objects: bool = False,
+    cache_tilesets: bool = False,
+) -> TiledMap:
+    """Parse a Tiled map from memory into a pytiled_parser type
+
+    Args:
+        data: The contents of the map file, as bytes, str, or a binary file-like object
+        file: The path the map would be at, external tilesets and templates are
+            resolved relative to this. This is also used as the `map_file` of the
+            returned map. Defaults to the current directory.
+        encoding: The character encoding set to use when decoding files
+        resolver: Reads every file referenced by the map. Defaults to reading from
+            the filesystem.
+        metadata_only: Only parse the skeleton of each layer, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        layer_filter: Selects which layers to parse, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        json_backend: The backend to decode JSON files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: The backend to decode XML files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        interner: Shares equal values within the map, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        resolve_objects: Give `object` properties as references to the objects
+            of the map, see [parse_map][pytiled_parser.parser.parse_map].
+        cache_tilesets: Share external tilesets with earlier maps, see
+            [parse_map][pytiled_parser.parser.parse_map].
+
+    Returns:
+        TiledMap: A parsed and typed TiledMap
+    """
+    context = ParseContext(
+        resolver=resolver,
+        metadata_only=metadata_only,
+        layer_filter=layer_filter,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        interner=interner,
+        property_types=property_types,
+        resolve_objects=resolve_objects,
+        cache_tilesets=cache_tilesets,
+    )
+    return _parse_map(_read_source(data, encoding), file, encoding, context)
+
+
+def parse_tileset(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    property_types: Optional[PropertyTypes] = None,
+) -> Tileset:
     """Parse the raw Tiled Tileset into a pytiled_parser type
 
     Args:
         file: Path to the map file
         encoding: The character encoding set to use when opening the file
+        resolver: Reads the tileset and every file it references. Defaults to
+            reading from the filesystem.
+        json_backend: The backend to decode JSON files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: The backend to decode XML files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
 
     Returns:
         Tileset: A parsed and typed Tileset
     """
-    parser = check_format(file, encoding)
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        property_types=property_types,
+    )
+    return _parse_tileset(context.resolver.read(file), file, encoding, context)
 
-    if parser == "tmx":
-        with open(file, encoding=encoding) as map_file:
-            raw_tileset = etree.parse(map_file).getroot()
-        return tmx_tileset_parse(raw_tileset, 1, encoding)
-    else:
-        try:
-            with open(file, encoding=encoding) as my_file:
-                raw_tileset = json.load(my_file)
-            return json_tileset_parse(raw_tileset, 1, encoding)
-        except ValueError:
-            raise UnknownFormat(
-                "Unknowm Tileset Format, please use either the TSX or JSON format. "
-                "This message could also mean your tileset file is invalid or corrupted."
-            )
 
+def parse_tileset_data(
+    data: Source,
+    file: Path = Path(),
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    property_types: Optional[PropertyTypes] = None,
+) -> Tileset:
+    """Parse a Tiled Tileset from memory into a pytiled_parser type
+
+    Args:
+        data: The contents of the tileset file, as bytes, str, or a binary
+            file-like object
+        file: The path the tileset would be at. Defaults to the current directory.
+        encoding: The character encoding set to use when decoding files
+        resolver: Reads every file referenced by the tileset. Defaults to reading
+            from the filesystem.
+        json_backend: The backend to decode JSON files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: The backend to decode XML files with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
+
+    Returns:
+        Tileset: A parsed and typed Tileset
+    """
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        property_types=property_types,
+    )
+    return _parse_tileset(_read_source(data, encoding), file, encoding, context)
 
-def parse_world(file: Path, encoding: str = "utf-8") -> World:
+
+def parse_world(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    cache_listing: bool = False,
+) -> World:
     """Parse the raw world file into a pytiled_parser type
 
     Args:
         file: Path to the world file
         encoding: The character encoding set to use when opening the file
+        resolver: Reads the world file and lists the directory for pattern matched
+            maps. Defaults to the filesystem.
+        json_backend: The backend to decode the world file with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: Unused, accepted for consistency with the other parse
+            functions.
+        cache_listing: Reuse the listing of the directory searched by patterns
+            from [listing_cache][pytiled_parser.cache.listing_cache], for as long
+            as the modification time of the directory is unchanged. Filesystems
+            with coarse modification times may not notice files added shortly
+            after the directory was listed, so this is off by default.
+
+    Returns:
+        World: A parsed and typed World
+    """
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        cache_listing=cache_listing,
+    )
+    return _parse_world(file, encoding, context=context)
+
+
+def parse_world_data(
+    data: Source,
+    file: Path = Path(),
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+    cache_listing: bool = False,
+) -> World:
+    """Parse a world file from memory into a pytiled_parser type
+
+    Args:
+        data: The contents of the world file, as bytes, str, or a binary file-like
+            object
+        file: The path the world would be at, map files are resolved relative to
+            this. Defaults to the current directory.
+        encoding: The character encoding set to use when decoding files
+        resolver: Lists the directory for pattern matched maps. Defaults to the
+            filesystem.
+        json_backend: The backend to decode the world file with, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        xml_backend: Unused, accepted for consistency with the other parse
+            functions.
+        cache_listing: Reuse the listing of the directory searched by patterns,
+            see [parse_world][pytiled_parser.parser.parse_world].
 
     Returns:
         World: A parsed and typed World
     """
-    return _parse_world(file, encoding)
+    context = ParseContext(
+        resolver=resolver,
+        json_backend=json_backend,
+        xml_backend=xml_backend,
+        cache_listing=cache_listing,
+    )
+    raw_world = parse_json(_read_source(data, encoding), encoding, context.json_backend)
+    return _parse_world(file, encoding, raw_world, context=context)
+
+
+def _load_map_snapshot(
+    file: Path,
+    encoding: str,
+    resolver: Optional[ResolverLike],
+    cache_dir: Optional[Path],
+    property_types: Optional[PropertyTypes],
+    cache_tilesets: bool,
+) -> bytes:
+    """Parse a map within a worker process and return it as a snapshot."""
+    return dump_map(
+        parse_map(
+            file,
+            encoding,
+            resolver,
+            cache_dir,
+            property_types=property_types,
+            cache_tilesets=cache_tilesets,
+        )
+    )
+
+
+def _deduplicate_tilesets(tiled_maps: Iterable[TiledMap]) -> None:
+    """Share the contents of equal tilesets between maps.
+
+    Maps parsed in separate processes each have their own copy of every tileset. Equal
+    tilesets are replaced with views of a single tileset, the same as maps parsed
+    within one process with `cache_tilesets` share their external tilesets.
+    """
+    shared: Dict[str, List[Tileset]] = {}
+    for tiled_map in tiled_maps:
+        for firstgid, tileset in tiled_map.tilesets.items():
+            candidates = shared.setdefault(tileset.name, [])
+            normalized = attr.evolve(tileset, firstgid=1)
+            for candidate in candidates:
+                if candidate == normalized:
+                    tiled_map.tilesets[firstgid] = attr.evolve(
+                        candidate, firstgid=firstgid
+                    )
+                    break
+            else:
+                candidates.append(normalized)
+
+
+def load_world_maps(
+    world: World,
+    maps: Optional[Iterable[WorldMap]] = None,
+    workers: Optional[int] = None,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    cache_dir: Optional[Path] = None,
+    property_types: Optional[PropertyTypes] = None,
+    cache_tilesets: bool = False,
+) -> Dict[Path, TiledMap]:
+    """Parse the maps within a world, in parallel across multiple processes.
+
+    Each map is parsed in a worker process and sent back as a snapshot, see
+    [pytiled_parser.snapshot][], so tile data is transferred as raw arrays. With
+    `cache_tilesets`, tilesets which are shared by multiple maps are deduplicated
+    once the maps are returned.
+
+    Args:
+        world: The world to load the maps of.
+        maps: The maps to load, defaults to every map within the world.
+        workers: The number of processes to use, defaults to the number of CPUs.
+            With a single worker, or a single map, the maps are parsed within the
+            current process.
+        encoding: The character encoding set to use when opening the files
+        resolver: Reads the maps and every file they reference. This must be
+            picklable to be sent to the worker processes. Defaults to reading from
+            the filesystem.
+        cache_dir: Optional directory to cache snapshots of parsed maps in, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        property_types: The custom property types of the project, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        cache_tilesets: Share external tilesets between the maps, see
+            [parse_map][pytiled_parser.parser.parse_map].
+
+    Returns:
+        Dict[Path, TiledMap]: The parsed maps, keyed by their `map_file`.
+    """
+    if maps is None:
+        maps = world.maps
+    files = list(dict.fromkeys(world_map.map_file for world_map in maps))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(files))
+
+    if workers <= 1:
+        return {
+            file: parse_map(
+                file,
+                encoding,
+                resolver,
+                cache_dir,
+                property_types=property_types,
+                cache_tilesets=cache_tilesets,
+            )
+            for file in files
+        }
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        snapshots = executor.map(
+            _load_map_snapshot,
+            files,
+            [encoding] * len(files),
+            [resolver] * len(files),
+            [cache_dir] * len(files),
+            [property_types] * len(files),
+            [cache_tilesets] * len(files),
+        )
+        tiled_maps = {
+            file: load_map(snapshot) for file, snapshot in zip(files, snapshots)
+        }
+
+    if cache_tilesets:
+        _deduplicate_tilesets(tiled_maps.values())
+    return tiled_maps
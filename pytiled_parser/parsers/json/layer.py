@@ -6,11 +6,12 @@ import gzip
 import importlib.util
 import zlib
 from pathlib import Path
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
 from typing_extensions import TypedDict
 
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.layer import (
     Chunk,
     ImageLayer,
@@ -19,6 +20,7 @@ from pytiled_parser.layer import (
     ObjectLayer,
     TileLayer,
 )
+from pytiled_parser.layer_filter import LayerInfo
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.parsers.json.tiled_object import RawObject
@@ -200,43 +202,46 @@ def _parse_chunk(
     return chunk
 
 
-def _parse_common(raw_layer: RawLayer) -> Layer:
-    """Create a Layer containing all the attributes common to all layer types.
+def _parse_common(
+    raw_layer: RawLayer, context: Optional[ParseContext] = None
+) -> Dict[str, Any]:
+    """Get the attributes common to all layer types.
 
-    This is to create the stub Layer object that can then be used to create the actual
-        specific sub-classes of Layer.
+    These are returned as keyword arguments, to be passed along with the attributes
+        specific to a type of layer when creating it.
 
     Args:
         raw_layer: Raw layer get common attributes from
+        context: The context of the current parse.
 
     Returns:
-        Layer: The attributes in common of all layer types
+        Dict[str, Any]: The attributes in common of all layer types
     """
-    common = Layer(
-        name=raw_layer["name"],
-        opacity=raw_layer["opacity"],
-        visible=raw_layer["visible"],
-    )
+    common: Dict[str, Any] = {
+        "name": raw_layer["name"],
+        "opacity": raw_layer["opacity"],
+        "visible": raw_layer["visible"],
+    }
 
     # if startx is present, starty is present
     if raw_layer.get("startx") is not None:
-        common.coordinates = OrderedPair(raw_layer["startx"], raw_layer["starty"])
+        common["coordinates"] = OrderedPair(raw_layer["startx"], raw_layer["starty"])
 
     if raw_layer.get("id") is not None:
-        common.id = raw_layer["id"]
+        common["id"] = raw_layer["id"]
 
     # if either width or height is present, they both are
     if raw_layer.get("width") is not None:
-        common.size = Size(raw_layer["width"], raw_layer["height"])
+        common["size"] = Size(raw_layer["width"], raw_layer["height"])
 
     if raw_layer.get("offsetx") is not None:
-        common.offset = OrderedPair(raw_layer["offsetx"], raw_layer["offsety"])
+        common["offset"] = OrderedPair(raw_layer["offsetx"], raw_layer["offsety"])
 
     if raw_layer.get("properties") is not None:
-        common.properties = parse_properties(raw_layer["properties"])
+        common["properties"] = parse_properties(raw_layer["properties"], context)
 
     if raw_layer.get("class") is not None:
-        common.class_ = raw_layer["class"]
+        common["class_"] = raw_layer["class"]
 
     parallax = [1.0, 1.0]
 
@@ -246,30 +251,36 @@ def _parse_common(raw_layer: RawLayer) -> Layer:
     if raw_layer.get("parallaxy") is not None:
         parallax[1] = raw_layer["parallaxy"]
 
-    common.parallax_factor = OrderedPair(parallax[0], parallax[1])
+    common["parallax_factor"] = OrderedPair(parallax[0], parallax[1])
 
     if raw_layer.get("tintcolor") is not None:
-        common.tint_color = parse_color(raw_layer["tintcolor"])
+        common["tint_color"] = parse_color(raw_layer["tintcolor"])
 
     if raw_layer.get("repeatx") is not None:
-        common.repeat_x = raw_layer["repeatx"]
+        common["repeat_x"] = raw_layer["repeatx"]
 
     if raw_layer.get("repeaty") is not None:
-        common.repeat_y = raw_layer["repeaty"]
+        common["repeat_y"] = raw_layer["repeaty"]
 
     return common
 
 
-def _parse_tile_layer(raw_layer: RawLayer) -> TileLayer:
+def _parse_tile_layer(
+    raw_layer: RawLayer, context: Optional[ParseContext] = None
+) -> TileLayer:
     """Parse the raw_layer to a TileLayer.
 
     Args:
         raw_layer: RawLayer to be parsed to a TileLayer.
+        context: The context of the current parse.
 
     Returns:
         TileLayer: The TileLayer created from raw_layer
     """
-    tile_layer = TileLayer(**_parse_common(raw_layer).__dict__)
+    tile_layer = TileLayer(**_parse_common(raw_layer, context))
+
+    if context is not None and context.metadata_only:
+        return tile_layer
 
     if raw_layer.get("chunks") is not None:
         tile_layer.chunks = []
@@ -300,6 +311,7 @@ def _parse_object_layer(
     raw_layer: RawLayer,
     encoding: str,
     parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> ObjectLayer:
     """Parse the raw_layer to an ObjectLayer.
 
@@ -310,27 +322,34 @@ def _parse_object_layer(
         ObjectLayer: The ObjectLayer created from raw_layer
     """
     objects = []
-    for object_ in raw_layer["objects"]:
-        objects.append(parse_object(object_, encoding, parent_dir))
+    if context is None or not context.metadata_only:
+        context = get_context(context)
+        for object_ in raw_layer["objects"]:
+            tiled_object = parse_object(object_, encoding, parent_dir, context)
+            objects.append(context.intern_attributes(tiled_object))
+        context.add_objects(objects)
 
     return ObjectLayer(
         tiled_objects=objects,
         draw_order=raw_layer["draworder"],
-        **_parse_common(raw_layer).__dict__,
+        **_parse_common(raw_layer, context),
     )
 
 
-def _parse_image_layer(raw_layer: RawLayer) -> ImageLayer:
+def _parse_image_layer(
+    raw_layer: RawLayer, context: Optional[ParseContext] = None
+) -> ImageLayer:
     """Parse the raw_layer to an ImageLayer.
 
     Args:
         raw_layer: RawLayer to be parsed to an ImageLayer.
+        context: The context of the current parse.
 
     Returns:
         ImageLayer: The ImageLayer created from raw_layer
     """
     image_layer = ImageLayer(
-        image=Path(raw_layer["image"]), **_parse_common(raw_layer).__dict__
+        image=Path(raw_layer["image"]), **_parse_common(raw_layer, context)
     )
 
     if raw_layer.get("transparentcolor") is not None:
@@ -340,28 +359,75 @@ def _parse_image_layer(raw_layer: RawLayer) -> ImageLayer:
 
 
 def _parse_group_layer(
-    raw_layer: RawLayer, encoding, parent_dir: Optional[Path] = None
+    raw_layer: RawLayer,
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
+    selected: bool = False,
 ) -> LayerGroup:
     """Parse the raw_layer to a LayerGroup.
 
     Args:
         raw_layer: RawLayer to be parsed to a LayerGroup.
+        selected: Whether the group was selected by the layer filter.
 
     Returns:
         LayerGroup: The LayerGroup created from raw_layer
     """
-    layers = []
+    layers = parse_layers(raw_layer["layers"], encoding, parent_dir, context, selected)
 
-    for layer in raw_layer["layers"]:
-        layers.append(parse(layer, encoding, parent_dir=parent_dir))
+    return LayerGroup(layers=layers, **_parse_common(raw_layer, context))
 
-    return LayerGroup(layers=layers, **_parse_common(raw_layer).__dict__)
+
+def parse_layers(
+    raw_layers: List[RawLayer],
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
+    selected: bool = False,
+) -> List[Layer]:
+    """Parse a list of raw Layers, leaving out those rejected by the layer filter.
+
+    Layers are filtered before any of their contents are parsed, see
+    [pytiled_parser.layer_filter][] for how the rules of a filter are applied.
+
+    Args:
+        raw_layers: Raw layers to be parsed.
+        parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
+        selected: Whether the layers are within a group selected by the filter.
+
+    Returns:
+        List[Layer]: The parsed Layers which were kept.
+    """
+    layer_filter = context.layer_filter if context is not None else None
+    if layer_filter is None:
+        return [parse(layer, encoding, parent_dir, context) for layer in raw_layers]
+
+    layers: List[Layer] = []
+    for raw_layer in raw_layers:
+        info = LayerInfo(
+            raw_layer.get("name", ""), raw_layer["type"], raw_layer.get("class", "")
+        )
+        if layer_filter.excludes(info):
+            continue
+
+        keep = selected or layer_filter.selects(info)
+        if info.type == "group":
+            group = _parse_group_layer(raw_layer, encoding, parent_dir, context, keep)
+            if keep or group.layers:
+                layers.append(get_context(context).intern_attributes(group))
+        elif keep:
+            layers.append(parse(raw_layer, encoding, parent_dir, context))
+
+    return layers
 
 
 def parse(
     raw_layer: RawLayer,
     encoding: str,
     parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Layer:
     """Parse a raw Layer into a pytiled_parser object.
 
@@ -370,6 +436,7 @@ def parse(
     Args:
         raw_layer: Raw layer to be parsed.
         parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
 
     Returns:
         Layer: A parsed Layer.
@@ -379,13 +446,16 @@ def parse(
     """
     type_ = raw_layer["type"]
 
+    layer: Layer
     if type_ == "objectgroup":
-        return _parse_object_layer(raw_layer, encoding, parent_dir)
+        layer = _parse_object_layer(raw_layer, encoding, parent_dir, context)
     elif type_ == "group":
-        return _parse_group_layer(raw_layer, encoding, parent_dir)
+        layer = _parse_group_layer(raw_layer, encoding, parent_dir, context)
     elif type_ == "imagelayer":
-        return _parse_image_layer(raw_layer)
+        layer = _parse_image_layer(raw_layer, context)
     elif type_ == "tilelayer":
-        return _parse_tile_layer(raw_layer)
+        layer = _parse_tile_layer(raw_layer, context)
+    else:
+        raise RuntimeError(f"An invalid layer type of {type_} was supplied")
 
-    raise RuntimeError(f"An invalid layer type of {type_} was supplied")
+    return get_context(context).intern_attributes(layer)
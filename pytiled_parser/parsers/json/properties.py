@@ -2,11 +2,12 @@
 """
 
 from pathlib import Path
-from typing import List, Union, cast
+from typing import List, Optional, Union, cast
 
 from typing_extensions import TypedDict
 
-from pytiled_parser.properties import Properties, Property
+from pytiled_parser.context import ParseContext
+from pytiled_parser.properties import LazyProperties, Properties, Property
 from pytiled_parser.util import parse_color
 
 RawValue = Union[float, str, bool]
@@ -20,20 +21,48 @@ class RawProperty(TypedDict):
 
     name: str
     type: str
+    propertytype: str
     value: RawValue
 
 
-def parse(raw_properties: List[RawProperty]) -> Properties:
+def _convert(type_: str, value: RawValue) -> Property:
+    """Convert the raw value of a file or color property.
+
+    Args:
+        type_: The type of the property.
+        value: The raw value of the property.
+
+    Returns:
+        Property: The converted value.
+    """
+    if type_ == "file":
+        return Path(cast(str, value))
+    return parse_color(cast(str, value))
+
+
+def parse(
+    raw_properties: List[RawProperty], context: Optional[ParseContext] = None
+) -> Properties:
     """Parse a list of `RawProperty` objects into `Properties`.
 
+    File and color properties are converted when they are first read, see
+    [LazyProperties][pytiled_parser.properties.LazyProperties]. Class properties
+    are filled in from the property types of the context, if it has any, and
+    object properties are given as references if the context resolves objects.
+
     Args:
         raw_properties: The list or dict of `RawProperty` objects to parse. The dict type is supported for parsing legacy Tiled dungeon files.
+        context: The context of the current parse.
 
     Returns:
         Properties: The parsed `Property` objects.
     """
 
-    final: Properties = {}
+    property_types = context.property_types if context is not None else None
+    reference_object = None
+    if context is not None and context.resolve_objects:
+        reference_object = context.reference_object
+    final = LazyProperties(_convert)
     value: Property
 
     if isinstance(raw_properties, dict):
@@ -41,14 +70,25 @@ def parse(raw_properties: List[RawProperty]) -> Properties:
             final[name] = value
     else:
         for raw_property in raw_properties:
-            if raw_property["type"] == "file":
-                value = Path(cast(str, raw_property["value"]))
-            elif raw_property["type"] == "color":
-                value = parse_color(cast(str, raw_property["value"]))
-            elif raw_property["type"] == "int":
+            type_ = raw_property["type"]
+            if type_ == "file" or type_ == "color":
+                final.add_raw(raw_property["name"], type_, raw_property["value"])
+            elif type_ == "int":
                 value = round(cast(float, raw_property["value"]))
+                final[raw_property["name"]] = value
+            elif (
+                type_ == "class"
+                and property_types is not None
+                and raw_property.get("propertytype") in property_types
+            ):
+                final[raw_property["name"]] = property_types.coerce(
+                    raw_property["propertytype"], raw_property["value"]
+                )
+            elif type_ == "object" and reference_object is not None:
+                final[raw_property["name"]] = reference_object(
+                    int(raw_property["value"])
+                )
             else:
-                value = raw_property["value"]
-            final[raw_property["name"]] = value
+                final[raw_property["name"]] = raw_property["value"]
 
     return final
@@ -1,21 +1,19 @@
-import json
-import xml.etree.ElementTree as etree
 from pathlib import Path
-from typing import List, Union, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
 from typing_extensions import TypedDict
 
 from pytiled_parser.common_types import OrderedPair, Size
-from pytiled_parser.exception import UnknownFormat
-from pytiled_parser.parsers.json.layer import RawLayer
-from pytiled_parser.parsers.json.layer import parse as parse_layer
+from pytiled_parser.context import ParseContext, get_context
+from pytiled_parser.layer import Layer
+from pytiled_parser.parsers.json.layer import RawLayer, parse_layers
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.parsers.json.tileset import RawTileSet
 from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
-from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
+from pytiled_parser.parsers.loader import assign_template_tilesets, load_tileset
 from pytiled_parser.tiled_map import TiledMap, TilesetDict
-from pytiled_parser.util import check_format, parse_color
+from pytiled_parser.util import iterparse_json, parse_color
 
 RawTilesetMapping = TypedDict("RawTilesetMapping", {"firstgid": int, "source": str})
 
@@ -55,18 +53,81 @@ RawTiledMap.__doc__ = """
 """
 
 
-def parse(file: Path, encoding: str) -> TiledMap:
+def parse(
+    file: Path,
+    encoding: str,
+    raw_tiled_map: Optional[RawTiledMap] = None,
+    context: Optional[ParseContext] = None,
+) -> TiledMap:
     """Parse the raw Tiled map into a pytiled_parser type.
 
     Args:
         file: Path to the map file.
+        encoding: The character encoding set to use when opening files.
+        raw_tiled_map: The already loaded contents of the map file. If not given the
+            file will be read and parsed with
+            [parse_stream][pytiled_parser.parsers.json.tiled_map.parse_stream].
+        context: The context of the current parse.
 
     Returns:
         TiledMap: A parsed TiledMap.
     """
-    with open(file, encoding=encoding) as map_file:
-        raw_tiled_map = json.load(map_file)
+    context = get_context(context)
+    if raw_tiled_map is None:
+        return parse_stream(file, encoding, context.resolver.read(file), context)
 
+    layers = parse_layers(raw_tiled_map["layers"], encoding, file.parent, context)
+    return _parse_map(file, encoding, raw_tiled_map, layers, context)
+
+
+def parse_stream(
+    file: Path,
+    encoding: str,
+    data: bytes,
+    context: Optional[ParseContext] = None,
+) -> TiledMap:
+    """Parse the raw contents of a JSON map, parsing each layer as soon as it is read.
+
+    The contents are decoded one layer at a time, and each layer is parsed and then
+    released before the next is decoded, so the decoded data of only one layer is
+    held at once, rather than that of the whole map. See
+    [iterparse_json][pytiled_parser.util.iterparse_json].
+
+    Args:
+        file: Path to the map file.
+        encoding: The character encoding set to use when opening files.
+        data: The raw contents of the map file.
+        context: The context of the current parse.
+
+    Returns:
+        TiledMap: A parsed TiledMap.
+
+    Raises:
+        ValueError: If the contents are not a valid JSON object.
+    """
+    context = get_context(context)
+    parent_dir = file.parent
+
+    raw_tiled_map: Dict[str, Any] = {}
+    layers: List[Layer] = []
+    for key, value in iterparse_json(data, encoding, "layers", context.json_backend):
+        if key == "layers":
+            layers.extend(parse_layers([value], encoding, parent_dir, context))
+        else:
+            raw_tiled_map[key] = value
+        # Release the raw layer before the next one is decoded
+        del value
+
+    return _parse_map(file, encoding, cast(RawTiledMap, raw_tiled_map), layers, context)
+
+
+def _parse_map(
+    file: Path,
+    encoding: str,
+    raw_tiled_map: RawTiledMap,
+    layers: List[Layer],
+    context: ParseContext,
+) -> TiledMap:
     parent_dir = file.parent
 
     raw_tilesets: List[Union[RawTileSet, RawTilesetMapping]] = raw_tiled_map["tilesets"]
@@ -76,34 +137,14 @@ def parse(file: Path, encoding: str) -> TiledMap:
         if raw_tileset.get("source") is not None:
             # Is an external Tileset
             tileset_path = Path(parent_dir / raw_tileset["source"])
-            parser = check_format(tileset_path, encoding)
-            with open(tileset_path, encoding=encoding) as raw_tileset_file:
-                if parser == "tmx":
-                    raw_tileset_external = etree.parse(raw_tileset_file).getroot()
-                    tilesets[raw_tileset["firstgid"]] = parse_tmx_tileset(
-                        raw_tileset_external,
-                        raw_tileset["firstgid"],
-                        encoding,
-                        external_path=tileset_path.parent,
-                    )
-                else:
-                    try:
-                        tilesets[raw_tileset["firstgid"]] = parse_json_tileset(
-                            json.load(raw_tileset_file),
-                            raw_tileset["firstgid"],
-                            encoding,
-                            external_path=tileset_path.parent,
-                        )
-                    except ValueError:
-                        raise UnknownFormat(
-                            "Unknown Tileset Format, please use either the TSX or JSON format. "
-                            "This message could also mean your tileset file is invalid or corrupted."
-                        )
+            tilesets[raw_tileset["firstgid"]] = load_tileset(
+                tileset_path, raw_tileset["firstgid"], encoding, context
+            )
         else:
             # Is an embedded Tileset
             raw_tileset = cast(RawTileSet, raw_tileset)
             tilesets[raw_tileset["firstgid"]] = parse_json_tileset(
-                raw_tileset, raw_tileset["firstgid"], encoding
+                raw_tileset, raw_tileset["firstgid"], encoding, context=context
             )
 
     if isinstance(raw_tiled_map["version"], float):  # pragma: no cover
@@ -115,10 +156,7 @@ def parse(file: Path, encoding: str) -> TiledMap:
     map_ = TiledMap(
         map_file=file,
         infinite=raw_tiled_map.get("infinite", False),
-        layers=[
-            parse_layer(layer_, encoding, parent_dir)
-            for layer_ in raw_tiled_map["layers"]
-        ],
+        layers=layers,
         map_size=Size(raw_tiled_map["width"], raw_tiled_map["height"]),
         next_layer_id=raw_tiled_map.get("nextlayerid"),
         next_object_id=raw_tiled_map["nextobjectid"],
@@ -130,50 +168,7 @@ def parse(file: Path, encoding: str) -> TiledMap:
         version=version,
     )
 
-    layers = [layer for layer in map_.layers if hasattr(layer, "tiled_objects")]
-
-    for my_layer in layers:
-        # Mypy extremely hates what is going on in this whole block
-        # For some reason an ignore on this first for loop is causing it
-        # to just not care about any of the problems in here.
-        # However, under normal circumstances, mypy hates just about every
-        # line of this block.
-        #
-        # This is because we are doing some run-time modification of the attributes
-        # on the tiled_object class and making assumptions about things based on that.
-        # This is done to achieve a system where we can load-in tilesets which were
-        # defined in a Tiled Object Template. This is tough because we need to know what
-        # tilesets have been loaded in already, and use them if they have been, but then
-        # be able to dynamically add-in tilesets after having parsed the rest of the map.
-
-        for tiled_object in my_layer.tiled_objects:  # type: ignore
-            if hasattr(tiled_object, "new_tileset"):
-                if tiled_object.new_tileset is not None:
-                    already_loaded = None
-                    for val in map_.tilesets.values():
-                        if val.name == tiled_object.new_tileset["name"]:
-                            already_loaded = val
-                            break
-
-                    if not already_loaded:
-                        highest_firstgid = max(map_.tilesets.keys())
-                        last_tileset_count = map_.tilesets[highest_firstgid].tile_count
-                        new_firstgid = highest_firstgid + last_tileset_count
-                        map_.tilesets[new_firstgid] = parse_json_tileset(
-                            tiled_object.new_tileset,
-                            new_firstgid,
-                            encoding,
-                            tiled_object.new_tileset_path,
-                        )
-                        tiled_object.gid = tiled_object.gid + (new_firstgid - 1)
-
-                    else:
-                        tiled_object.gid = tiled_object.gid + (
-                            already_loaded.firstgid - 1
-                        )
-
-                    tiled_object.new_tileset = None
-                    tiled_object.new_tileset_path = None
+    assign_template_tilesets(map_, encoding, context)
 
     if raw_tiled_map.get("class") is not None:
         map_.class_ = raw_tiled_map["class"]
@@ -185,7 +180,7 @@ def parse(file: Path, encoding: str) -> TiledMap:
         map_.hex_side_length = raw_tiled_map["hexsidelength"]
 
     if raw_tiled_map.get("properties") is not None:
-        map_.properties = parse_properties(raw_tiled_map["properties"])
+        map_.properties = parse_properties(raw_tiled_map["properties"], context)
 
     if raw_tiled_map.get("staggeraxis") is not None:
         map_.stagger_axis = raw_tiled_map["staggeraxis"]
@@ -193,8 +188,8 @@ def parse(file: Path, encoding: str) -> TiledMap:
     if raw_tiled_map.get("staggerindex") is not None:
         map_.stagger_index = raw_tiled_map["staggerindex"]
 
-    _parallax_origin_x = 0
-    _parallax_origin_y = 0
+    _parallax_origin_x = 0.0
+    _parallax_origin_y = 0.0
 
     if raw_tiled_map.get("parallaxoriginx") is not None:
         _parallax_origin_x = raw_tiled_map["parallaxoriginx"]
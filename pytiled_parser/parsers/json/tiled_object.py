@@ -1,14 +1,19 @@
 """Object parsing for the JSON Map Format.
 """
 
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
+import attr
 from typing_extensions import TypedDict
 
+from pytiled_parser.cache import template_cache
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
+from pytiled_parser.properties import copy_template_properties
 from pytiled_parser.tiled_object import (
     Ellipse,
     Point,
@@ -75,78 +80,93 @@ RawObject.__doc__ = """
 """
 
 
-def _parse_common(raw_object: RawObject) -> TiledObject:
-    """Create an Object containing all the attributes common to all types of objects.
+def _parse_common(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Dict[str, Any]:
+    """Get the attributes common to all types of objects, as keyword arguments.
 
     Args:
         raw_object: Raw object to get common attributes from
+        context: The context of the current parse.
 
     Returns:
-        Object: The attributes in common of all types of objects
+        Dict[str, Any]: The attributes in common of all types of objects
     """
 
-    common = TiledObject(
-        id=raw_object["id"],
-        coordinates=OrderedPair(raw_object["x"], raw_object["y"]),
-        visible=raw_object["visible"],
-        size=Size(raw_object["width"], raw_object["height"]),
-        rotation=raw_object["rotation"],
-        name=raw_object["name"],
-    )
+    common: Dict[str, Any] = {
+        "id": raw_object["id"],
+        "coordinates": OrderedPair(raw_object["x"], raw_object["y"]),
+        "visible": raw_object["visible"],
+        "size": Size(raw_object["width"], raw_object["height"]),
+        "rotation": raw_object["rotation"],
+        "name": raw_object["name"],
+    }
 
     if raw_object.get("type") is not None:
-        common.class_ = raw_object["type"]
+        common["class_"] = raw_object["type"]
 
     if raw_object.get("class") is not None:
-        common.class_ = raw_object["class"]
+        common["class_"] = raw_object["class"]
 
     if raw_object.get("properties") is not None:
-        common.properties = parse_properties(raw_object["properties"])
+        common["properties"] = parse_properties(raw_object["properties"], context)
 
     return common
 
 
-def _parse_ellipse(raw_object: RawObject) -> Ellipse:
+def _parse_ellipse(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Ellipse:
     """Parse the raw object into an Ellipse.
 
     Args:
         raw_object: Raw object to be parsed to an Ellipse
+        context: The context of the current parse.
 
     Returns:
         Ellipse: The Ellipse object created from the raw object
     """
-    return Ellipse(**_parse_common(raw_object).__dict__)
+    return Ellipse(**_parse_common(raw_object, context))
 
 
-def _parse_rectangle(raw_object: RawObject) -> Rectangle:
+def _parse_rectangle(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Rectangle:
     """Parse the raw object into a Rectangle.
 
     Args:
         raw_object: Raw object to be parsed to a Rectangle
+        context: The context of the current parse.
 
     Returns:
         Rectangle: The Rectangle object created from the raw object
     """
-    return Rectangle(**_parse_common(raw_object).__dict__)
+    return Rectangle(**_parse_common(raw_object, context))
 
 
-def _parse_point(raw_object: RawObject) -> Point:
+def _parse_point(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Point:
     """Parse the raw object into a Point.
 
     Args:
         raw_object: Raw object to be parsed to a Point
+        context: The context of the current parse.
 
     Returns:
         Point: The Point object created from the raw object
     """
-    return Point(**_parse_common(raw_object).__dict__)
+    return Point(**_parse_common(raw_object, context))
 
 
-def _parse_polygon(raw_object: RawObject) -> Polygon:
+def _parse_polygon(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Polygon:
     """Parse the raw object into a Polygon.
 
     Args:
         raw_object: Raw object to be parsed to a Polygon
+        context: The context of the current parse.
 
     Returns:
         Polygon: The Polygon object created from the raw object
@@ -155,14 +175,17 @@ def _parse_polygon(raw_object: RawObject) -> Polygon:
     for point in raw_object["polygon"]:
         polygon.append(OrderedPair(point["x"], point["y"]))
 
-    return Polygon(points=polygon, **_parse_common(raw_object).__dict__)
+    return Polygon(points=polygon, **_parse_common(raw_object, context))
 
 
-def _parse_polyline(raw_object: RawObject) -> Polyline:
+def _parse_polyline(
+    raw_object: RawObject, context: Optional[ParseContext] = None
+) -> Polyline:
     """Parse the raw object into a Polyline.
 
     Args:
         raw_object: Raw object to be parsed to a Polyline
+        context: The context of the current parse.
 
     Returns:
         Polyline: The Polyline object created from the raw object
@@ -171,18 +194,20 @@ def _parse_polyline(raw_object: RawObject) -> Polyline:
     for point in raw_object["polyline"]:
         polyline.append(OrderedPair(point["x"], point["y"]))
 
-    return Polyline(points=polyline, **_parse_common(raw_object).__dict__)
+    return Polyline(points=polyline, **_parse_common(raw_object, context))
 
 
 def _parse_tile(
     raw_object: RawObject,
     new_tileset: Optional[Dict[str, Any]] = None,
     new_tileset_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tile:
     """Parse the raw object into a Tile.
 
     Args:
         raw_object: Raw object to be parsed to a Tile
+        context: The context of the current parse.
 
     Returns:
         Tile: The Tile object created from the raw object
@@ -193,15 +218,16 @@ def _parse_tile(
         gid=gid,
         new_tileset=new_tileset,
         new_tileset_path=new_tileset_path,
-        **_parse_common(raw_object).__dict__,
+        **_parse_common(raw_object, context),
     )
 
 
-def _parse_text(raw_object: RawObject) -> Text:
+def _parse_text(raw_object: RawObject, context: Optional[ParseContext] = None) -> Text:
     """Parse the raw object into Text.
 
     Args:
         raw_object: Raw object to be parsed to a Text
+        context: The context of the current parse.
 
     Returns:
         Text: The Text object created from the raw object
@@ -211,7 +237,7 @@ def _parse_text(raw_object: RawObject) -> Text:
     text = raw_text["text"]
 
     # create base Text object
-    text_object = Text(text=text, **_parse_common(raw_object).__dict__)
+    text_object = Text(text=text, **_parse_common(raw_object, context))
 
     # optional attributes
     if raw_text.get("color") is not None:
@@ -250,7 +276,7 @@ def _parse_text(raw_object: RawObject) -> Text:
     return text_object
 
 
-def _get_parser(raw_object: RawObject) -> Callable[[RawObject], TiledObject]:
+def _get_parser(raw_object: RawObject) -> Callable[..., TiledObject]:
     """Get the parser function for a given raw object.
 
     Only used internally by the JSON parser.
@@ -259,7 +285,7 @@ def _get_parser(raw_object: RawObject) -> Callable[[RawObject], TiledObject]:
         raw_object: Raw object that is analyzed to determine the parser function.
 
     Returns:
-        Callable[[RawObject], Object]: The parser function.
+        Callable[..., TiledObject]: The parser function.
     """
     if raw_object.get("ellipse"):
         return _parse_ellipse
@@ -289,16 +315,135 @@ def _get_parser(raw_object: RawObject) -> Callable[[RawObject], TiledObject]:
     return _parse_rectangle
 
 
+# Keys of an object created from a template which are not taken from the template
+_INSTANCE_KEYS = {"id", "template", "x", "y", "name", "properties"}
+
+# Defaults of the keys which are required of objects, but a template may leave out
+_TEMPLATE_DEFAULTS = {
+    "name": "",
+    "rotation": 0,
+    "visible": True,
+    "width": 0,
+    "height": 0,
+}
+
+
+def _parse_template_object(
+    raw_template_object: RawObject, context: Optional[ParseContext] = None
+) -> TiledObject:
+    """Parse the object of a template, to be shared by every object created from it.
+
+    Args:
+        raw_template_object: The raw object within the template.
+        context: The context of the current parse.
+
+    Returns:
+        TiledObject: The template object, with an ID and coordinates of 0.
+    """
+    raw_object = cast(
+        RawObject,
+        {**_TEMPLATE_DEFAULTS, **raw_template_object, "id": 0, "x": 0, "y": 0},
+    )
+    return _get_parser(raw_object)(raw_object, context=context)
+
+
+def _load_template(
+    template_path: Path, encoding: str, context: ParseContext
+) -> Tuple[Any, Optional[TiledObject], Any, Optional[Path]]:
+    """Load an object template along with its tileset, and parse its object.
+
+    Args:
+        template_path: Path to the template file.
+        encoding: The character encoding set to use when opening the file.
+        context: The context of the current parse.
+
+    Returns:
+        A tuple of the raw template, the parsed object within it, the raw tileset,
+            and the directory of the tileset. The parsed object is None if the
+            template is not a JSON template.
+    """
+    template, new_tileset, new_tileset_path = load_object_template(
+        template_path,
+        encoding,
+        context.resolver,
+        context.json_backend,
+        context.xml_backend,
+    )
+
+    template_object = None
+    if isinstance(template, dict):
+        template_object = template_cache.get_or_load(
+            template_path,
+            lambda: _parse_template_object(template["object"], context.for_tiles()),
+            (encoding, "object") + context.tileset_cache_key(),
+            context.resolver,
+        )
+
+    return template, template_object, new_tileset, new_tileset_path
+
+
+def _parse_overrides(
+    raw_object: RawObject,
+    raw_template_object: RawObject,
+    template_object: TiledObject,
+    context: Optional[ParseContext] = None,
+) -> Optional[Dict[str, Any]]:
+    """Parse the attributes an object created from a template overrides.
+
+    The object is given its own copy of the properties of the template, see
+    [copy_template_properties][pytiled_parser.properties.copy_template_properties].
+
+    Args:
+        raw_object: The raw object which was created from the template.
+        raw_template_object: The raw object within the template.
+        template_object: The parsed object within the template.
+        context: The context of the current parse.
+
+    Returns:
+        Optional[Dict[str, Any]]: The overridden attributes, or None if the object
+            has to be merged with the template and parsed in full.
+    """
+    for key in raw_object:
+        if key not in _INSTANCE_KEYS and key not in raw_template_object:
+            return None
+    if "x" in raw_template_object or "y" in raw_template_object:
+        return None
+
+    overrides: Dict[str, Any] = {
+        "id": raw_object["id"],
+        "coordinates": OrderedPair(raw_object["x"], raw_object["y"]),
+    }
+
+    if "name" in raw_object:
+        overrides["name"] = raw_object["name"]
+
+    properties = {}
+    if raw_object.get("properties") is not None:
+        properties = parse_properties(raw_object["properties"], context)
+    # Each object is given its own properties and points, rather than sharing the
+    # mutable values of the template
+    if template_object.properties:
+        properties = copy_template_properties(template_object.properties, properties)
+    overrides["properties"] = properties
+
+    if isinstance(template_object, (Polygon, Polyline)):
+        overrides["points"] = list(template_object.points)
+
+    return overrides
+
+
 def parse(
     raw_object: RawObject,
     encoding: str,
     parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> TiledObject:
     """Parse the raw object into a pytiled_parser version
 
     Args:
         raw_object: Raw object that is to be cast.
         parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
 
     Returns:
         Object: A parsed Object.
@@ -315,12 +460,25 @@ def parse(
                 "A parent directory must be specified when using object templates."
             )
         template_path = Path(parent_dir / raw_object["template"])
-        template, new_tileset, new_tileset_path = load_object_template(
-            template_path, encoding
+        context = get_context(context)
+        template, template_object, new_tileset, new_tileset_path = context.load_once(
+            (__name__, template_path, encoding),
+            partial(_load_template, template_path, encoding, context),
         )
 
         if isinstance(template, dict):
             loaded_template = template["object"]
+            overrides = None
+            if template_object is not None:
+                overrides = _parse_overrides(
+                    raw_object, loaded_template, template_object, context
+                )
+            if overrides is not None and template_object is not None:
+                if isinstance(template_object, Tile):
+                    overrides["new_tileset"] = new_tileset
+                    overrides["new_tileset_path"] = new_tileset_path
+                return attr.evolve(template_object, **overrides)
+
             for key in loaded_template:
                 if key != "id":
                     if key == "properties":
@@ -349,6 +507,6 @@ def parse(
             )
 
     if raw_object.get("gid"):
-        return _parse_tile(raw_object, new_tileset, new_tileset_path)
+        return _parse_tile(raw_object, new_tileset, new_tileset_path, context)
 
-    return _get_parser(raw_object)(raw_object)
+    return _get_parser(raw_object)(raw_object, context=context)
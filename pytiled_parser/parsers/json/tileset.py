@@ -4,6 +4,7 @@ from typing import List, Optional, Union
 from typing_extensions import TypedDict
 
 from pytiled_parser.common_types import OrderedPair
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.parsers.json.layer import RawLayer
 from pytiled_parser.parsers.json.layer import parse as parse_layer
 from pytiled_parser.parsers.json.properties import RawProperty
@@ -162,7 +163,10 @@ def _parse_grid(raw_grid: RawGrid) -> Grid:
 
 
 def _parse_tile(
-    raw_tile: RawTile, encoding: str, external_path: Optional[Path] = None
+    raw_tile: RawTile,
+    encoding: str,
+    external_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tile:
     """Parse the raw_tile to a Tile object.
 
@@ -182,10 +186,15 @@ def _parse_tile(
             tile.animation.append(_parse_frame(frame))
 
     if raw_tile.get("objectgroup") is not None:
-        tile.objects = parse_layer(raw_tile["objectgroup"], encoding, external_path)
+        tile.objects = parse_layer(
+            raw_tile["objectgroup"],
+            encoding,
+            external_path,
+            get_context(context).for_tiles(),
+        )
 
     if raw_tile.get("properties") is not None:
-        tile.properties = parse_properties(raw_tile["properties"])
+        tile.properties = parse_properties(raw_tile["properties"], context)
 
     if raw_tile.get("image") is not None:
         if external_path:
@@ -235,6 +244,7 @@ def parse(
     firstgid: int,
     encoding: str,
     external_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tileset:
     """Parse the raw tileset into a pytiled_parser type
 
@@ -242,10 +252,13 @@ def parse(
         raw_tileset: Raw Tileset to be parsed.
         firstgid: GID corresponding the first tile in the set.
         external_path: The path to the tileset if it is not an embedded one.
+        context: The context of the current parse.
 
     Returns:
         TileSet: a properly typed TileSet.
     """
+    # Tilesets are shared between maps, so are parsed without map-only options
+    context = get_context(context).for_tiles()
 
     tileset = Tileset(
         name=raw_tileset["name"],
@@ -303,28 +316,32 @@ def parse(
         tileset.grid = _parse_grid(raw_tileset["grid"])
 
     if raw_tileset.get("properties") is not None:
-        tileset.properties = parse_properties(raw_tileset["properties"])
+        tileset.properties = parse_properties(raw_tileset["properties"], context)
 
     if raw_tileset.get("tiles") is not None:
         tiles = {}
         if isinstance(raw_tileset["tiles"], dict):
             for raw_tile_id, raw_tile in raw_tileset["tiles"].items():
                 assert raw_tile.get("id") is None
-                raw_tile["id"] = int(raw_tile_id)
-                tiles[raw_tile["id"]] = _parse_tile(
-                    raw_tile, encoding, external_path=external_path
+                # Copied rather than modified in place, the raw tileset may be
+                # shared through the template cache.
+                raw_tile = {**raw_tile, "id": int(raw_tile_id)}
+                tile = _parse_tile(
+                    raw_tile, encoding, external_path=external_path, context=context
                 )
+                tiles[raw_tile["id"]] = context.intern_attributes(tile)
         else:
             for raw_tile in raw_tileset["tiles"]:
-                tiles[raw_tile["id"]] = _parse_tile(
-                    raw_tile, encoding, external_path=external_path
+                tile = _parse_tile(
+                    raw_tile, encoding, external_path=external_path, context=context
                 )
+                tiles[raw_tile["id"]] = context.intern_attributes(tile)
         tileset.tiles = tiles
 
     if raw_tileset.get("wangsets") is not None:
         wangsets = []
         for raw_wangset in raw_tileset["wangsets"]:
-            wangsets.append(parse_wangset(raw_wangset))
+            wangsets.append(parse_wangset(raw_wangset, context))
         tileset.wang_sets = wangsets
 
     if raw_tileset.get("transformations") is not None:
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 
 from typing_extensions import TypedDict
 
+from pytiled_parser.context import ParseContext
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.util import parse_color
@@ -66,11 +67,14 @@ def _parse_wang_tile(raw_wang_tile: RawWangTile) -> WangTile:
     return WangTile(tile_id=raw_wang_tile["tileid"], wang_id=raw_wang_tile["wangid"])
 
 
-def _parse_wang_color(raw_wang_color: RawWangColor) -> WangColor:
+def _parse_wang_color(
+    raw_wang_color: RawWangColor, context: Optional[ParseContext] = None
+) -> WangColor:
     """Parse the raw wang color into a pytiled_parser type
 
     Args:
         raw_wang_color: RawWangColor to be parsed.
+        context: The context of the current parse.
 
     Returns:
         WangColor: A properly typed WangColor.
@@ -83,16 +87,17 @@ def _parse_wang_color(raw_wang_color: RawWangColor) -> WangColor:
     )
 
     if raw_wang_color.get("properties") is not None:
-        wang_color.properties = parse_properties(raw_wang_color["properties"])
+        wang_color.properties = parse_properties(raw_wang_color["properties"], context)
 
     return wang_color
 
 
-def parse(raw_wangset: RawWangSet) -> WangSet:
+def parse(raw_wangset: RawWangSet, context: Optional[ParseContext] = None) -> WangSet:
     """Parse the raw wangset into a pytiled_parser type
 
     Args:
         raw_wangset: Raw Wangset to be parsed.
+        context: The context of the current parse.
 
     Returns:
         WangSet: A properly typed WangSet.
@@ -100,7 +105,7 @@ def parse(raw_wangset: RawWangSet) -> WangSet:
 
     colors = []
     for raw_wang_color in raw_wangset["colors"]:
-        colors.append(_parse_wang_color(raw_wang_color))
+        colors.append(_parse_wang_color(raw_wang_color, context))
 
     tiles = {}
     for raw_wang_tile in raw_wangset["wangtiles"]:
@@ -115,6 +120,6 @@ def parse(raw_wangset: RawWangSet) -> WangSet:
     )
 
     if raw_wangset.get("properties") is not None:
-        wangset.properties = parse_properties(raw_wangset["properties"])
+        wangset.properties = parse_properties(raw_wangset["properties"], context)
 
     return wangset
@@ -0,0 +1,220 @@
+"""Format independent loading of external files referenced by maps.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import attr
+
+from pytiled_parser.cache import tileset_cache
+from pytiled_parser.context import ParseContext, get_context
+from pytiled_parser.exception import UnknownFormat
+from pytiled_parser.layer import Layer, LayerGroup, ObjectLayer
+from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
+from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
+from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.tiled_object import Tile
+from pytiled_parser.tileset import Tile as TilesetTile
+from pytiled_parser.tileset import Tileset
+from pytiled_parser.util import parse_json, parse_xml, sniff_format
+
+
+def _parse_tileset_file(
+    file: Path, firstgid: int, encoding: str, context: ParseContext
+) -> Tileset:
+    """Read and parse an external tileset file of either format.
+
+    Args:
+        file: Path to the tileset file.
+        firstgid: GID corresponding the first tile in the set.
+        encoding: The character encoding set to use when opening the file.
+        context: The context of the current parse.
+
+    Returns:
+        Tileset: The parsed Tileset.
+
+    Raises:
+        UnknownFormat: If the file is neither a valid TSX or JSON tileset.
+    """
+    data = context.resolver.read(file)
+
+    if sniff_format(data, file, encoding) == "tmx":
+        return parse_tmx_tileset(
+            parse_xml(data, encoding, context.xml_backend),
+            firstgid,
+            encoding,
+            external_path=file.parent,
+            context=context,
+        )
+
+    try:
+        raw_tileset = parse_json(data, encoding, context.json_backend)
+    except ValueError:
+        raise UnknownFormat(
+            "Unknown Tileset Format, please use either the TSX or JSON format. "
+            "This message could also mean your tileset file is invalid or corrupted."
+        )
+
+    return parse_json_tileset(
+        raw_tileset, firstgid, encoding, external_path=file.parent, context=context
+    )
+
+
+def load_tileset(
+    file: Path,
+    firstgid: int,
+    encoding: str,
+    context: Optional[ParseContext] = None,
+) -> Tileset:
+    """Load an external tileset, re-using a previously parsed copy if enabled.
+
+    With the `cache_tilesets` option of the context, the parsed tileset is kept in
+    the process-wide [tileset_cache][pytiled_parser.cache.tileset_cache]. Every call
+    then returns a shallow copy with the requested firstgid, so top level attributes
+    can be freely changed by the caller, while the tiles, wang sets and properties
+    are shared with any other map using the same tileset file. Otherwise the tileset
+    is parsed for each map.
+
+    Args:
+        file: Path to the tileset file.
+        firstgid: GID corresponding the first tile in the set.
+        encoding: The character encoding set to use when opening the file.
+        context: The context of the current parse.
+
+    Returns:
+        Tileset: The Tileset with the given firstgid.
+    """
+    context = get_context(context)
+    if not context.cache_tilesets:
+        return _parse_tileset_file(file, firstgid, encoding, context)
+
+    cached = tileset_cache.get_or_load(
+        file,
+        lambda: _parse_tileset_file(file, 1, encoding, context),  # type: ignore
+        (encoding,) + context.tileset_cache_key(),
+        context.resolver,
+    )
+    return attr.evolve(cached, firstgid=firstgid)
+
+
+def _iter_template_tiles(layers: Iterable[Layer]) -> Iterator[Tile]:
+    """Find the tile objects within layers which still need their template tileset.
+
+    Args:
+        layers: The layers to search, including the layers within groups.
+
+    Yields:
+        Tile: Each tile object with a `new_tileset`.
+    """
+    for layer in layers:
+        if isinstance(layer, ObjectLayer):
+            for tiled_object in layer.tiled_objects:
+                if isinstance(tiled_object, Tile) and tiled_object.new_tileset:
+                    yield tiled_object
+        elif isinstance(layer, LayerGroup) and layer.layers:
+            yield from _iter_template_tiles(layer.layers)
+
+
+def assign_template_tilesets(
+    tiled_map: TiledMap, encoding: str, context: Optional[ParseContext] = None
+) -> None:
+    """Add the tilesets of object templates to a map, and offset the GIDs using them.
+
+    Tile objects created from a template hold the raw tileset of the template, and a
+    GID local to that tileset. Each is matched by name to a tileset of the map, and
+    tilesets the map does not have yet are parsed and added after the last one. The
+    tilesets are looked up in an index by name, so this is linear in the number of
+    tile objects. The objects within layer groups and the collision shapes of tiles
+    are included.
+
+    The objects of the map's layers are its own, so are updated in place. The tiles
+    of external tilesets may be shared with other maps through the
+    [tileset_cache][pytiled_parser.cache.tileset_cache], while the GIDs of their
+    collision shapes depend on the tilesets of each map, so the map is given copies
+    of the tiles it changes instead.
+
+    Args:
+        tiled_map: The map to assign the tilesets of.
+        encoding: The character encoding set to use when opening files.
+        context: The context of the current parse.
+    """
+    tilesets = tiled_map.tilesets
+    by_name: Dict[str, Tileset] = {}
+    for tileset in tilesets.values():
+        by_name.setdefault(tileset.name, tileset)
+    next_firstgid = max(
+        (firstgid + tileset.tile_count for firstgid, tileset in tilesets.items()),
+        default=1,
+    )
+    # Tilesets added while assigning are appended, so their tiles are searched too
+    pending: List[int] = list(tilesets)
+
+    def get_gid(tiled_object: Tile) -> int:
+        nonlocal next_firstgid
+        raw_tileset = tiled_object.new_tileset
+        if isinstance(raw_tileset, dict):
+            name = raw_tileset["name"]
+        else:
+            name = raw_tileset.attrib["name"]  # type: ignore
+
+        tileset = by_name.get(name)
+        if tileset is None:
+            if isinstance(raw_tileset, dict):
+                tileset = parse_json_tileset(
+                    raw_tileset,  # type: ignore
+                    next_firstgid,
+                    encoding,
+                    tiled_object.new_tileset_path,
+                    context,
+                )
+            else:
+                tileset = parse_tmx_tileset(
+                    raw_tileset,  # type: ignore
+                    next_firstgid,
+                    encoding,
+                    tiled_object.new_tileset_path,
+                    context,
+                )
+            tilesets[next_firstgid] = by_name[name] = tileset
+            pending.append(next_firstgid)
+            next_firstgid += tileset.tile_count
+
+        return tiled_object.gid + tileset.firstgid - 1
+
+    for tiled_object in _iter_template_tiles(tiled_map.layers):
+        tiled_object.gid = get_gid(tiled_object)
+        tiled_object.new_tileset = None
+        tiled_object.new_tileset_path = None
+
+    for firstgid in pending:
+        tileset = tilesets[firstgid]
+        if not tileset.tiles:
+            continue
+        tiles: Optional[Dict[int, TilesetTile]] = None
+        for tile_id, tile in tileset.tiles.items():
+            if not isinstance(tile.objects, ObjectLayer) or not any(
+                _iter_template_tiles([tile.objects])
+            ):
+                continue
+            objects = [
+                (
+                    attr.evolve(
+                        tiled_object,
+                        gid=get_gid(tiled_object),
+                        new_tileset=None,
+                        new_tileset_path=None,
+                    )
+                    if isinstance(tiled_object, Tile) and tiled_object.new_tileset
+                    else tiled_object
+                )
+                for tiled_object in tile.objects.tiled_objects
+            ]
+            if tiles is None:
+                tiles = dict(tileset.tiles)
+            tiles[tile_id] = attr.evolve(
+                tile, objects=attr.evolve(tile.objects, tiled_objects=objects)
+            )
+        if tiles is not None:
+            tilesets[firstgid] = by_name[tileset.name] = attr.evolve(
+                tileset, tiles=tiles
+            )
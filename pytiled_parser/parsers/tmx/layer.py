@@ -7,9 +7,10 @@ import importlib.util
 import xml.etree.ElementTree as etree
 import zlib
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.layer import (
     Chunk,
     ImageLayer,
@@ -18,6 +19,7 @@ from pytiled_parser.layer import (
     ObjectLayer,
     TileLayer,
 )
+from pytiled_parser.layer_filter import TMX_LAYER_TYPES, LayerInfo
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.parsers.tmx.tiled_object import parse as parse_object
 from pytiled_parser.util import parse_color
@@ -143,42 +145,43 @@ def _parse_chunk(
     )
 
 
-def _parse_common(raw_layer: etree.Element) -> Layer:
-    """Create a Layer containing all the attributes common to all layer types.
+def _parse_common(
+    raw_layer: etree.Element, context: Optional[ParseContext] = None
+) -> Dict[str, Any]:
+    """Get the attributes common to all layer types.
 
-    This is to create the stub Layer object that can then be used to create the actual
-        specific sub-classes of Layer.
+    These are returned as keyword arguments, to be passed along with the attributes
+        specific to a type of layer when creating it.
 
     Args:
         raw_layer: XML Element to get common attributes from
+        context: The context of the current parse.
 
     Returns:
-        Layer: The attributes in common of all layer types
+        Dict[str, Any]: The attributes in common of all layer types
     """
     if raw_layer.attrib.get("name") is None:
         raw_layer.attrib["name"] = ""
 
-    common = Layer(
-        name=raw_layer.attrib["name"],
-    )
+    common: Dict[str, Any] = {"name": raw_layer.attrib["name"]}
 
     if raw_layer.attrib.get("opacity") is not None:
-        common.opacity = float(raw_layer.attrib["opacity"])
+        common["opacity"] = float(raw_layer.attrib["opacity"])
 
     if raw_layer.attrib.get("visible") is not None:
-        common.visible = bool(int(raw_layer.attrib["visible"]))
+        common["visible"] = bool(int(raw_layer.attrib["visible"]))
 
     if raw_layer.attrib.get("id") is not None:
-        common.id = int(raw_layer.attrib["id"])
+        common["id"] = int(raw_layer.attrib["id"])
 
     if raw_layer.attrib.get("offsetx") is not None:
-        common.offset = OrderedPair(
+        common["offset"] = OrderedPair(
             float(raw_layer.attrib["offsetx"]), float(raw_layer.attrib["offsety"])
         )
 
     properties_element = raw_layer.find("./properties")
     if properties_element is not None:
-        common.properties = parse_properties(properties_element)
+        common["properties"] = parse_properties(properties_element, context)
 
     parallax = [1.0, 1.0]
 
@@ -188,39 +191,43 @@ def _parse_common(raw_layer: etree.Element) -> Layer:
     if raw_layer.attrib.get("parallaxy") is not None:
         parallax[1] = float(raw_layer.attrib["parallaxy"])
 
-    common.parallax_factor = OrderedPair(parallax[0], parallax[1])
+    common["parallax_factor"] = OrderedPair(parallax[0], parallax[1])
 
     if raw_layer.attrib.get("tintcolor") is not None:
-        common.tint_color = parse_color(raw_layer.attrib["tintcolor"])
+        common["tint_color"] = parse_color(raw_layer.attrib["tintcolor"])
 
     if raw_layer.attrib.get("class") is not None:
-        common.class_ = raw_layer.attrib["class"]
+        common["class_"] = raw_layer.attrib["class"]
 
     if raw_layer.attrib.get("repeatx") is not None:
-        common.repeat_x = bool(int(raw_layer.attrib["repeatx"]))
+        common["repeat_x"] = bool(int(raw_layer.attrib["repeatx"]))
 
     if raw_layer.attrib.get("repeaty") is not None:
-        common.repeat_y = bool(int(raw_layer.attrib["repeaty"]))
+        common["repeat_y"] = bool(int(raw_layer.attrib["repeaty"]))
 
     return common
 
 
-def _parse_tile_layer(raw_layer: etree.Element) -> TileLayer:
+def _parse_tile_layer(
+    raw_layer: etree.Element, context: Optional[ParseContext] = None
+) -> TileLayer:
     """Parse the raw_layer to a TileLayer.
 
     Args:
         raw_layer: XML Element to be parsed to a TileLayer.
+        context: The context of the current parse.
 
     Returns:
         TileLayer: The TileLayer created from raw_layer
     """
-    common = _parse_common(raw_layer).__dict__
-    del common["size"]
     tile_layer = TileLayer(
         size=Size(int(raw_layer.attrib["width"]), int(raw_layer.attrib["height"])),
-        **common,
+        **_parse_common(raw_layer, context),
     )
 
+    if context is not None and context.metadata_only:
+        return tile_layer
+
     data_element = raw_layer.find("data")
     if data_element is not None:
         encoding = None
@@ -262,7 +269,10 @@ def _parse_tile_layer(raw_layer: etree.Element) -> TileLayer:
 
 
 def _parse_object_layer(
-    raw_layer: etree.Element, encoding: str, parent_dir: Optional[Path] = None
+    raw_layer: etree.Element,
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> ObjectLayer:
     """Parse the raw_layer to an ObjectLayer.
 
@@ -273,12 +283,16 @@ def _parse_object_layer(
         ObjectLayer: The ObjectLayer created from raw_layer
     """
     objects = []
-    for object_ in raw_layer.findall("./object"):
-        objects.append(parse_object(object_, encoding, parent_dir))
+    if context is None or not context.metadata_only:
+        context = get_context(context)
+        for object_ in raw_layer.findall("./object"):
+            tiled_object = parse_object(object_, encoding, parent_dir, context)
+            objects.append(context.intern_attributes(tiled_object))
+        context.add_objects(objects)
 
     object_layer = ObjectLayer(
         tiled_objects=objects,
-        **_parse_common(raw_layer).__dict__,
+        **_parse_common(raw_layer, context),
     )
 
     if raw_layer.attrib.get("draworder") is not None:
@@ -287,11 +301,14 @@ def _parse_object_layer(
     return object_layer
 
 
-def _parse_image_layer(raw_layer: etree.Element) -> ImageLayer:
+def _parse_image_layer(
+    raw_layer: etree.Element, context: Optional[ParseContext] = None
+) -> ImageLayer:
     """Parse the raw_layer to an ImageLayer.
 
     Args:
         raw_layer: XML Element to be parsed to an ImageLayer.
+        context: The context of the current parse.
 
     Returns:
         ImageLayer: The ImageLayer created from raw_layer
@@ -307,7 +324,7 @@ def _parse_image_layer(raw_layer: etree.Element) -> ImageLayer:
         image_layer = ImageLayer(
             image=source,
             transparent_color=transparent_color,
-            **_parse_common(raw_layer).__dict__,
+            **_parse_common(raw_layer, context),
         )
 
         return image_layer
@@ -316,28 +333,87 @@ def _parse_image_layer(raw_layer: etree.Element) -> ImageLayer:
 
 
 def _parse_group_layer(
-    raw_layer: etree.Element, encoding: str, parent_dir: Optional[Path] = None
+    raw_layer: etree.Element,
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
+    selected: bool = False,
 ) -> LayerGroup:
     """Parse the raw_layer to a LayerGroup.
 
     Args:
         raw_layer: XML Element to be parsed to a LayerGroup.
+        selected: Whether the group was selected by the layer filter.
 
     Returns:
         LayerGroup: The LayerGroup created from raw_layer
     """
+    layers = parse_layers(raw_layer, encoding, parent_dir, context, selected)
+
+    return LayerGroup(layers=layers, **_parse_common(raw_layer, context))
+
+
+def _layer_info(raw_layer: etree.Element) -> LayerInfo:
+    return LayerInfo(
+        raw_layer.attrib.get("name", ""),
+        TMX_LAYER_TYPES[raw_layer.tag],
+        raw_layer.attrib.get("class", ""),
+    )
+
+
+def parse_layers(
+    elements: Iterable[etree.Element],
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
+    selected: bool = False,
+) -> List[Layer]:
+    """Parse the layer elements among the children of a map or group, leaving out
+    those rejected by the layer filter.
+
+    Layers are filtered before any of their contents are parsed, see
+    [pytiled_parser.layer_filter][] for how the rules of a filter are applied.
+
+    Args:
+        elements: The map or group element containing the layers, or some of its
+            children. Elements which are not layers are ignored.
+        parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
+        selected: Whether the layers are within a group selected by the filter.
+
+    Returns:
+        List[Layer]: The parsed Layers which were kept.
+    """
+    layer_filter = context.layer_filter if context is not None else None
+
     layers: List[Layer] = []
-    for element in raw_layer:
-        if element.tag in ["layer", "objectgroup", "imagelayer", "group"]:
-            layers.append(parse(element, encoding, parent_dir))
+    for element in elements:
+        if element.tag not in TMX_LAYER_TYPES:
+            continue
+        if layer_filter is None:
+            layers.append(parse(element, encoding, parent_dir, context))
+            continue
 
-    return LayerGroup(layers=layers, **_parse_common(raw_layer).__dict__)
+        info = _layer_info(element)
+        if layer_filter.excludes(info):
+            continue
+
+        keep = selected or layer_filter.selects(info)
+        if element.tag == "group":
+            group = _parse_group_layer(element, encoding, parent_dir, context, keep)
+            if keep or group.layers:
+                layers.append(get_context(context).intern_attributes(group))
+        elif keep:
+            layers.append(parse(element, encoding, parent_dir, context))
+
+    return layers
 
 
 def parse(
     raw_layer: etree.Element,
     encoding: str,
     parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Layer:
     """Parse a raw Layer into a pytiled_parser object.
 
@@ -346,6 +422,7 @@ def parse(
     Args:
         raw_layer: Raw layer to be parsed.
         parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
 
     Returns:
         Layer: A parsed Layer.
@@ -355,13 +432,16 @@ def parse(
     """
     type_ = raw_layer.tag
 
+    layer: Layer
     if type_ == "objectgroup":
-        return _parse_object_layer(raw_layer, encoding, parent_dir)
+        layer = _parse_object_layer(raw_layer, encoding, parent_dir, context)
     elif type_ == "group":
-        return _parse_group_layer(raw_layer, encoding, parent_dir)
+        layer = _parse_group_layer(raw_layer, encoding, parent_dir, context)
     elif type_ == "imagelayer":
-        return _parse_image_layer(raw_layer)
+        layer = _parse_image_layer(raw_layer, context)
     elif type_ == "layer":
-        return _parse_tile_layer(raw_layer)
+        layer = _parse_tile_layer(raw_layer, context)
     else:
         raise RuntimeError("Unknown layer type in map file!")
+
+    return get_context(context).intern_attributes(layer)
@@ -1,36 +1,109 @@
 import xml.etree.ElementTree as etree
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from pytiled_parser.properties import Properties, Property
+from pytiled_parser.context import ParseContext
+from pytiled_parser.properties import LazyProperties, Properties, Property
 from pytiled_parser.util import parse_color
 
+# Types of property which are converted from a string when they are first read
+_CONVERTED_TYPES = {"file", "color", "int", "float", "bool"}
 
-def parse(raw_properties: etree.Element) -> Properties:
-    final: Properties = {}
-    value: Property
+# Types of the members of a class which the JSON format stores as other than strings
+_JSON_TYPES = {"int", "float", "bool"}
+
+
+def _convert(type_: str, value: str) -> Property:
+    """Convert the raw value of a property which is not a string.
+
+    Args:
+        type_: The type of the property.
+        value: The value of the property as it appears in the file.
+
+    Returns:
+        Property: The converted value.
+    """
+    if type_ == "file":
+        return Path(value)
+    elif type_ == "color":
+        return parse_color(value)
+    elif type_ == "int":
+        return round(float(value))
+    elif type_ == "float":
+        return float(value)
+    return value == "true"
+
+
+def _parse_class_value(raw_property: etree.Element, convert: bool) -> Dict[str, Any]:
+    """Get the members set on a class property.
+
+    Args:
+        raw_property: The property element.
+        convert: Whether to convert members to the types the JSON format stores
+            them as, otherwise their raw values are returned to be converted by the
+            property type of the class.
+
+    Returns:
+        Dict[str, Any]: The members which are set, with nested classes as dicts.
+    """
+    value: Dict[str, Any] = {}
+    members = raw_property.find("./properties")
+    if members is None:
+        return value
+
+    for member in members.findall("property"):
+        type_ = member.attrib.get("type")
+        if type_ == "class":
+            value[member.attrib["name"]] = _parse_class_value(member, convert)
+            continue
+
+        raw_value = member.attrib.get("value", member.text)
+        if raw_value is None:
+            continue
+        if convert and type_ is not None and type_ in _JSON_TYPES:
+            value[member.attrib["name"]] = _convert(type_, raw_value)
+        else:
+            value[member.attrib["name"]] = raw_value
+
+    return value
+
+
+def parse(
+    raw_properties: etree.Element, context: Optional[ParseContext] = None
+) -> Properties:
+    property_types = context.property_types if context is not None else None
+    reference_object = None
+    if context is not None and context.resolve_objects:
+        reference_object = context.reference_object
+    final = LazyProperties(_convert)
 
     for raw_property in raw_properties.findall("property"):
         type_ = raw_property.attrib.get("type")
 
+        if type_ == "class":
+            property_type = raw_property.attrib.get("propertytype")
+            if (
+                property_types is not None
+                and property_type is not None
+                and property_type in property_types
+            ):
+                value = property_types.coerce(
+                    property_type, _parse_class_value(raw_property, False)
+                )
+            else:
+                value = _parse_class_value(raw_property, True)
+            final[raw_property.attrib["name"]] = value
+            continue
+
         value_ = raw_property.attrib.get("value", raw_property.text)
         if value_ is None:
             continue
 
-        if type_ == "file":
-            value = Path(value_)
-        elif type_ == "color":
-            value = parse_color(value_)
-        elif type_ == "int":
-            value = round(float(value_))
-        elif type_ == "float":
-            value = float(value_)
-        elif type_ == "bool":
-            if value_ == "true":
-                value = True
-            else:
-                value = False
+        if type_ in _CONVERTED_TYPES:
+            final.add_raw(raw_property.attrib["name"], type_, value_)
+        elif type_ == "object" and reference_object is not None:
+            final[raw_property.attrib["name"]] = reference_object(int(value_))
         else:
-            value = value_
-        final[raw_property.attrib["name"]] = value
+            final[raw_property.attrib["name"]] = value_
 
     return final
@@ -1,29 +1,100 @@
-import json
 import xml.etree.ElementTree as etree
 from pathlib import Path
+from typing import List, Optional
 
 from pytiled_parser.common_types import OrderedPair, Size
-from pytiled_parser.exception import UnknownFormat
-from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
-from pytiled_parser.parsers.tmx.layer import parse as parse_layer
+from pytiled_parser.context import ParseContext, get_context
+from pytiled_parser.layer import Layer
+from pytiled_parser.layer_filter import TMX_LAYER_TYPES
+from pytiled_parser.parsers.loader import assign_template_tilesets, load_tileset
+from pytiled_parser.parsers.tmx.layer import parse_layers
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
 from pytiled_parser.tiled_map import TiledMap, TilesetDict
-from pytiled_parser.util import check_format, parse_color
+from pytiled_parser.util import iterparse_xml, parse_color
 
 
-def parse(file: Path, encoding: str) -> TiledMap:
+def parse(
+    file: Path,
+    encoding: str,
+    raw_map: Optional[etree.Element] = None,
+    context: Optional[ParseContext] = None,
+) -> TiledMap:
     """Parse the raw Tiled map into a pytiled_parser type.
 
     Args:
         file: Path to the map file.
+        encoding: The character encoding set to use when opening files.
+        raw_map: The already loaded root element of the map file. If not given the
+            file will be read and parsed with
+            [parse_stream][pytiled_parser.parsers.tmx.tiled_map.parse_stream].
+        context: The context of the current parse.
 
     Returns:
         TiledMap: A parsed TiledMap.
     """
-    with open(file, encoding=encoding) as map_file:
-        raw_map = etree.parse(map_file).getroot()
+    context = get_context(context)
+    if raw_map is None:
+        return parse_stream(file, encoding, context.resolver.read(file), context)
 
+    layers = parse_layers(raw_map, encoding, file.parent, context)
+    return _parse_map(file, encoding, raw_map, layers, context)
+
+
+def parse_stream(
+    file: Path,
+    encoding: str,
+    data: bytes,
+    context: Optional[ParseContext] = None,
+) -> TiledMap:
+    """Parse the raw contents of a TMX map, parsing each layer as soon as it is read.
+
+    The contents are read incrementally, and each top level layer is parsed as soon
+    as its element ends, and then removed from the tree. So the text of a layer's
+    tile data is released before the next layer is read, and the whole document is
+    never held as a tree. Layers within a group are parsed when the group ends.
+
+    The document is always read to the end. Tiled allows several layers to share a
+    name and tilesets to follow the layers, so there is no point at which a layer
+    filter is known to have matched every layer it will keep.
+
+    Args:
+        file: Path to the map file.
+        encoding: The character encoding set to use when opening files.
+        data: The raw contents of the map file.
+        context: The context of the current parse.
+
+    Returns:
+        TiledMap: A parsed TiledMap.
+    """
+    context = get_context(context)
+    parent_dir = file.parent
+
+    raw_map: Optional[etree.Element] = None
+    layers: List[Layer] = []
+    depth = 0
+    for event, element in iterparse_xml(data, encoding, context.xml_backend):
+        if event == "start":
+            if raw_map is None:
+                raw_map = element
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1 and element.tag in TMX_LAYER_TYPES:
+            layers.extend(parse_layers([element], encoding, parent_dir, context))
+            raw_map.remove(element)  # type: ignore
+
+    return _parse_map(file, encoding, raw_map, layers, context)  # type: ignore
+
+
+def _parse_map(
+    file: Path,
+    encoding: str,
+    raw_map: etree.Element,
+    layers: List[Layer],
+    context: ParseContext,
+) -> TiledMap:
     parent_dir = file.parent
 
     raw_tilesets = raw_map.findall("./tileset")
@@ -33,39 +104,19 @@ def parse(file: Path, encoding: str) -> TiledMap:
         if raw_tileset.attrib.get("source") is not None:
             # Is an external Tileset
             tileset_path = Path(parent_dir / raw_tileset.attrib["source"])
-            parser = check_format(tileset_path, encoding)
-            with open(tileset_path, encoding=encoding) as tileset_file:
-                if parser == "tmx":
-                    raw_tileset_external = etree.parse(tileset_file).getroot()
-                    tilesets[int(raw_tileset.attrib["firstgid"])] = parse_tmx_tileset(
-                        raw_tileset_external,
-                        int(raw_tileset.attrib["firstgid"]),
-                        encoding,
-                        external_path=tileset_path.parent,
-                    )
-                elif parser == "json":
-                    tilesets[int(raw_tileset.attrib["firstgid"])] = parse_json_tileset(
-                        json.load(tileset_file),
-                        int(raw_tileset.attrib["firstgid"]),
-                        encoding,
-                        external_path=tileset_path.parent,
-                    )
-                else:
-                    raise UnknownFormat(
-                        "Unkown Tileset format, please use either the TSX or JSON format."
-                    )
+            tilesets[int(raw_tileset.attrib["firstgid"])] = load_tileset(
+                tileset_path, int(raw_tileset.attrib["firstgid"]), encoding, context
+            )
 
         else:
             # Is an embedded Tileset
             tilesets[int(raw_tileset.attrib["firstgid"])] = parse_tmx_tileset(
-                raw_tileset, int(raw_tileset.attrib["firstgid"]), encoding
+                raw_tileset,
+                int(raw_tileset.attrib["firstgid"]),
+                encoding,
+                context=context,
             )
 
-    layers = []
-    for element in raw_map:
-        if element.tag in ["layer", "objectgroup", "imagelayer", "group"]:
-            layers.append(parse_layer(element, encoding, parent_dir))
-
     map_ = TiledMap(
         map_file=file,
         infinite=bool(int(raw_map.attrib["infinite"])),
@@ -83,51 +134,7 @@ def parse(file: Path, encoding: str) -> TiledMap:
         version=raw_map.attrib["version"],
     )
 
-    layers = [layer for layer in map_.layers if hasattr(layer, "tiled_objects")]
-
-    for my_layer in layers:
-        # Mypy extremely hates what is going on in this whole block
-        # For some reason an ignore on this first for loop is causing it
-        # to just not care about any of the problems in here.
-        # However, under normal circumstances, mypy hates just about every
-        # line of this block.
-        #
-        # This is because we are doing some run-time modification of the attributes
-        # on the tiled_object class and making assumptions about things based on that.
-        # This is done to achieve a system where we can load-in tilesets which were
-        # defined in a Tiled Object Template. This is tough because we need to know what
-        # tilesets have been loaded in already, and use them if they have been, but then
-        # be able to dynamically add-in tilesets after having parsed the rest of the map.
-
-        for tiled_object in my_layer.tiled_objects:  # type: ignore
-            if hasattr(tiled_object, "new_tileset"):
-                if tiled_object.new_tileset is not None:
-                    already_loaded = None
-                    for val in map_.tilesets.values():
-                        if val.name == tiled_object.new_tileset.attrib["name"]:
-                            already_loaded = val
-                            break
-
-                    if not already_loaded:
-                        print("here")
-                        highest_firstgid = max(map_.tilesets.keys())
-                        last_tileset_count = map_.tilesets[highest_firstgid].tile_count
-                        new_firstgid = highest_firstgid + last_tileset_count
-                        map_.tilesets[new_firstgid] = parse_tmx_tileset(
-                            tiled_object.new_tileset,
-                            new_firstgid,
-                            encoding,
-                            tiled_object.new_tileset_path,
-                        )
-                        tiled_object.gid = tiled_object.gid + (new_firstgid - 1)
-
-                    else:
-                        tiled_object.gid = tiled_object.gid + (
-                            already_loaded.firstgid - 1
-                        )
-
-                    tiled_object.new_tileset = None
-                    tiled_object.new_tileset_path = None
+    assign_template_tilesets(map_, encoding, context)
 
     if raw_map.attrib.get("backgroundcolor") is not None:
         map_.background_color = parse_color(raw_map.attrib["backgroundcolor"])
@@ -137,7 +144,7 @@ def parse(file: Path, encoding: str) -> TiledMap:
 
     properties_element = raw_map.find("./properties")
     if properties_element is not None:
-        map_.properties = parse_properties(properties_element)
+        map_.properties = parse_properties(properties_element, context)
 
     if raw_map.attrib.get("staggeraxis") is not None:
         map_.stagger_axis = raw_map.attrib["staggeraxis"]
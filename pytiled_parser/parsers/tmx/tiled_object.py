@@ -1,9 +1,16 @@
+import copy
 import xml.etree.ElementTree as etree
+from functools import partial
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import attr
+
+from pytiled_parser.cache import template_cache
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
+from pytiled_parser.properties import copy_template_properties
 from pytiled_parser.tiled_object import (
     Ellipse,
     Point,
@@ -17,91 +24,106 @@ from pytiled_parser.tiled_object import (
 from pytiled_parser.util import load_object_template, parse_color
 
 
-def _parse_common(raw_object: etree.Element) -> TiledObject:
-    """Create an Object containing all the attributes common to all types of objects.
+def _parse_common(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Dict[str, Any]:
+    """Get the attributes common to all types of objects, as keyword arguments.
 
     Args:
         raw_object: XML Element to get common attributes from
+        context: The context of the current parse.
 
     Returns:
-        Object: The attributes in common of all types of objects
+        Dict[str, Any]: The attributes in common of all types of objects
     """
 
-    common = TiledObject(
-        id=int(raw_object.attrib["id"]),
-        coordinates=OrderedPair(
+    common: Dict[str, Any] = {
+        "id": int(raw_object.attrib["id"]),
+        "coordinates": OrderedPair(
             float(raw_object.attrib["x"]), float(raw_object.attrib["y"])
         ),
-    )
+    }
 
     if raw_object.attrib.get("width") is not None:
-        common.size = Size(
+        common["size"] = Size(
             float(raw_object.attrib["width"]), float(raw_object.attrib["height"])
         )
 
     if raw_object.attrib.get("visible") is not None:
-        common.visible = bool(int(raw_object.attrib["visible"]))
+        common["visible"] = bool(int(raw_object.attrib["visible"]))
 
     if raw_object.attrib.get("rotation") is not None:
-        common.rotation = float(raw_object.attrib["rotation"])
+        common["rotation"] = float(raw_object.attrib["rotation"])
 
     if raw_object.attrib.get("name") is not None:
-        common.name = raw_object.attrib["name"]
+        common["name"] = raw_object.attrib["name"]
 
     if raw_object.attrib.get("type") is not None:
-        common.class_ = raw_object.attrib["type"]
+        common["class_"] = raw_object.attrib["type"]
 
     if raw_object.attrib.get("class") is not None:
-        common.class_ = raw_object.attrib["class"]
+        common["class_"] = raw_object.attrib["class"]
 
     properties_element = raw_object.find("./properties")
     if properties_element is not None:
-        common.properties = parse_properties(properties_element)
+        common["properties"] = parse_properties(properties_element, context)
 
     return common
 
 
-def _parse_ellipse(raw_object: etree.Element) -> Ellipse:
+def _parse_ellipse(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Ellipse:
     """Parse the raw object into an Ellipse.
 
     Args:
         raw_object: XML Element to be parsed to an Ellipse
+        context: The context of the current parse.
 
     Returns:
         Ellipse: The Ellipse object created from the raw object
     """
-    return Ellipse(**_parse_common(raw_object).__dict__)
+    return Ellipse(**_parse_common(raw_object, context))
 
 
-def _parse_rectangle(raw_object: etree.Element) -> Rectangle:
+def _parse_rectangle(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Rectangle:
     """Parse the raw object into a Rectangle.
 
     Args:
         raw_object: XML Element to be parsed to a Rectangle
+        context: The context of the current parse.
 
     Returns:
         Rectangle: The Rectangle object created from the raw object
     """
-    return Rectangle(**_parse_common(raw_object).__dict__)
+    return Rectangle(**_parse_common(raw_object, context))
 
 
-def _parse_point(raw_object: etree.Element) -> Point:
+def _parse_point(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Point:
     """Parse the raw object into a Point.
 
     Args:
         raw_object: XML Element to be parsed to a Point
+        context: The context of the current parse.
 
     Returns:
         Point: The Point object created from the raw object
     """
-    return Point(**_parse_common(raw_object).__dict__)
+    return Point(**_parse_common(raw_object, context))
 
 
-def _parse_polygon(raw_object: etree.Element) -> Polygon:
+def _parse_polygon(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Polygon:
     """Parse the raw object into a Polygon.
 
     Args:
         raw_object: XML Element to be parsed to a Polygon
+        context: The context of the current parse.
 
     Returns:
         Polygon: The Polygon object created from the raw object
@@ -113,14 +135,17 @@ def _parse_polygon(raw_object: etree.Element) -> Polygon:
             point = raw_point.split(",")
             polygon.append(OrderedPair(float(point[0]), float(point[1])))
 
-    return Polygon(points=polygon, **_parse_common(raw_object).__dict__)
+    return Polygon(points=polygon, **_parse_common(raw_object, context))
 
 
-def _parse_polyline(raw_object: etree.Element) -> Polyline:
+def _parse_polyline(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Polyline:
     """Parse the raw object into a Polyline.
 
     Args:
         raw_object: Raw object to be parsed to a Polyline
+        context: The context of the current parse.
 
     Returns:
         Polyline: The Polyline object created from the raw object
@@ -132,18 +157,20 @@ def _parse_polyline(raw_object: etree.Element) -> Polyline:
             point = raw_point.split(",")
             polyline.append(OrderedPair(float(point[0]), float(point[1])))
 
-    return Polyline(points=polyline, **_parse_common(raw_object).__dict__)
+    return Polyline(points=polyline, **_parse_common(raw_object, context))
 
 
 def _parse_tile(
     raw_object: etree.Element,
     new_tileset: Optional[etree.Element] = None,
     new_tileset_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tile:
     """Parse the raw object into a Tile.
 
     Args:
         raw_object: XML Element to be parsed to a Tile
+        context: The context of the current parse.
 
     Returns:
         Tile: The Tile object created from the raw object
@@ -152,15 +179,18 @@ def _parse_tile(
         gid=int(raw_object.attrib["gid"]),
         new_tileset=new_tileset,
         new_tileset_path=new_tileset_path,
-        **_parse_common(raw_object).__dict__,
+        **_parse_common(raw_object, context),
     )
 
 
-def _parse_text(raw_object: etree.Element) -> Text:
+def _parse_text(
+    raw_object: etree.Element, context: Optional[ParseContext] = None
+) -> Text:
     """Parse the raw object into Text.
 
     Args:
         raw_object: XML Element to be parsed to a Text
+        context: The context of the current parse.
 
     Returns:
         Text: The Text object created from the raw object
@@ -174,7 +204,7 @@ def _parse_text(raw_object: etree.Element) -> Text:
         if not text:
             text = ""
         # create base Text object
-        text_object = Text(text=text, **_parse_common(raw_object).__dict__)
+        text_object = Text(text=text, **_parse_common(raw_object, context))
 
         # optional attributes
 
@@ -214,7 +244,7 @@ def _parse_text(raw_object: etree.Element) -> Text:
     return text_object
 
 
-def _get_parser(raw_object: etree.Element) -> Callable[[etree.Element], TiledObject]:
+def _get_parser(raw_object: etree.Element) -> Callable[..., TiledObject]:
     """Get the parser function for a given raw object.
 
     Only used internally by the TMX parser.
@@ -245,14 +275,168 @@ def _get_parser(raw_object: etree.Element) -> Callable[[etree.Element], TiledObj
     return _parse_rectangle
 
 
+# Attributes of an object created from a template which can be applied to the parsed
+# object of the template, rather than merged with the template and parsed in full
+_INSTANCE_ATTRIBUTES = {
+    "id",
+    "template",
+    "x",
+    "y",
+    "name",
+    "visible",
+    "rotation",
+    "type",
+    "class",
+    "width",
+    "height",
+}
+
+
+def _parse_template_object(
+    template_object: etree.Element, context: Optional[ParseContext] = None
+) -> TiledObject:
+    """Parse the object of a template, to be shared by every object created from it.
+
+    Args:
+        template_object: The object element within the template.
+        context: The context of the current parse.
+
+    Returns:
+        TiledObject: The template object, with an ID and coordinates of 0.
+    """
+    raw_object = template_object.makeelement(
+        template_object.tag, {**template_object.attrib, "id": "0", "x": "0", "y": "0"}
+    )
+    raw_object.extend(copy.copy(child) for child in template_object)
+
+    if raw_object.attrib.get("gid"):
+        return _parse_tile(raw_object, context=context)
+    return _get_parser(raw_object)(raw_object, context=context)
+
+
+def _load_template(
+    template_path: Path, encoding: str, context: ParseContext
+) -> Tuple[Any, Optional[TiledObject], Any, Optional[Path]]:
+    """Load an object template along with its tileset, and parse its object.
+
+    Args:
+        template_path: Path to the template file.
+        encoding: The character encoding set to use when opening the file.
+        context: The context of the current parse.
+
+    Returns:
+        A tuple of the raw template, the parsed object within it, the raw tileset,
+            and the directory of the tileset. The parsed object is None if the
+            template is not a TMX template or has no object.
+    """
+    template, new_tileset, new_tileset_path = load_object_template(
+        template_path,
+        encoding,
+        context.resolver,
+        context.json_backend,
+        context.xml_backend,
+    )
+
+    template_object = None
+    if not isinstance(template, dict):
+        raw_template_object = template.find("./object")
+        if raw_template_object is not None:
+            template_object = template_cache.get_or_load(
+                template_path,
+                lambda: _parse_template_object(
+                    raw_template_object, context.for_tiles()
+                ),
+                (encoding, "object") + context.tileset_cache_key(),
+                context.resolver,
+            )
+
+    return template, template_object, new_tileset, new_tileset_path
+
+
+def _parse_overrides(
+    raw_object: etree.Element,
+    template_object: etree.Element,
+    parsed_template_object: TiledObject,
+    context: Optional[ParseContext] = None,
+) -> Optional[Dict[str, Any]]:
+    """Parse the attributes an object created from a template overrides.
+
+    The object is given its own copy of the properties of the template, see
+    [copy_template_properties][pytiled_parser.properties.copy_template_properties].
+
+    Args:
+        raw_object: The object element which was created from the template.
+        template_object: The object element within the template.
+        parsed_template_object: The parsed object within the template.
+        context: The context of the current parse.
+
+    Returns:
+        Optional[Dict[str, Any]]: The overridden attributes, or None if the object
+            has to be merged with the template and parsed in full.
+    """
+    attributes = raw_object.attrib
+    if not _INSTANCE_ATTRIBUTES.issuperset(attributes):
+        return None
+    if "x" not in attributes or "y" not in attributes:
+        return None
+
+    overrides: Dict[str, Any] = {
+        "id": int(attributes["id"]),
+        "coordinates": OrderedPair(float(attributes["x"]), float(attributes["y"])),
+    }
+
+    if "width" in attributes or "height" in attributes:
+        width = attributes.get("width", template_object.attrib.get("width"))
+        height = attributes.get("height", template_object.attrib.get("height"))
+        if width is None or height is None:
+            return None
+        overrides["size"] = Size(float(width), float(height))
+
+    if "visible" in attributes:
+        overrides["visible"] = bool(int(attributes["visible"]))
+
+    if "rotation" in attributes:
+        overrides["rotation"] = float(attributes["rotation"])
+
+    if "name" in attributes:
+        overrides["name"] = attributes["name"]
+
+    # The class takes precedence over the type, wherever each is set
+    if "class" in attributes or "type" in attributes:
+        overrides["class_"] = attributes.get(
+            "class", template_object.attrib.get("class", attributes.get("type"))
+        )
+
+    properties = {}
+    properties_element = raw_object.find("./properties")
+    if properties_element is not None:
+        properties = parse_properties(properties_element, context)
+    # Each object is given its own properties and points, rather than sharing the
+    # mutable values of the template
+    if parsed_template_object.properties:
+        properties = copy_template_properties(
+            parsed_template_object.properties, properties
+        )
+    overrides["properties"] = properties
+
+    if isinstance(parsed_template_object, (Polygon, Polyline)):
+        overrides["points"] = list(parsed_template_object.points)
+
+    return overrides
+
+
 def parse(
-    raw_object: etree.Element, encoding: str, parent_dir: Optional[Path] = None
+    raw_object: etree.Element,
+    encoding: str,
+    parent_dir: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> TiledObject:
     """Parse the raw object into a pytiled_parser version
 
     Args:
         raw_object: XML Element that is to be parsed.
         parent_dir: The parent directory that the map file is in.
+        context: The context of the current parse.
 
     Returns:
         TiledObject: A parsed Object.
@@ -269,13 +453,34 @@ def parse(
                 "A parent directory must be specified when using object templates."
             )
         template_path = Path(parent_dir / raw_object.attrib["template"])
-        template, new_tileset, new_tileset_path = load_object_template(
-            template_path, encoding
+        context = get_context(context)
+        template, parsed_template_object, new_tileset, new_tileset_path = (
+            context.load_once(
+                (__name__, template_path, encoding),
+                partial(_load_template, template_path, encoding, context),
+            )
         )
 
-        if isinstance(template, etree.Element):
-            new_object = template.find("./object")
-            if new_object is not None:
+        if not isinstance(template, dict):
+            template_object = template.find("./object")
+            if template_object is not None and parsed_template_object is not None:
+                overrides = _parse_overrides(
+                    raw_object, template_object, parsed_template_object, context
+                )
+                if overrides is not None:
+                    if isinstance(parsed_template_object, Tile):
+                        overrides["new_tileset"] = new_tileset
+                        overrides["new_tileset_path"] = new_tileset_path
+                    return attr.evolve(parsed_template_object, **overrides)
+
+            if template_object is not None:
+                # The template is shared by every object using it, so the overrides
+                # are applied to a shallow copy rather than the template itself.
+                new_object = template_object.makeelement(
+                    template_object.tag, template_object.attrib
+                )
+                new_object.extend(copy.copy(child) for child in template_object)
+
                 for key, val in raw_object.attrib.items():
                     if key == "template":
                         continue
@@ -313,6 +518,6 @@ def parse(
             )
 
     if raw_object.attrib.get("gid"):
-        return _parse_tile(raw_object, new_tileset, new_tileset_path)
+        return _parse_tile(raw_object, new_tileset, new_tileset_path, context)
 
-    return _get_parser(raw_object)(raw_object)
+    return _get_parser(raw_object)(raw_object, context=context)
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Optional
 
 from pytiled_parser.common_types import OrderedPair
+from pytiled_parser.context import ParseContext, get_context
 from pytiled_parser.parsers.tmx.layer import parse as parse_layer
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.parsers.tmx.wang_set import parse as parse_wangset
@@ -64,7 +65,10 @@ def _parse_transformations(raw_transformations: etree.Element) -> Transformation
 
 
 def _parse_tile(
-    raw_tile: etree.Element, encoding: str, external_path: Optional[Path] = None
+    raw_tile: etree.Element,
+    encoding: str,
+    external_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tile:
     """Parse the raw_tile to a Tile object.
 
@@ -91,11 +95,13 @@ def _parse_tile(
 
     object_element = raw_tile.find("./objectgroup")
     if object_element is not None:
-        tile.objects = parse_layer(object_element, encoding, external_path)
+        tile.objects = parse_layer(
+            object_element, encoding, external_path, get_context(context).for_tiles()
+        )
 
     properties_element = raw_tile.find("./properties")
     if properties_element is not None:
-        tile.properties = parse_properties(properties_element)
+        tile.properties = parse_properties(properties_element, context)
 
     image_element = raw_tile.find("./image")
     if image_element is not None:
@@ -133,7 +139,11 @@ def parse(
     firstgid: int,
     encoding: str,
     external_path: Optional[Path] = None,
+    context: Optional[ParseContext] = None,
 ) -> Tileset:
+    # Tilesets are shared between maps, so are parsed without map-only options
+    context = get_context(context).for_tiles()
+
     tileset = Tileset(
         name=raw_tileset.attrib["name"],
         tile_count=int(raw_tileset.attrib["tilecount"]),
@@ -202,13 +212,14 @@ def parse(
 
     properties_element = raw_tileset.find("./properties")
     if properties_element is not None:
-        tileset.properties = parse_properties(properties_element)
+        tileset.properties = parse_properties(properties_element, context)
 
     tiles = {}
     for tile_element in raw_tileset.findall("./tile"):
-        tiles[int(tile_element.attrib["id"])] = _parse_tile(
-            tile_element, encoding, external_path=external_path
+        tile = _parse_tile(
+            tile_element, encoding, external_path=external_path, context=context
         )
+        tiles[int(tile_element.attrib["id"])] = context.intern_attributes(tile)
     if tiles:
         tileset.tiles = tiles
 
@@ -216,7 +227,7 @@ def parse(
     if wangsets_element is not None:
         wangsets = []
         for raw_wangset in wangsets_element.findall("./wangset"):
-            wangsets.append(parse_wangset(raw_wangset))
+            wangsets.append(parse_wangset(raw_wangset, context))
         tileset.wang_sets = wangsets
 
     transformations_element = raw_tileset.find("./transformations")
@@ -1,5 +1,7 @@
 import xml.etree.ElementTree as etree
+from typing import Optional
 
+from pytiled_parser.context import ParseContext
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.util import parse_color
 from pytiled_parser.wang_set import WangColor, WangSet, WangTile
@@ -18,11 +20,14 @@ def _parse_wang_tile(raw_wang_tile: etree.Element) -> WangTile:
     return WangTile(tile_id=int(raw_wang_tile.attrib["tileid"]), wang_id=ids)
 
 
-def _parse_wang_color(raw_wang_color: etree.Element) -> WangColor:
+def _parse_wang_color(
+    raw_wang_color: etree.Element, context: Optional[ParseContext] = None
+) -> WangColor:
     """Parse the raw wang color into a pytiled_parser type
 
     Args:
         raw_wang_color: XML Element to be parsed.
+        context: The context of the current parse.
 
     Returns:
         WangColor: A properly typed WangColor.
@@ -39,16 +44,19 @@ def _parse_wang_color(raw_wang_color: etree.Element) -> WangColor:
 
     properties = raw_wang_color.find("./properties")
     if properties is not None:
-        wang_color.properties = parse_properties(properties)
+        wang_color.properties = parse_properties(properties, context)
 
     return wang_color
 
 
-def parse(raw_wangset: etree.Element) -> WangSet:
+def parse(
+    raw_wangset: etree.Element, context: Optional[ParseContext] = None
+) -> WangSet:
     """Parse the raw wangset into a pytiled_parser type
 
     Args:
         raw_wangset: XML Element to be parsed.
+        context: The context of the current parse.
 
     Returns:
         WangSet: A properly typed WangSet.
@@ -56,7 +64,7 @@ def parse(raw_wangset: etree.Element) -> WangSet:
 
     colors = []
     for raw_wang_color in raw_wangset.findall("./wangcolor"):
-        colors.append(_parse_wang_color(raw_wang_color))
+        colors.append(_parse_wang_color(raw_wang_color, context))
 
     tiles = {}
     for raw_wang_tile in raw_wangset.findall("./wangtile"):
@@ -75,6 +83,6 @@ def parse(raw_wangset: etree.Element) -> WangSet:
 
     properties = raw_wangset.find("./properties")
     if properties is not None:
-        wangset.properties = parse_properties(properties)
+        wangset.properties = parse_properties(properties, context)
 
     return wangset
@@ -8,11 +8,202 @@ The types defined in this module get added to other objects
 such as Layers, Maps, Objects, etc
 """
 
+import copy
 from pathlib import Path
-from typing import Dict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    ItemsView,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+)
 
 from .common_types import Color
 
+if TYPE_CHECKING:
+    from .tiled_object import TiledObject
+
 Property = Union[int, float, Path, str, bool, Color]
 
 Properties = Dict[str, Property]
+
+
+class ObjectReference(int):
+    """The ID of the object an `object` property refers to.
+
+    Maps parsed with `resolve_objects` give `object` properties as references. A
+    reference is the ID of the object, and compares equal to it, but also looks up
+    the object in an index of the objects of the map, which is built while the map
+    is parsed.
+
+    Args:
+        object_id: The ID of the object.
+        objects: The objects of the map, by ID.
+    """
+
+    objects: Mapping[int, "TiledObject"]
+
+    def __new__(
+        cls, object_id: int, objects: Optional[Mapping[int, "TiledObject"]] = None
+    ) -> "ObjectReference":
+        reference = super().__new__(cls, object_id)
+        reference.objects = {} if objects is None else objects
+        return reference
+
+    @property
+    def object(self) -> Optional["TiledObject"]:
+        """The object referred to, or None if the map has no object with the ID.
+
+        Properties which do not refer to any object have an ID of 0.
+        """
+        return self.objects.get(self)
+
+
+class _RawProperty(tuple):
+    """The type and value of a property as they appear in the file, before the value
+    is converted."""
+
+    __slots__ = ()
+
+
+class LazyProperties(Dict[str, Property]):
+    """Properties which are only converted from their raw values when first read.
+
+    This is a dict of the converted properties, and can be used as one. Properties
+    are added with their raw type and value, and each is converted the first time it
+    is read, after which the converted value is kept in place of the raw one.
+    Operations on the whole dict, such as iterating over its values, comparing it or
+    copying it, convert every property first. Pickling or copying it gives a plain
+    dict.
+
+    Args:
+        convert: Converts the raw value of a property, given its type and value.
+    """
+
+    __slots__ = ("convert",)
+
+    def __init__(self, convert: Callable[[str, Any], Property]) -> None:
+        super().__init__()
+        self.convert = convert
+
+    def add_raw(self, name: str, type_: str, value: Any) -> None:
+        """Add a property which is converted when it is first read.
+
+        Args:
+            name: The name of the property.
+            type_: The type of the property, as it appears in the file.
+            value: The raw value of the property.
+        """
+        # Raw values are stored in place of the Property until first read.
+        dict.__setitem__(self, name, _RawProperty((type_, value)))  # type: ignore[misc]
+
+    def _convert_all(self) -> None:
+        for name, value in dict.items(self):
+            if type(value) is _RawProperty:
+                dict.__setitem__(self, name, self.convert(*value))
+
+    def __getitem__(self, name: str) -> Property:
+        value = dict.__getitem__(self, name)
+        if type(value) is _RawProperty:
+            value = self.convert(*value)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def get(self, name: str, default: Any = None) -> Any:  # type: ignore[override]
+        if name in self:
+            return self[name]
+        return default
+
+    def pop(self, name: str, *default: Any) -> Any:  # type: ignore[override]
+        if name in self:
+            value = self[name]
+            dict.__delitem__(self, name)
+            return value
+        return dict.pop(self, name, *default)
+
+    def popitem(self) -> Tuple[str, Property]:
+        self._convert_all()
+        return dict.popitem(self)
+
+    def setdefault(  # type: ignore[override]
+        self, name: str, default: Any = None
+    ) -> Any:
+        if name in self:
+            return self[name]
+        self[name] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def __ior__(self, other: Any) -> "LazyProperties":  # type: ignore[override, misc]
+        self.update(other)
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        # Overridden so that dict() and ** read through __getitem__ rather than
+        # copying the raw values.
+        return dict.__iter__(self)
+
+    def values(self) -> ValuesView[Property]:  # type: ignore[override]
+        self._convert_all()
+        return dict.values(self)
+
+    def items(self) -> ItemsView[str, Property]:  # type: ignore[override]
+        self._convert_all()
+        return dict.items(self)
+
+    def copy(self) -> Properties:
+        return dict(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._convert_all()
+        if isinstance(other, LazyProperties):
+            other._convert_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        self._convert_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> Tuple[type, Tuple[Properties]]:
+        return (dict, (dict(self),))
+
+
+def copy_template_properties(template: Properties, overrides: Properties) -> Properties:
+    """Give an object created from an object template its own copy of the properties.
+
+    The properties of the template are shared by every object created from it, so
+    each object is given a new dict of them, updated with the properties the object
+    overrides. Class properties which are not overridden are copied as well, as they
+    can be changed in place.
+
+    Args:
+        template: The properties of the template.
+        overrides: The properties the object overrides.
+
+    Returns:
+        Properties: The properties of the object.
+    """
+    properties = {
+        name: copy.deepcopy(value) if isinstance(value, dict) else value
+        for name, value in template.items()
+        if name not in overrides
+    }
+    properties.update(overrides)
+    return properties
@@ -0,0 +1,249 @@
+"""Custom property types defined by a Tiled project.
+
+A Tiled project can define its own types of property, classes with a set of members
+and enums with a set of values, see
+[Tiled's docs for custom types](https://doc.mapeditor.org/en/stable/manual/custom-properties/#custom-property-types).
+A property of a class type only stores the members which differ from their default
+values, so the project is needed to get the full value of the property.
+
+The property types of a project are loaded once, and a function converting the raw
+value of each type is compiled when it is first used. Passing them to the parse
+functions gives each class property a dict of every member, with defaults filled in
+and each member converted to its type:
+
+    property_types = load_property_types(Path("game.tiled-project"))
+    tiled_map = parse_map(Path("level_01.tmx"), property_types=property_types)
+
+Enum properties are stored as either a string or an int, and are converted to the
+type they are stored as.
+"""
+
+import hashlib
+import json
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from typing_extensions import TypedDict
+
+from pytiled_parser.backends import JSONBackendLike
+from pytiled_parser.common_types import Color
+from pytiled_parser.resolver import ResolverLike, get_resolver
+from pytiled_parser.util import parse_color, parse_json
+
+Coercer = Callable[[Any], Any]
+
+
+class RawMember(TypedDict):
+    """A member of a class property type within a Tiled project file."""
+
+    name: str
+    type: str
+    propertyType: str
+    value: Any
+
+
+class RawPropertyType(TypedDict):
+    """A custom property type within a Tiled project file."""
+
+    id: int
+    name: str
+    type: str
+    members: List[RawMember]
+    storageType: str
+    values: List[str]
+    valuesAsFlags: bool
+
+
+def _coerce_bool(value: Any) -> bool:
+    if type(value) is bool:
+        return value
+    return value == "true"
+
+
+def _coerce_color(value: Any) -> Any:
+    # Colors which are not set are stored as an empty string
+    if not value or isinstance(value, Color):
+        return value
+    return parse_color(value)
+
+
+def _coerce_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    return round(float(value))
+
+
+def _coerce_file(value: Any) -> Path:
+    return Path(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _merge_class(
+    coercer: Coercer, default: Mapping[str, Any], value: Optional[Mapping[str, Any]]
+) -> Any:
+    if value:
+        return coercer({**default, **value})
+    return coercer(default)
+
+
+# Converts the raw value of a member from either format, by its built-in type
+_BUILTIN_COERCERS: Dict[str, Coercer] = {
+    "bool": _coerce_bool,
+    "color": _coerce_color,
+    "file": _coerce_file,
+    "float": float,
+    "int": _coerce_int,
+    "object": _coerce_int,
+    "string": str,
+}
+
+
+class PropertyTypes:
+    """The custom property types of a Tiled project.
+
+    Property types compare equal when they are made from the same raw types, so
+    maps and tilesets parsed with equal property types share the caches in
+    [pytiled_parser.cache][].
+
+    Args:
+        raw_property_types: The `propertyTypes` of a Tiled project file.
+    """
+
+    def __init__(self, raw_property_types: List[RawPropertyType]) -> None:
+        self.raw_types: Dict[str, RawPropertyType] = {
+            raw_type["name"]: raw_type for raw_type in raw_property_types
+        }
+        self._digest = hashlib.sha1(
+            json.dumps(raw_property_types, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self._coercers: Dict[str, Coercer] = {}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PropertyTypes):
+            return NotImplemented
+        return self._digest == other._digest
+
+    def __hash__(self) -> int:
+        return hash(self._digest)
+
+    def __repr__(self) -> str:
+        # Identifies the types across processes, for the keys of cached snapshots
+        return f"PropertyTypes({self._digest})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The compiled coercers are closures, so only the raw types are pickled
+        return (PropertyTypes, (list(self.raw_types.values()),))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.raw_types
+
+    def get_coercer(self, name: str) -> Coercer:
+        """Get the function which converts raw values of a property type.
+
+        The function is compiled the first time it is requested. For a class, it
+        takes a dict of the raw values of the members which are set, from either
+        file format, and returns a dict of every member of the class, filling in
+        the default values of the rest. For an enum, it converts the raw value to
+        the type the enum is stored as.
+
+        Args:
+            name: The name of the property type.
+
+        Returns:
+            The function which converts raw values of the type.
+
+        Raises:
+            KeyError: If the project has no property type with the given name.
+        """
+        coercer = self._coercers.get(name)
+        if coercer is None:
+            raw_type = self.raw_types[name]
+            if raw_type["type"] == "class":
+                coercer = self._compile_class(raw_type)
+            elif raw_type.get("storageType") == "int":
+                coercer = _coerce_int
+            else:
+                coercer = str
+            self._coercers[name] = coercer
+        return coercer
+
+    def coerce(self, name: str, value: Any) -> Any:
+        """Convert the raw value of a property of a custom type.
+
+        Args:
+            name: The name of the property type.
+            value: The raw value of the property.
+
+        Returns:
+            The converted value, see `get_coercer`.
+        """
+        return self.get_coercer(name)(value)
+
+    def _member_coercer(self, raw_member: RawMember) -> Coercer:
+        property_type = raw_member.get("propertyType")
+        if property_type is not None and property_type in self.raw_types:
+            return self.get_coercer(property_type)
+        if raw_member["type"] == "class":
+            return lambda value: dict(value or {})
+        return _BUILTIN_COERCERS.get(raw_member["type"], _identity)
+
+    def _compile_class(self, raw_type: RawPropertyType) -> Coercer:
+        members: Dict[str, Coercer] = {}
+        defaults: Dict[str, Any] = {}
+        # Members which are classes themselves, which each value gets its own copy of
+        class_members: List[str] = []
+
+        def coerce_class(value: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+            result = dict(defaults)
+            if value:
+                for name, member_value in value.items():
+                    member = members.get(name)
+                    if member is not None:
+                        member_value = member(member_value)
+                    result[name] = member_value
+            for name in class_members:
+                if not value or name not in value:
+                    result[name] = members[name](None)
+            return result
+
+        # Registered before the members are compiled, so members can refer to it
+        self._coercers[raw_type["name"]] = coerce_class
+
+        for raw_member in raw_type.get("members", []):
+            name = raw_member["name"]
+            coercer = self._member_coercer(raw_member)
+            if raw_member["type"] == "class":
+                # The member's value holds the members of its class it overrides
+                class_members.append(name)
+                coercer = partial(_merge_class, coercer, raw_member.get("value") or {})
+            elif "value" in raw_member:
+                defaults[name] = coercer(raw_member["value"])
+            members[name] = coercer
+
+        return coerce_class
+
+
+def load_property_types(
+    file: Path,
+    encoding: str = "utf-8",
+    resolver: Optional[ResolverLike] = None,
+    json_backend: Optional[JSONBackendLike] = None,
+) -> PropertyTypes:
+    """Load the custom property types of a Tiled project file.
+
+    Args:
+        file: Path to the `.tiled-project` file.
+        encoding: The character encoding set to use when opening the file.
+        resolver: Reads the project file. Defaults to reading from the filesystem.
+        json_backend: The backend to decode the file with, see
+            [pytiled_parser.backends][].
+
+    Returns:
+        PropertyTypes: The property types of the project.
+    """
+    raw_project = parse_json(get_resolver(resolver).read(file), encoding, json_backend)
+    return PropertyTypes(raw_project.get("propertyTypes", []))
@@ -0,0 +1,201 @@
+"""Hot reloading of maps and worlds when the files they were parsed from change.
+
+A [ReloadManager][pytiled_parser.reload.ReloadManager] records every file read while
+parsing a map or world, which includes external tilesets, object templates, the
+tilesets used by templates, and for worlds the directories searched by patterns.
+Calling `poll` checks the modification time of each of those files once, and
+re-parses only the maps and worlds which depend on a file that has changed:
+
+    manager = ReloadManager()
+    level = manager.load_map(Path("level_01.tmx"))
+
+    while running:
+        for file, reloaded in manager.poll().items():
+            replace_level(file, reloaded)
+
+Templates which have not changed are served from the caches in
+[pytiled_parser.cache][] when the affected maps are re-parsed.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from pytiled_parser.parser import parse_map, parse_world
+from pytiled_parser.resolver import ResolverLike, get_resolver
+from pytiled_parser.snapshot import RecordingResolver
+from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.world import World
+
+Loaded = Union[TiledMap, World]
+
+# The version and size of a file from its stamp, both None if it has no stamp
+_Version = Tuple[Optional[Hashable], Optional[int]]
+
+
+class ReloadManager:
+    """Loads maps and worlds, and reloads them when the files they use change.
+
+    Args:
+        encoding: The character encoding set to use when opening the files.
+        resolver: Reads the files. Only files which the resolver can stamp are
+            watched for changes. Defaults to reading from the filesystem.
+        on_reload: Optional function called with the path and new value of every
+            map or world which is reloaded.
+
+    Attributes:
+        errors: The error raised by the last attempt to reload each map or world
+            which failed to reload. The previous version is kept for these, and
+            they are reloaded again the next time one of their files changes.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "utf-8",
+        resolver: Optional[ResolverLike] = None,
+        on_reload: Optional[Callable[[Path, Loaded], None]] = None,
+    ):
+        self.encoding = encoding
+        self.resolver = get_resolver(resolver)
+        self.on_reload = on_reload
+        self.errors: Dict[Path, Exception] = {}
+
+        self._loaded: Dict[Path, Loaded] = {}
+        self._loaders: Dict[Path, Callable[..., Loaded]] = {}
+        self._dependencies: Dict[Path, Dict[str, _Version]] = {}
+
+    def _version(self, path: str) -> _Version:
+        stamp = self.resolver.stamp(Path(path))
+        if stamp is None:
+            return None, None
+        return stamp.version, stamp.size
+
+    def _load(self, file: Path, loader: Callable[..., Loaded]) -> Loaded:
+        recorder = RecordingResolver(self.resolver)
+        try:
+            value = loader(file, self.encoding, recorder)
+        finally:
+            # Even if parsing fails, the files read so far are watched, so that
+            # changing any of them triggers another attempt.
+            dependencies = self._dependencies.setdefault(file, {})
+            for dependency in recorder.dependencies.values():
+                dependencies[dependency.path] = (dependency.version, dependency.size)
+            self._loaders[file] = loader
+
+        self._loaded[file] = value
+        self._dependencies[file] = {
+            dependency.path: (dependency.version, dependency.size)
+            for dependency in recorder.dependencies.values()
+        }
+        self.errors.pop(file, None)
+        return value
+
+    def load_map(self, file: Path) -> TiledMap:
+        """Parse a map and watch the files it uses.
+
+        Args:
+            file: Path to the map file.
+
+        Returns:
+            TiledMap: The parsed map.
+        """
+        return self._load(file, parse_map)  # type: ignore
+
+    def load_world(self, file: Path) -> World:
+        """Parse a world and watch the world file and pattern matched directories.
+
+        Args:
+            file: Path to the world file.
+
+        Returns:
+            World: The parsed world.
+        """
+        return self._load(file, parse_world)  # type: ignore
+
+    def get(self, file: Path) -> Optional[Loaded]:
+        """Get the current version of a loaded map or world.
+
+        Args:
+            file: Path to the map or world file.
+
+        Returns:
+            Optional[Union[TiledMap, World]]: The map or world, or None if it has not
+                been loaded.
+        """
+        return self._loaded.get(file)
+
+    def unload(self, file: Path) -> None:
+        """Stop watching a map or world.
+
+        Args:
+            file: Path to the map or world file.
+        """
+        self._loaded.pop(file, None)
+        self._loaders.pop(file, None)
+        self._dependencies.pop(file, None)
+        self.errors.pop(file, None)
+
+    def dependencies(self, file: Path) -> List[Path]:
+        """Get the files which a map or world was loaded from.
+
+        Args:
+            file: Path to the map or world file.
+
+        Returns:
+            List[Path]: The files, including the map or world file itself.
+        """
+        return [Path(path) for path in self._dependencies.get(file, {})]
+
+    def dependents(self, path: Path) -> List[Path]:
+        """Get the maps and worlds which were loaded using a file.
+
+        Args:
+            path: Path to the file, as it was referenced while parsing.
+
+        Returns:
+            List[Path]: The map and world files.
+        """
+        return [
+            file
+            for file, dependencies in self._dependencies.items()
+            if str(path) in dependencies
+        ]
+
+    def poll(self) -> Dict[Path, Loaded]:
+        """Reload every map and world which uses a file that has changed.
+
+        Each watched file is stamped at most once per call, regardless of how many
+        maps use it.
+
+        Returns:
+            Dict[Path, Union[TiledMap, World]]: The maps and worlds which were
+                reloaded successfully.
+        """
+        versions: Dict[str, _Version] = {}
+        changed: List[Path] = []
+        for file, dependencies in self._dependencies.items():
+            for path, recorded in dependencies.items():
+                if path not in versions:
+                    versions[path] = self._version(path)
+                if versions[path] != recorded:
+                    changed.append(file)
+                    break
+
+        reloaded: Dict[Path, Loaded] = {}
+        for file in changed:
+            try:
+                value = self._load(file, self._loaders[file])
+            except Exception as error:
+                self.errors[file] = error
+                # Wait for another change before trying again
+                dependencies = self._dependencies[file]
+                for path in dependencies:
+                    if path not in versions:
+                        versions[path] = self._version(path)
+                    dependencies[path] = versions[path]
+                continue
+
+            reloaded[file] = value
+            if self.on_reload is not None:
+                self.on_reload(file, value)
+
+        return reloaded
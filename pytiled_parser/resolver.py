@@ -0,0 +1,227 @@
+"""Resolvers control how the files referenced by a map are read.
+
+A map will often reference other files, such as external tilesets, object templates,
+and the tilesets used by those templates, and a world may match map files by a
+pattern. By default these are all read from the filesystem, relative to the file which
+references them. Passing a different resolver to the parse functions allows entire
+levels to be loaded from memory or from an archive without any filesystem I/O.
+
+A resolver may be any callable which takes a `Path` and returns the contents of that
+file as bytes, or a subclass of [Resolver][pytiled_parser.resolver.Resolver] for more
+control over directory listings and caching.
+"""
+
+import hashlib
+import os
+import posixpath
+from pathlib import Path, PurePosixPath
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+class FileStamp(NamedTuple):
+    """Identifies a version of a file for caching.
+
+    Attributes:
+        key: Uniquely identifies the file.
+        version: Changes whenever the contents of the file changes.
+        size: The size of the file in bytes.
+    """
+
+    key: Hashable
+    version: Hashable
+    size: int
+
+
+class Resolver:
+    """Base class for resolvers.
+
+    Subclasses must implement `read`. Implementing `list_dir` is only required for
+    loading worlds which use patterns, and implementing `key` and `stamp` allows the
+    parsed results to be shared through the caches in [pytiled_parser.cache][].
+    """
+
+    def read(self, path: Path) -> bytes:
+        """Read the entire contents of a file.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            bytes: The contents of the file.
+        """
+        raise NotImplementedError
+
+    def list_dir(self, path: Path) -> List[str]:
+        """List the names of the files within a directory.
+
+        Args:
+            path: Path to the directory.
+
+        Returns:
+            List[str]: The names of the files, not including sub-directories.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support listing directories."
+        )
+
+    def key(self, path: Path) -> Optional[Hashable]:
+        """Identify a file, regardless of its version.
+
+        This is the `key` of the stamps of the file, and is how entries for it are
+        found in the caches.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            Optional[Hashable]: The key of the file, or None if it can't be cached.
+        """
+        return None
+
+    def stamp(self, path: Path) -> Optional[FileStamp]:
+        """Identify the current version of a file.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            Optional[FileStamp]: The stamp for the file, or None if it can't be cached.
+        """
+        return None
+
+
+class FileSystemResolver(Resolver):
+    """Reads files from the filesystem. This is the default resolver."""
+
+    def read(self, path: Path) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    def list_dir(self, path: Path) -> List[str]:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+
+    def key(self, path: Path) -> Optional[Hashable]:
+        return os.path.realpath(path)
+
+    def stamp(self, path: Path) -> Optional[FileStamp]:
+        real_path = os.path.realpath(path)
+        try:
+            stat = os.stat(real_path)
+        except OSError:
+            return None
+        return FileStamp(real_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _normalize(path: Union[str, Path]) -> str:
+    return posixpath.normpath(PurePosixPath(Path(path)).as_posix())
+
+
+class MemoryResolver(Resolver):
+    """Reads files from a mapping of paths to their contents.
+
+    Paths are normalized, so a reference to `"maps/../tilesets/terrain.tsx"` will
+    resolve to a file stored as `"tilesets/terrain.tsx"`.
+
+    Files are versioned in the caches by a digest of their contents, so files with
+    the same path and contents are shared between memory resolvers, and a file whose
+    contents change is parsed again.
+
+    Args:
+        files: Mapping of paths to the contents of each file.
+    """
+
+    def __init__(self, files: Mapping[Union[str, Path], Union[bytes, str]]):
+        self.files: Dict[str, bytes] = {}
+        for path, data in files.items():
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            self.files[_normalize(path)] = data
+        # The contents each digest was computed from, by path
+        self._digests: Dict[str, Tuple[bytes, str]] = {}
+
+    def read(self, path: Path) -> bytes:
+        try:
+            return self.files[_normalize(path)]
+        except KeyError:
+            raise FileNotFoundError(f"No such file in memory: '{path}'")
+
+    def list_dir(self, path: Path) -> List[str]:
+        directory = _normalize(path)
+        return [
+            posixpath.basename(name)
+            for name in self.files
+            if posixpath.dirname(name) == ("" if directory == "." else directory)
+        ]
+
+    def key(self, path: Path) -> Optional[Hashable]:
+        return ("memory", _normalize(path))
+
+    def stamp(self, path: Path) -> Optional[FileStamp]:
+        name = _normalize(path)
+        data = self.files.get(name)
+        if data is None:
+            return None
+        digest = self._digests.get(name)
+        if digest is None or digest[0] is not data:
+            digest = self._digests[name] = (data, hashlib.sha1(data).hexdigest())
+        return FileStamp(("memory", name), digest[1], len(data))
+
+
+class CallbackResolver(Resolver):
+    """Adapts a plain function to the Resolver interface.
+
+    Results loaded through a callback are never cached, as there is no way to tell if
+    the contents of a file has changed.
+
+    Args:
+        read: Function which returns the contents of a file.
+        list_dir: Optional function which lists the files within a directory.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[Path], bytes],
+        list_dir: Optional[Callable[[Path], List[str]]] = None,
+    ):
+        self._read = read
+        self._list_dir = list_dir
+
+    def read(self, path: Path) -> bytes:
+        return self._read(path)
+
+    def list_dir(self, path: Path) -> List[str]:
+        if self._list_dir is None:
+            return super().list_dir(path)
+        return self._list_dir(path)
+
+
+ResolverLike = Union[Resolver, Callable[[Path], bytes]]
+
+default_resolver = FileSystemResolver()
+
+
+def get_resolver(resolver: Optional[ResolverLike] = None) -> Resolver:
+    """Get a Resolver for any of the values accepted by the parse functions.
+
+    Args:
+        resolver: A Resolver, a function which reads a file, or None for the default.
+
+    Returns:
+        Resolver: The resolver to use.
+    """
+    if resolver is None:
+        return default_resolver
+    if isinstance(resolver, Resolver):
+        return resolver
+    return CallbackResolver(resolver)
@@ -0,0 +1,433 @@
+"""Compact binary snapshots of parsed maps, and an on-disk cache built on them.
+
+A snapshot holds a fully parsed [TiledMap][pytiled_parser.tiled_map.TiledMap]. The
+tile data of every tile layer and chunk is stored as a raw array of 32 bit global tile
+IDs, and everything else is pickled. Loading a snapshot is therefore far cheaper than
+parsing the original TMX or JSON files.
+
+Snapshots begin with a header holding a format version and a fingerprint of the
+pytiled-parser classes they contain, so snapshots written by a different version of
+the library are rejected rather than loaded incorrectly. They also carry a manifest of
+the dependencies of the map, which is every file read while parsing it along with the
+version of that file, which is used to tell whether a cached snapshot is still current.
+
+The header holds a SHA-256 digest of the manifest and of the map, and each is checked
+before it is unpickled, so truncated or corrupted snapshots are rejected. Unpickling
+is restricted to the classes which make up a parsed map, so loading a snapshot cannot
+call arbitrary functions. The digests are not signed though, so anyone able to write
+to the cache directory given to `parse_map` can still change the maps loaded from it.
+"""
+
+import copyreg
+import hashlib
+import io
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import attr
+
+from pytiled_parser import (
+    common_types,
+    layer,
+    properties,
+    tiled_map,
+    tiled_object,
+    tileset,
+    wang_set,
+)
+from pytiled_parser.context import ParseContext
+from pytiled_parser.layer import Chunk, TileLayer
+from pytiled_parser.resolver import FileStamp, Resolver
+from pytiled_parser.tiled_map import TiledMap
+
+SNAPSHOT_MAGIC = b"PTSNAP\r\n"
+
+# Increase this whenever the layout of a snapshot changes.
+SNAPSHOT_VERSION = 2
+
+# Little endian: magic, format version, fingerprint of the classes, manifest length,
+# and the SHA-256 digests of the manifest and the map
+_HEADER = struct.Struct("<8sI20sQ32s32s")
+
+_GID_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# The modules whose classes can appear in a map
+_MAP_MODULES = (
+    common_types,
+    layer,
+    properties,
+    tiled_map,
+    tiled_object,
+    tileset,
+    wang_set,
+)
+
+
+def _fingerprint() -> bytes:
+    """Hash the names and fields of every attrs class that can appear in a map."""
+    digest = hashlib.sha1(sys.byteorder.encode("ascii"))
+    for module in _MAP_MODULES:
+        for name in sorted(vars(module)):
+            value = getattr(module, name)
+            if isinstance(value, type) and attr.has(value):
+                fields = ",".join(field.name for field in attr.fields(value))
+                # Slotted and dict backed classes are pickled differently
+                slots = "slots" if "__slots__" in vars(value) else "dict"
+                digest.update(
+                    f"{module.__name__}.{name}({fields}){slots}".encode("utf-8")
+                )
+    return digest.digest()
+
+
+_FINGERPRINT = _fingerprint()
+
+# The classes and functions which unpickling a snapshot may use
+_ALLOWED_GLOBALS = {
+    (module.__name__, name)
+    for module in _MAP_MODULES
+    for name, value in vars(module).items()
+    if isinstance(value, type) and value.__module__ == module.__name__
+} | {
+    (__name__, "_restore"),
+    (__name__, "Dependency"),
+    ("pathlib", "Path"),
+    ("pathlib", "PosixPath"),
+    ("pathlib", "PurePosixPath"),
+    ("pathlib", "PureWindowsPath"),
+    ("pathlib", "WindowsPath"),
+    ("builtins", "bool"),
+    ("builtins", "bytearray"),
+    ("builtins", "bytes"),
+    ("builtins", "complex"),
+    ("builtins", "dict"),
+    ("builtins", "float"),
+    ("builtins", "frozenset"),
+    ("builtins", "int"),
+    ("builtins", "list"),
+    ("builtins", "set"),
+    ("builtins", "str"),
+    ("builtins", "tuple"),
+}
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickles snapshots, refusing any global which can't be part of a map."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(f"Snapshots cannot contain {module}.{name}")
+        return super().find_class(module, name)
+
+
+def _unpickle(data: memoryview, digest: bytes) -> Any:
+    """Check the digest of a section of a snapshot, and unpickle it."""
+    if hashlib.sha256(data).digest() != digest:
+        raise ValueError("Snapshot is corrupted")
+    return _SnapshotUnpickler(io.BytesIO(data)).load()
+
+
+class Dependency(NamedTuple):
+    """A file which was read while parsing a map.
+
+    Attributes:
+        path: The path the file was requested with.
+        version: The version from the stamp of the file, if the resolver provided one.
+        size: The size of the file in bytes, if known.
+        digest: A hash of the contents of the file, if it was read.
+    """
+
+    path: str
+    version: Optional[Hashable]
+    size: Optional[int]
+    digest: Optional[bytes]
+
+
+class RecordingResolver(Resolver):
+    """Wraps a resolver and records every file requested through it.
+
+    Files served from the tileset and template caches are only stamped, not read, so
+    both reads and stamps are recorded. Listed directories are recorded as well.
+
+    Args:
+        resolver: The resolver to read files with.
+    """
+
+    def __init__(self, resolver: Resolver):
+        self.resolver = resolver
+        self.dependencies: Dict[str, Dependency] = {}
+
+    def _record(self, path: Path, data: Optional[bytes]) -> Optional[FileStamp]:
+        stamp = self.resolver.stamp(path)
+        previous = self.dependencies.get(str(path))
+        digest = previous.digest if previous is not None else None
+        if data is not None:
+            digest = hashlib.sha1(data).digest()
+        self.dependencies[str(path)] = Dependency(
+            str(path),
+            stamp.version if stamp is not None else None,
+            stamp.size if stamp is not None else None,
+            digest,
+        )
+        return stamp
+
+    def read(self, path: Path) -> bytes:
+        data = self.resolver.read(path)
+        self._record(path, data)
+        return data
+
+    def list_dir(self, path: Path) -> List[str]:
+        self._record(path, None)
+        return self.resolver.list_dir(path)
+
+    def stamp(self, path: Path) -> Optional[FileStamp]:
+        return self._record(path, None)
+
+
+def _is_current(dependency: Dependency, resolver: Resolver) -> bool:
+    """Check if a dependency has not changed since it was recorded.
+
+    The stamp of the file is compared first, and the contents of the file are only
+    hashed if that differs.
+    """
+    path = Path(dependency.path)
+    stamp = resolver.stamp(path)
+    if (
+        stamp is not None
+        and dependency.version is not None
+        and (stamp.version, stamp.size) == (dependency.version, dependency.size)
+    ):
+        return True
+
+    if dependency.digest is None:
+        return False
+
+    try:
+        data = resolver.read(path)
+    except OSError:
+        return False
+    return hashlib.sha1(data).digest() == dependency.digest
+
+
+def _pack_grid(grid: List[List[int]]) -> Optional[Tuple[int, bytes]]:
+    """Pack a rectangular grid of tile IDs into a raw array."""
+    width = len(grid[0]) if grid else 0
+    if any(len(row) != width for row in grid):
+        return None
+    packed = array(_GID_TYPECODE)
+    for row in grid:
+        packed.extend(row)
+    return width, packed.tobytes()
+
+
+def _unpack_grid(width: int, data: bytes) -> List[List[int]]:
+    packed = array(_GID_TYPECODE)
+    packed.frombytes(data)
+    values = packed.tolist()
+    return [values[start : start + width] for start in range(0, len(values), width)]
+
+
+def _restore(
+    cls: type, fields: Dict[str, Any], grid: Optional[Tuple[int, bytes]]
+) -> Any:
+    if grid is not None:
+        fields["data"] = _unpack_grid(*grid)
+    return cls(**fields)
+
+
+def _reduce_with_grid(value: Any) -> Any:
+    """Pickle a TileLayer or Chunk with its tile data as a raw array."""
+    fields = {
+        field.name: getattr(value, field.name) for field in attr.fields(type(value))
+    }
+    grid = None
+    if fields["data"] is not None:
+        grid = _pack_grid(fields["data"])
+        if grid is not None:
+            del fields["data"]
+    return _restore, (type(value), fields, grid)
+
+
+def dump_map(
+    tiled_map: TiledMap, dependencies: Optional[List[Dependency]] = None
+) -> bytes:
+    """Serialize a parsed map into a snapshot.
+
+    Args:
+        tiled_map: The map to serialize.
+        dependencies: The files the map was parsed from, used to validate cached
+            snapshots.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    manifest = pickle.dumps(dependencies or [], pickle.HIGHEST_PROTOCOL)
+
+    payload = io.BytesIO()
+    pickler = pickle.Pickler(payload, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()  # type: ignore
+    pickler.dispatch_table[TileLayer] = _reduce_with_grid  # type: ignore
+    pickler.dispatch_table[Chunk] = _reduce_with_grid  # type: ignore
+    pickler.dump(tiled_map)
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        _FINGERPRINT,
+        len(manifest),
+        hashlib.sha256(manifest).digest(),
+        hashlib.sha256(payload.getbuffer()).digest(),
+    )
+    return header + manifest + payload.getvalue()
+
+
+def _read_header(data: bytes) -> Tuple[memoryview, bytes, memoryview, bytes]:
+    """Validate the header of a snapshot, and split it into its sections.
+
+    Returns:
+        Tuple[memoryview, bytes, memoryview, bytes]: The manifest and its digest,
+            followed by the pickled map and its digest.
+
+    Raises:
+        ValueError: If the data is not a snapshot from this version of pytiled-parser.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Data is too short to be a snapshot")
+    (
+        magic,
+        version,
+        fingerprint,
+        manifest_length,
+        manifest_digest,
+        payload_digest,
+    ) = _HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Data is not a pytiled-parser snapshot")
+    if version != SNAPSHOT_VERSION or fingerprint != _FINGERPRINT:
+        raise ValueError(
+            "Snapshot was written by a different version of pytiled-parser"
+        )
+
+    view = memoryview(data)
+    payload_start = _HEADER.size + manifest_length
+    return (
+        view[_HEADER.size : payload_start],
+        manifest_digest,
+        view[payload_start:],
+        payload_digest,
+    )
+
+
+def read_dependencies(data: bytes) -> List[Dependency]:
+    """Read the dependencies recorded in a snapshot, without loading the map.
+
+    Args:
+        data: The snapshot.
+
+    Returns:
+        List[Dependency]: The files the map was parsed from.
+
+    Raises:
+        ValueError: If the data is not a valid snapshot.
+        pickle.UnpicklingError: If the manifest holds anything but dependencies.
+    """
+    manifest, manifest_digest, _, _ = _read_header(data)
+    return _unpickle(manifest, manifest_digest)
+
+
+def load_map(data: bytes) -> TiledMap:
+    """Load a map from a snapshot.
+
+    Args:
+        data: The snapshot.
+
+    Returns:
+        TiledMap: The map which was serialized.
+
+    Raises:
+        ValueError: If the data is not a valid snapshot.
+        pickle.UnpicklingError: If the snapshot holds anything but a map.
+    """
+    _, _, payload, payload_digest = _read_header(data)
+    return _unpickle(payload, payload_digest)
+
+
+def cache_path(
+    cache_dir: Path, file: Path, encoding: str, context: ParseContext
+) -> Path:
+    """Get the path within a cache directory that a map's snapshot is stored at.
+
+    Args:
+        cache_dir: The cache directory.
+        file: Path to the map file.
+        encoding: The character encoding set the map is parsed with.
+        context: The context the map is parsed with.
+
+    Returns:
+        Path: The path of the snapshot.
+    """
+    stamp = context.resolver.stamp(file)
+    identity = stamp.key if stamp is not None else str(file)
+    key = repr((identity, encoding, context.cache_key()))
+    return Path(cache_dir) / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".ptsnap")
+
+
+def load_cached_map(
+    file: Path,
+    encoding: str,
+    context: ParseContext,
+    cache_dir: Path,
+    parse: Callable[[bytes, Path, str, ParseContext], TiledMap],
+) -> TiledMap:
+    """Load a map from the cache directory, parsing and caching it if needed.
+
+    Args:
+        file: Path to the map file.
+        encoding: The character encoding set to use when decoding files.
+        context: The context to parse the map with.
+        cache_dir: The cache directory.
+        parse: Parses the contents of the map file.
+
+    Returns:
+        TiledMap: The parsed map.
+    """
+    if context.layer_filter is not None and context.layer_filter.predicate is not None:
+        # A predicate can't be recognised again by a later process, so maps parsed
+        # with one are never cached
+        return parse(context.resolver.read(file), file, encoding, context)
+
+    snapshot_path = cache_path(cache_dir, file, encoding, context)
+
+    try:
+        with open(snapshot_path, "rb") as snapshot_file:
+            snapshot = snapshot_file.read()
+        dependencies = read_dependencies(snapshot)
+        if dependencies and all(
+            _is_current(dependency, context.resolver) for dependency in dependencies
+        ):
+            return load_map(snapshot)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        pass
+
+    recorder = RecordingResolver(context.resolver)
+    tiled_map = parse(
+        recorder.read(file), file, encoding, attr.evolve(context, resolver=recorder)
+    )
+
+    os.makedirs(cache_dir, exist_ok=True)
+    snapshot = dump_map(tiled_map, list(recorder.dependencies.values()))
+    descriptor, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            snapshot_file.write(snapshot)
+        os.replace(temporary_path, snapshot_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+    return tiled_map
@@ -0,0 +1,247 @@
+"""Streaming of the maps within a world based on the position of a camera.
+
+A [WorldStreamer][pytiled_parser.streaming.WorldStreamer] keeps the maps of a world
+that are visible to a camera loaded, along with the maps adjacent to those. Visible
+maps are loaded immediately, while adjacent maps are prefetched in background threads
+so that they are usually ready by the time the camera reaches them. Maps which are
+no longer visible or adjacent are evicted, least recently used first, once the loaded
+maps exceed a memory budget:
+
+    streamer = WorldStreamer(parse_world(Path("overworld.world")))
+
+    while running:
+        streamer.update(camera.x, camera.y, camera.width, camera.height)
+        for world_map, tiled_map in streamer.visible_maps():
+            draw(tiled_map, world_map.coordinates)
+
+As with the caches in [pytiled_parser.cache][], the memory budget is measured in bytes
+of the source map files, as a cheap proxy for the size of the parsed maps.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from pytiled_parser.parser import parse_map
+from pytiled_parser.resolver import ResolverLike, get_resolver
+from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.world import World, WorldMap
+
+
+class WorldStreamer:
+    """Keeps the maps of a world near a camera loaded.
+
+    Args:
+        world: The world to stream the maps of.
+        encoding: The character encoding set to use when opening the files.
+        resolver: Reads the maps and every file they reference. Defaults to reading
+            from the filesystem.
+        cache_dir: Optional directory to cache snapshots of parsed maps in, see
+            [parse_map][pytiled_parser.parser.parse_map].
+        max_bytes: The memory budget for loaded maps, measured in bytes of the map
+            files. Visible and adjacent maps are kept loaded even when they exceed it.
+        workers: The number of threads to prefetch adjacent maps with.
+
+    Attributes:
+        hits: The number of visible maps which were already loaded when needed.
+        misses: The number of visible maps which had to be loaded, or waited for.
+        prefetches: The number of maps loaded in the background.
+        evictions: The number of maps which were unloaded.
+        loads: The number of maps which have been loaded.
+        total_load_time: The total time spent loading maps, in seconds.
+        max_load_time: The longest time spent loading a single map, in seconds.
+    """
+
+    def __init__(
+        self,
+        world: World,
+        encoding: str = "utf-8",
+        resolver: Optional[ResolverLike] = None,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        workers: int = 2,
+    ):
+        self.world = world
+        self.encoding = encoding
+        self.resolver = get_resolver(resolver)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.prefetches = 0
+        self.evictions = 0
+        self.loads = 0
+        self.total_load_time = 0.0
+        self.max_load_time = 0.0
+
+        self._loaded: "OrderedDict[Path, Tuple[TiledMap, int]]" = OrderedDict()
+        self._pending: Dict[Path, Future] = {}
+        self._total_bytes = 0
+        self._visible: List[WorldMap] = []
+        self._keep: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> "WorldStreamer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the background threads, waiting for any prefetches to finish."""
+        self._executor.shutdown(wait=True)
+
+    @property
+    def total_bytes(self) -> int:
+        """The approximate size of the loaded maps, in bytes of the map files."""
+        return self._total_bytes
+
+    @property
+    def average_load_time(self) -> float:
+        """The average time spent loading a map, in seconds."""
+        if not self.loads:
+            return 0.0
+        return self.total_load_time / self.loads
+
+    def _load(self, file: Path) -> TiledMap:
+        start = time.perf_counter()
+        try:
+            tiled_map = parse_map(file, self.encoding, self.resolver, self.cache_dir)
+        except BaseException:
+            with self._lock:
+                self._pending.pop(file, None)
+            raise
+        elapsed = time.perf_counter() - start
+
+        stamp = self.resolver.stamp(file)
+        size = stamp.size if stamp is not None else 0
+
+        with self._lock:
+            self.loads += 1
+            self.total_load_time += elapsed
+            self.max_load_time = max(self.max_load_time, elapsed)
+            self._pending.pop(file, None)
+            if file not in self._loaded:
+                self._loaded[file] = (tiled_map, size)
+                self._total_bytes += size
+            self._evict()
+
+        return tiled_map
+
+    def _prefetch(self, file: Path) -> TiledMap:
+        tiled_map = self._load(file)
+        with self._lock:
+            self.prefetches += 1
+        return tiled_map
+
+    def _evict(self) -> None:
+        for file in list(self._loaded):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if file in self._keep:
+                continue
+            _, size = self._loaded.pop(file)
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def update(self, x: float, y: float, width: float, height: float) -> None:
+        """Move the camera, loading the maps it can see and prefetching their neighbors.
+
+        Args:
+            x: The left edge of the camera, in world pixels.
+            y: The top edge of the camera, in world pixels.
+            width: The width of the camera, in pixels.
+            height: The height of the camera, in pixels.
+        """
+        visible = self.world.maps_in_rect(x, y, width, height)
+        visible_files = {world_map.map_file for world_map in visible}
+        adjacent: Dict[Path, WorldMap] = {}
+        for world_map in visible:
+            for neighbor in self.world.neighbors(world_map):
+                if neighbor.map_file not in visible_files:
+                    adjacent[neighbor.map_file] = neighbor
+
+        waiting: List[Future] = []
+        loading: List[Tuple[Path, Future]] = []
+        with self._lock:
+            self._visible = visible
+            self._keep = visible_files | set(adjacent)
+
+            for world_map in visible:
+                file = world_map.map_file
+                if file in self._loaded:
+                    self._loaded.move_to_end(file)
+                    self.hits += 1
+                elif file in self._pending:
+                    waiting.append(self._pending[file])
+                    self.misses += 1
+                else:
+                    # Registered as pending so that other updates wait for this load
+                    # rather than starting their own
+                    future: Future = Future()
+                    self._pending[file] = future
+                    loading.append((file, future))
+                    self.misses += 1
+
+            for file in adjacent:
+                if file in self._loaded:
+                    self._loaded.move_to_end(file)
+                elif file not in self._pending:
+                    self._pending[file] = self._executor.submit(self._prefetch, file)
+
+            self._evict()
+
+        # Every registered load is finished before an error is raised, so that no
+        # future is left pending for later updates to wait on forever
+        error: Optional[BaseException] = None
+        for file, future in loading:
+            try:
+                future.set_result(self._load(file))
+            except BaseException as load_error:
+                future.set_exception(load_error)
+                if error is None:
+                    error = load_error
+        if error is not None:
+            raise error
+        for future in waiting:
+            future.result()
+
+    def get(self, world_map: WorldMap) -> Optional[TiledMap]:
+        """Get a map if it is loaded.
+
+        Args:
+            world_map: The map within the world.
+
+        Returns:
+            Optional[TiledMap]: The map, or None if it is not loaded.
+        """
+        with self._lock:
+            loaded = self._loaded.get(world_map.map_file)
+        if loaded is None:
+            return None
+        return loaded[0]
+
+    def visible_maps(self) -> List[Tuple[WorldMap, TiledMap]]:
+        """Get the maps which were visible to the camera at the last update.
+
+        Returns:
+            List[Tuple[WorldMap, TiledMap]]: Each visible map, and its parsed map.
+        """
+        with self._lock:
+            return [
+                (world_map, self._loaded[world_map.map_file][0])
+                for world_map in self._visible
+                if world_map.map_file in self._loaded
+            ]
+
+    def wait(self) -> None:
+        """Wait for every prefetch which is in progress to finish."""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result()
@@ -9,7 +9,7 @@ from . import properties as properties_
 from .common_types import Color, OrderedPair, Size
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class TiledObject:
     """TiledObject object.
 
@@ -42,7 +42,7 @@ class TiledObject:
     properties: properties_.Properties = {}
 
 
-@attr.s()
+@attr.s(slots=True)
 class Ellipse(TiledObject):
     """Elipse shape defined by a point, width, height, and rotation.
 
@@ -50,7 +50,7 @@ class Ellipse(TiledObject):
     """
 
 
-@attr.s()
+@attr.s(slots=True)
 class Point(TiledObject):
     """Point defined by a coordinate (x,y).
 
@@ -58,7 +58,7 @@ class Point(TiledObject):
     """
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Polygon(TiledObject):
     """Polygon shape defined by a set of connections between points.
 
@@ -71,7 +71,7 @@ class Polygon(TiledObject):
     points: List[OrderedPair]
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Polyline(TiledObject):
     """Polyline defined by a set of connections between points.
 
@@ -85,7 +85,7 @@ class Polyline(TiledObject):
     points: List[OrderedPair]
 
 
-@attr.s()
+@attr.s(slots=True)
 class Rectangle(TiledObject):
     """Rectangle shape defined by a point, width, and height.
 
@@ -95,7 +95,7 @@ class Rectangle(TiledObject):
     """
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Text(TiledObject):
     """Text object with associated settings.
 
@@ -135,7 +135,7 @@ class Text(TiledObject):
     wrap: bool = False
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Tile(TiledObject):
     """Tile object
 
@@ -60,7 +60,7 @@ class Frame(NamedTuple):
     duration: int
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Transformations:
     """Transformations Object.
 
@@ -86,7 +86,7 @@ class Transformations:
     prefer_untransformed: bool = False
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Tile:
     """Individual tile object.
 
@@ -137,7 +137,7 @@ class Tile:
     flipped_vertically: bool = False
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Tileset:
     """A Tileset is a collection of tiles.
 
@@ -1,11 +1,19 @@
 """Utility Functions for PyTiled"""
 
-import json
+import codecs
 import xml.etree.ElementTree as etree
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional, Tuple
 
+from pytiled_parser.backends import (
+    JSONBackendLike,
+    XMLBackendLike,
+    get_json_backend,
+    get_xml_backend,
+)
+from pytiled_parser.cache import template_cache
 from pytiled_parser.common_types import Color
+from pytiled_parser.resolver import Resolver, default_resolver
 
 
 def parse_color(color: str) -> Color:
@@ -37,50 +45,257 @@ def parse_color(color: str) -> Color:
     raise ValueError("Improperly formatted color passed to parse_color")
 
 
+# Extensions which Tiled uses for XML files, only consulted when the format can't be
+# determined from the contents of a file.
+XML_EXTENSIONS = {".tmx", ".tsx", ".tx", ".xml"}
+
+# Byte order marks, which take precedence over the given encoding. The UTF-32 marks
+# begin with the UTF-16 ones, so are checked first.
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+
+def sniff_format(
+    data: bytes, file_path: Optional[Path] = None, encoding: str = "utf-8"
+) -> str:
+    """Determine the format of a Tiled file from its contents.
+
+    The first non-whitespace character is used to tell XML and JSON apart. If the
+    contents are empty, the file extension is used instead.
+
+    Args:
+        data: The raw contents of the file.
+        file_path: Path to the file, used for its extension.
+        encoding: The character encoding set to decode the contents with, unless
+            they begin with a byte order mark.
+
+    Returns:
+        str: Either "tmx" or "json".
+    """
+    head = data[:64]
+    for bom, bom_encoding in _BOMS:
+        if head.startswith(bom):
+            head = head[len(bom) :]
+            encoding = bom_encoding
+            break
+    start = head.decode(encoding, errors="ignore").lstrip(" \t\r\n")
+    if start[:1] == "<":
+        return "tmx"
+    if start or file_path is None:
+        return "json"
+
+    if file_path.suffix.lower() in XML_EXTENSIONS:
+        return "tmx"
+    return "json"
+
+
 def check_format(file_path: Path, encoding: str) -> str:
-    with open(file_path, encoding=encoding) as file:
-        line = file.readline().rstrip().strip()
-        if line[0] == "<":
-            return "tmx"
-        else:
-            return "json"
+    """Determine the format of a Tiled file on disk.
 
+    Reads the file and passes its contents to
+    [sniff_format][pytiled_parser.util.sniff_format].
 
-def load_object_template(file_path: Path, encoding: str) -> Any:
-    template_format = check_format(file_path, encoding)
+    Args:
+        file_path: Path to the file.
+        encoding: The character encoding set to decode the contents with.
 
-    new_tileset = None
-    new_tileset_path = None
+    Returns:
+        str: Either "tmx" or "json".
+    """
+    with open(file_path, "rb") as file:
+        return sniff_format(file.read(), file_path, encoding)
 
-    if template_format == "tmx":
-        with open(file_path, encoding=encoding) as template_file:
-            template = etree.parse(template_file).getroot()
 
-            tileset_element = template.find("./tileset")
-            if tileset_element is not None:
-                tileset_path = Path(file_path.parent / tileset_element.attrib["source"])
-                new_tileset = load_object_tileset(tileset_path, encoding)
-                new_tileset_path = tileset_path.parent
-    else:
-        with open(file_path, encoding=encoding) as template_file:
-            template = json.load(template_file)
-            if "tileset" in template:
-                tileset_path = Path(file_path.parent / template["tileset"]["source"])  # type: ignore
-                new_tileset = load_object_tileset(tileset_path, encoding)
-                new_tileset_path = tileset_path.parent
+def parse_xml(
+    data: bytes, encoding: str, backend: Optional[XMLBackendLike] = None
+) -> etree.Element:
+    """Parse raw XML contents into an Element.
 
-    return (template, new_tileset, new_tileset_path)
+    Args:
+        data: The raw contents of the file.
+        encoding: The character encoding set to decode the contents with.
+        backend: The XML backend to use, defaults to the global default.
+
+    Returns:
+        etree.Element: The root element.
+    """
+    return get_xml_backend(backend).fromstring(data, encoding)
+
+
+def iterparse_xml(
+    data: bytes, encoding: str, backend: Optional[XMLBackendLike] = None
+) -> Iterator[Tuple[str, etree.Element]]:
+    """Parse raw XML contents incrementally, yielding each element as it is read.
+
+    See [XMLBackend.iterparse][pytiled_parser.backends.XMLBackend.iterparse].
+
+    Args:
+        data: The raw contents of the file.
+        encoding: The character encoding set to decode the contents with.
+        backend: The XML backend to use, defaults to the global default.
+
+    Yields:
+        Tuple[str, etree.Element]: A "start" event for each element once its
+            attributes have been read, and an "end" event once its children have.
+    """
+    return get_xml_backend(backend).iterparse(data, encoding)
+
+
+def parse_json(
+    data: bytes, encoding: str, backend: Optional[JSONBackendLike] = None
+) -> Any:
+    """Parse raw JSON contents.
+
+    Args:
+        data: The raw contents of the file.
+        encoding: The character encoding set to decode the contents with.
+        backend: The JSON backend to use, defaults to the global default.
 
+    Returns:
+        The decoded JSON document.
+
+    Raises:
+        ValueError: If the contents are not valid JSON.
+    """
+    return get_json_backend(backend).loads(data, encoding)
+
+
+def iterparse_json(
+    data: bytes,
+    encoding: str,
+    stream_key: str,
+    backend: Optional[JSONBackendLike] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """Parse a raw JSON object incrementally, yielding its members one at a time.
+
+    See [JSONBackend.iterparse][pytiled_parser.backends.JSONBackend.iterparse].
+
+    Args:
+        data: The raw contents of the file.
+        encoding: The character encoding set to decode the contents with.
+        stream_key: The key of the array whose items are yielded individually.
+        backend: The JSON backend to use, defaults to the global default.
+
+    Yields:
+        Tuple[str, Any]: The key and decoded value of each member, or item.
+
+    Raises:
+        ValueError: If the contents are not a valid JSON object.
+    """
+    return get_json_backend(backend).iterparse(data, encoding, stream_key)
+
+
+def load_file(
+    file_path: Path,
+    encoding: str,
+    resolver: Resolver = default_resolver,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+) -> Tuple[str, Any]:
+    """Read a Tiled file once and parse it with the parser for its format.
+
+    Args:
+        file_path: Path to the file.
+        encoding: The character encoding set to use when decoding the file.
+        resolver: The resolver to read the file through.
+        json_backend: The JSON backend to use, defaults to the global default.
+        xml_backend: The XML backend to use, defaults to the global default.
+
+    Returns:
+        A tuple of the format ("tmx" or "json"), and the root XML Element or JSON
+            document.
 
-def load_object_tileset(file_path: Path, encoding: str) -> Any:
-    tileset_format = check_format(file_path, encoding)
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    data = resolver.read(file_path)
+    file_format = sniff_format(data, file_path, encoding)
+
+    if file_format == "tmx":
+        return file_format, parse_xml(data, encoding, xml_backend)
+    return file_format, parse_json(data, encoding, json_backend)
+
+
+def _raw_cache_key(
+    encoding: str,
+    json_backend: Optional[JSONBackendLike],
+    xml_backend: Optional[XMLBackendLike],
+) -> Tuple[str, str, str]:
+    # Raw files are cached as the values decoded by the backends
+    return (
+        encoding,
+        get_json_backend(json_backend).name,
+        get_xml_backend(xml_backend).name,
+    )
+
+
+def load_object_template(
+    file_path: Path,
+    encoding: str,
+    resolver: Resolver = default_resolver,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+) -> Any:
+    """Load an object template along with the tileset it references, if any.
+
+    Both the template and its tileset are kept in the process-wide template cache,
+    so they are shared between every object and map using them and must not be
+    modified.
+
+    Args:
+        file_path: Path to the template file.
+        encoding: The character encoding set to use when opening the file.
+        resolver: The resolver to read the template and tileset through.
+        json_backend: The JSON backend to use, defaults to the global default.
+        xml_backend: The XML backend to use, defaults to the global default.
+
+    Returns:
+        A tuple of the raw template, the raw tileset, and the directory of the tileset.
+    """
+    template = template_cache.get_or_load(
+        file_path,
+        lambda: load_file(file_path, encoding, resolver, json_backend, xml_backend)[1],
+        _raw_cache_key(encoding, json_backend, xml_backend),
+        resolver,
+    )
 
     new_tileset = None
+    new_tileset_path = None
+
+    if isinstance(template, dict):
+        if "tileset" in template:
+            tileset_path = Path(file_path.parent / template["tileset"]["source"])
+            new_tileset = load_object_tileset(
+                tileset_path, encoding, resolver, json_backend, xml_backend
+            )
+            new_tileset_path = tileset_path.parent
+    else:
+        tileset_element = template.find("./tileset")
+        if tileset_element is not None:
+            tileset_path = Path(file_path.parent / tileset_element.attrib["source"])
+            new_tileset = load_object_tileset(
+                tileset_path, encoding, resolver, json_backend, xml_backend
+            )
+            new_tileset_path = tileset_path.parent
+
+    return (template, new_tileset, new_tileset_path)
 
-    with open(file_path, encoding=encoding) as tileset_file:
-        if tileset_format == "tmx":
-            new_tileset = etree.parse(tileset_file).getroot()
-        else:
-            new_tileset = json.load(tileset_file)
 
-    return new_tileset
+def load_object_tileset(
+    file_path: Path,
+    encoding: str,
+    resolver: Resolver = default_resolver,
+    json_backend: Optional[JSONBackendLike] = None,
+    xml_backend: Optional[XMLBackendLike] = None,
+) -> Any:
+    return template_cache.get_or_load(
+        file_path,
+        lambda: load_file(file_path, encoding, resolver, json_backend, xml_backend)[1],
+        _raw_cache_key(encoding, json_backend, xml_backend),
+        resolver,
+    )
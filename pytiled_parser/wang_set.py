@@ -14,7 +14,7 @@ from pytiled_parser.common_types import Color
 from pytiled_parser.properties import Properties
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class WangTile:
     """Defines a Wang tile by linking a tile in the tileset to a Wang ID.
 
@@ -33,7 +33,7 @@ class WangTile:
     wang_id: List[int]
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class WangColor:
     """A color that can be used to define the corner and/or edge of a Wang tile
 
@@ -58,7 +58,7 @@ class WangColor:
     properties: Optional[Properties] = None
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class WangSet:
     """A complete Wang Set defining a list of corner and edge
     [WangColors][pytiled_parser.wang_set.WangColor], and any number of
@@ -9,17 +9,19 @@ does not automatically load each map within the world, this is so that the game
 or engine implementation can decide how to handle map loading.
 """
 
-import json
+import math
 import re
-from os import listdir
-from os.path import isfile, join
+import statistics
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Match, Optional, Set, Tuple
 
 import attr
 from typing_extensions import TypedDict
 
+from pytiled_parser.cache import listing_cache
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.context import ParseContext, get_context
+from pytiled_parser.util import parse_json
 
 
 @attr.s(auto_attribs=True)
@@ -43,10 +45,119 @@ class WorldMap:
     coordinates: OrderedPair
 
 
+def _touches(
+    world_map: WorldMap, x: float, y: float, width: float, height: float
+) -> bool:
+    """Check if a map overlaps or shares an edge with a rectangle."""
+    return (
+        world_map.coordinates.x <= x + width
+        and x <= world_map.coordinates.x + world_map.size.width
+        and world_map.coordinates.y <= y + height
+        and y <= world_map.coordinates.y + world_map.size.height
+    )
+
+
+def _intersects(
+    world_map: WorldMap, x: float, y: float, width: float, height: float
+) -> bool:
+    """Check if a map overlaps a rectangle."""
+    return (
+        world_map.coordinates.x < x + width
+        and x < world_map.coordinates.x + world_map.size.width
+        and world_map.coordinates.y < y + height
+        and y < world_map.coordinates.y + world_map.size.height
+    )
+
+
+class _WorldIndex:
+    """A uniform grid over the maps of a world, and the adjacency between them.
+
+    The size of the cells is the median size of the maps, so for the common case of a
+    world made of equally sized maps on a grid each map occupies a single cell, and
+    looking up a point or a small rectangle only has to check a handful of maps.
+    """
+
+    def __init__(self, maps: List[WorldMap]):
+        self.maps = list(maps)
+
+        sizes = [world_map.size.width for world_map in maps]
+        sizes += [world_map.size.height for world_map in maps]
+        self.cell_size = max(statistics.median(sizes), 1) if sizes else 1
+
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for position, world_map in enumerate(self.maps):
+            for cell in self._cells(
+                world_map.coordinates.x,
+                world_map.coordinates.y,
+                world_map.size.width,
+                world_map.size.height,
+            ):
+                self.cells.setdefault(cell, []).append(position)
+
+        self.neighbors: Dict[Path, List[WorldMap]] = {}
+        for world_map in self.maps:
+            self.neighbors[world_map.map_file] = [
+                other
+                for other in self.query(
+                    *world_map.coordinates, *world_map.size, margin=1, touching=True
+                )
+                if other is not world_map
+            ]
+
+    def _cells(
+        self, x: float, y: float, width: float, height: float, margin: int = 0
+    ) -> Iterator[Tuple[int, int]]:
+        """Get the cells covered by a rectangle, treating its far edges as open."""
+        left = math.floor(x / self.cell_size) - margin
+        top = math.floor(y / self.cell_size) - margin
+        right = max(math.ceil((x + width) / self.cell_size) - 1, left) + margin
+        bottom = max(math.ceil((y + height) / self.cell_size) - 1, top) + margin
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                yield cell_x, cell_y
+
+    def query(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        margin: int = 0,
+        touching: bool = False,
+    ) -> List[WorldMap]:
+        """Find the maps which overlap, or also touch, a rectangle."""
+        test = _touches if touching else _intersects
+        found: Set[int] = set()
+        for cell in self._cells(x, y, width, height, margin):
+            found.update(self.cells.get(cell, ()))
+        return [
+            self.maps[position]
+            for position in sorted(found)
+            if test(self.maps[position], x, y, width, height)
+        ]
+
+    def at(self, x: float, y: float) -> Optional[WorldMap]:
+        """Find the first map containing a point."""
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        for position in self.cells.get(cell, ()):
+            world_map = self.maps[position]
+            left, top = world_map.coordinates
+            if (
+                left <= x < left + world_map.size.width
+                and top <= y < top + world_map.size.height
+            ):
+                return world_map
+        return None
+
+
 @attr.s(auto_attribs=True)
 class World:
     """Represents a world file.
 
+    A spatial index of the maps is built when the world is parsed, so that finding
+    the maps within an area, or the neighbors of a map, does not have to check every
+    map in the world. If `maps` is modified afterwards, call `build_index` to update it.
+
     Attributes:
         maps: The list of maps within the world. These are not fully parsed
             TiledMap objects, but rather WorldMap objects which can be used
@@ -60,6 +171,67 @@ class World:
     maps: List[WorldMap]
     only_show_adjacent: bool = False
 
+    _index: Optional[_WorldIndex] = attr.ib(
+        default=None, init=False, eq=False, repr=False
+    )
+
+    def build_index(self) -> None:
+        """Build the spatial index and adjacency of the maps within the world."""
+        self._index = _WorldIndex(self.maps)
+
+    def _get_index(self) -> _WorldIndex:
+        if self._index is None:
+            self.build_index()
+        return self._index  # type: ignore
+
+    def maps_in_rect(
+        self, x: float, y: float, width: float, height: float
+    ) -> List[WorldMap]:
+        """Find the maps which overlap a rectangle.
+
+        Args:
+            x: The left edge of the rectangle, in world pixels.
+            y: The top edge of the rectangle, in world pixels.
+            width: The width of the rectangle, in pixels.
+            height: The height of the rectangle, in pixels.
+
+        Returns:
+            List[WorldMap]: The overlapping maps, in the order they are in `maps`.
+        """
+        return self._get_index().query(x, y, width, height)
+
+    def neighbors(self, world_map: WorldMap) -> List[WorldMap]:
+        """Get the maps which overlap or share an edge with a map.
+
+        Args:
+            world_map: A map within the world.
+
+        Returns:
+            List[WorldMap]: The adjacent maps, in the order they are in `maps`.
+        """
+        return self._get_index().neighbors.get(world_map.map_file, [])
+
+    def world_to_map(
+        self, x: float, y: float
+    ) -> Optional[Tuple[WorldMap, OrderedPair]]:
+        """Find the map at a point, and the position of the point within it.
+
+        Args:
+            x: The horizontal position, in world pixels.
+            y: The vertical position, in world pixels.
+
+        Returns:
+            Optional[Tuple[WorldMap, OrderedPair]]: The first map containing the point
+                along with the position of the point relative to the map's top left
+                corner, or None if there is no map at the point.
+        """
+        world_map = self._get_index().at(x, y)
+        if world_map is None:
+            return None
+        return world_map, OrderedPair(
+            x - world_map.coordinates.x, y - world_map.coordinates.y
+        )
+
 
 class RawPattern(TypedDict):
     regexp: str
@@ -100,18 +272,48 @@ def _parse_world_map(raw_world_map: RawWorldMap, map_file: Path) -> WorldMap:
     )
 
 
-def parse_world(file: Path, encoding: str) -> World:
+def _list_dir(directory: Path, context: ParseContext) -> List[str]:
+    """List the files in a directory.
+
+    With `cache_listing`, the listing is reused while the directory has not changed.
+
+    Args:
+        directory: Path to the directory.
+        context: The context of the current parse.
+
+    Returns:
+        List[str]: The names of the files within the directory.
+    """
+    if not context.cache_listing:
+        return context.resolver.list_dir(directory)
+    return listing_cache.get_or_load(
+        directory, lambda: context.resolver.list_dir(directory), (), context.resolver
+    )
+
+
+def parse_world(
+    file: Path,
+    encoding: str,
+    raw_world: Optional[RawWorld] = None,
+    context: Optional[ParseContext] = None,
+) -> World:
     """Parse the raw world into a pytiled_parser type
 
     Args:
         file: Path to the world's file
+        encoding: The character encoding set to use when opening the file
+        raw_world: The already loaded contents of the world file. If not given the
+            file will be read.
+        context: The context of the current parse.
 
     Returns:
         World: A properly parsed [World][pytiled_parser.world.World]
     """
-
-    with open(file, encoding="utf-8") as world_file:
-        raw_world = json.load(world_file)
+    context = get_context(context)
+    if raw_world is None:
+        raw_world = parse_json(
+            context.resolver.read(file), encoding, context.json_backend
+        )
 
     parent_dir = file.parent
 
@@ -123,45 +325,52 @@ def parse_world(file: Path, encoding: str) -> World:
             maps.append(_parse_world_map(raw_map, map_path))
 
     if raw_world.get("patterns"):
-        for raw_pattern in raw_world["patterns"]:
-            regex = re.compile(raw_pattern["regexp"])
-            map_files = [
-                f
-                for f in listdir(parent_dir)
-                if isfile(join(parent_dir, f)) and regex.match(f)
-            ]
-            for map_file in map_files:
-                search = regex.search(map_file)
-                if search:
-                    width = raw_pattern["multiplierX"]
-                    height = raw_pattern["multiplierY"]
-
-                    offset_x = 0
-                    offset_y = 0
-
-                    if raw_pattern.get("offsetX"):
-                        offset_x = raw_pattern["offsetX"]
-
-                    if raw_pattern.get("offsetY"):
-                        offset_y = raw_pattern["offsetY"]
-
-                    x = (float(search.group(1)) * width) + offset_x
-                    y = (float(search.group(2)) * height) + offset_y
-
-                    raw_world_map: RawWorldMap = {
-                        "fileName": map_file,
-                        "width": width,
-                        "height": height,
-                        "x": x,
-                        "y": y,
-                    }
-
-                    map_path = Path(parent_dir / map_file)
-                    maps.append(_parse_world_map(raw_world_map, map_path))
+        patterns = [
+            (re.compile(raw_pattern["regexp"]), raw_pattern)
+            for raw_pattern in raw_world["patterns"]
+        ]
+        matches: List[List[Tuple[str, Match[str]]]] = [[] for _ in patterns]
+
+        # The directory is listed once, and every pattern is tried against each file
+        for map_file in _list_dir(parent_dir, context):
+            for (regex, _), pattern_matches in zip(patterns, matches):
+                match = regex.match(map_file)
+                if match:
+                    pattern_matches.append((map_file, match))
+
+        for (_, raw_pattern), pattern_matches in zip(patterns, matches):
+            width = raw_pattern["multiplierX"]
+            height = raw_pattern["multiplierY"]
+
+            offset_x = 0.0
+            offset_y = 0.0
+
+            if raw_pattern.get("offsetX"):
+                offset_x = raw_pattern["offsetX"]
+
+            if raw_pattern.get("offsetY"):
+                offset_y = raw_pattern["offsetY"]
+
+            for map_file, match in pattern_matches:
+                x = (float(match.group(1)) * width) + offset_x
+                y = (float(match.group(2)) * height) + offset_y
+
+                raw_world_map: RawWorldMap = {
+                    "fileName": map_file,
+                    "width": width,
+                    "height": height,
+                    "x": x,
+                    "y": y,
+                }
+
+                map_path = Path(parent_dir / map_file)
+                maps.append(_parse_world_map(raw_world_map, map_path))
 
     world = World(maps=maps)
 
     if raw_world.get("onlyShowAdjacentMaps"):
         world.only_show_adjacent = raw_world["onlyShowAdjacentMaps"]
 
+    world.build_index()
+
     return world
@@ -0,0 +1,123 @@
+"""Tests for the asynchronous parse functions"""
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import (
+    parse_map,
+    parse_map_async,
+    parse_tileset,
+    parse_tileset_async,
+    parse_world,
+    parse_world_async,
+)
+from pytiled_parser.cache import FileCache, template_cache, tileset_cache
+from pytiled_parser.resolver import MemoryResolver
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+WORLD_TESTS = TEST_DATA / "world_tests"
+
+
+class SlowResolver(MemoryResolver):
+    def __init__(self, files):
+        super().__init__(files)
+        self.reads = []
+
+    def read(self, path):
+        self.reads.append(Path(path))
+        time.sleep(0.05)
+        return super().read(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+def test_parse_map_async():
+    map_file = MAP_TESTS / "template" / "map.tmx"
+
+    assert asyncio.run(parse_map_async(map_file)) == parse_map(map_file)
+
+
+def test_parse_map_async_cache_dir(tmp_path):
+    map_file = MAP_TESTS / "template" / "map.tmx"
+
+    for _ in range(2):
+        tiled_map = asyncio.run(parse_map_async(map_file, cache_dir=tmp_path))
+        assert tiled_map == parse_map(map_file)
+
+
+def test_parse_tileset_async():
+    tileset_file = TEST_DATA / "tilesets" / "image" / "tileset.tsx"
+
+    assert asyncio.run(parse_tileset_async(tileset_file)) == parse_tileset(tileset_file)
+
+
+def test_parse_world_async():
+    world_file = WORLD_TESTS / "static_defined" / "world.world"
+
+    assert asyncio.run(parse_world_async(world_file)) == parse_world(world_file)
+
+
+def test_shared_tilesets_are_read_once():
+    map_dir = MAP_TESTS / "external_tileset_dif_dir"
+    map_data = (map_dir / "map.tmx").read_bytes()
+    resolver = SlowResolver(
+        {
+            "one.tmx": map_data,
+            "two.tmx": map_data,
+            "three.tmx": map_data,
+            "tileset/tileset.tsx": (map_dir / "tileset" / "tileset.tsx").read_bytes(),
+        }
+    )
+
+    async def load_all():
+        return await asyncio.gather(
+            *[
+                parse_map_async(Path(name), resolver=resolver, cache_tilesets=True)
+                for name in ["one.tmx", "two.tmx", "three.tmx"]
+            ]
+        )
+
+    tiled_maps = asyncio.run(load_all())
+
+    assert resolver.reads.count(Path("tileset/tileset.tsx")) == 1
+    assert all(tiled_map.tilesets[1].name == "tileset" for tiled_map in tiled_maps)
+
+
+def test_coalesced_loads():
+    resolver = MemoryResolver({"file.txt": b"contents"})
+    cache = FileCache()
+    started = threading.Barrier(4)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def load():
+        started.wait()
+        return cache.get_or_load(Path("file.txt"), loader, resolver=resolver)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(load())) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 4
+    assert len(loads) == 1
+    assert cache.coalesced + cache.hits == 3
@@ -0,0 +1,183 @@
+"""Tests for the JSON and XML backends"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import backends, parse_map, parse_tileset
+from pytiled_parser.cache import template_cache, tileset_cache
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+
+SKIPPED_MAPS = ("b64_zstd", "unknown_type", "json_invalid_tileset")
+
+ALL_MAPS = sorted(
+    path
+    for directory in ("layer_tests", "map_tests")
+    for path in (TEST_DATA / directory).glob("*/map.*")
+    if path.parent.name not in SKIPPED_MAPS and path.suffix != ".py"
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_backends():
+    tileset_cache.clear()
+    template_cache.clear()
+    yield
+    backends.set_json_backend(None)
+    backends.set_xml_backend(None)
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+def map_id(path):
+    return f"{path.parent.name}-{path.suffix[1:]}"
+
+
+@pytest.mark.parametrize("map_file", ALL_MAPS, ids=map_id)
+@pytest.mark.parametrize("json_backend", backends.available_json_backends())
+@pytest.mark.parametrize("xml_backend", backends.available_xml_backends())
+def test_backends_parse_equal_maps(map_file, json_backend, xml_backend):
+    expected = parse_map(map_file, json_backend="json", xml_backend="etree")
+    tileset_cache.clear()
+    template_cache.clear()
+
+    parsed = parse_map(map_file, json_backend=json_backend, xml_backend=xml_backend)
+
+    assert parsed == expected
+
+
+@pytest.mark.parametrize("json_backend", backends.available_json_backends())
+def test_json_backends_parse_equal_tilesets(json_backend):
+    tileset_file = TEST_DATA / "tilesets" / "image" / "tileset.json"
+
+    assert parse_tileset(tileset_file, json_backend=json_backend) == parse_tileset(
+        tileset_file, json_backend="json"
+    )
+
+
+@pytest.mark.parametrize("json_backend", backends.available_json_backends())
+@pytest.mark.parametrize(
+    "document",
+    ['{"a": 1, "layers": [{"b": 2}, {"c": 3}], "d": [4]}', '{"layers": 5}'],
+)
+def test_json_backends_iterparse_equal(json_backend, document):
+    data = document.encode("utf-8")
+
+    backend = backends.get_json_backend(json_backend)
+
+    assert list(backend.iterparse(data, "utf-8", "layers")) == list(
+        backends.get_json_backend("json").iterparse(data, "utf-8", "layers")
+    )
+
+
+@pytest.mark.parametrize("json_backend", backends.available_json_backends())
+def test_json_backends_reject_non_objects(json_backend):
+    backend = backends.get_json_backend(json_backend)
+
+    with pytest.raises(ValueError):
+        list(backend.iterparse(b"[1, 2]", "utf-8", "layers"))
+
+
+def test_default_backends_are_the_standard_library():
+    assert type(backends.get_json_backend()) is backends.JSONBackend
+    assert type(backends.get_xml_backend()) is backends.XMLBackend
+    assert backends.available_json_backends()[-1] == "json"
+    assert backends.available_xml_backends()[-1] == "etree"
+
+
+def test_installed_backends_are_not_the_default():
+    pytest.importorskip("orjson")
+
+    backends.set_json_backend("orjson")
+    assert backends.get_json_backend().name == "orjson"
+
+    backends.set_json_backend(None)
+    assert backends.get_json_backend().name == "json"
+
+
+@pytest.mark.parametrize(
+    "map_file", [path for path in ALL_MAPS if path.suffix == ".tmx"], ids=map_id
+)
+def test_lxml_backend_parses_equal_maps(map_file, monkeypatch):
+    pytest.importorskip("lxml")
+    expected = parse_map(map_file, xml_backend="etree")
+    tileset_cache.clear()
+    template_cache.clear()
+    # Feed the pull parser in pieces smaller than most elements
+    monkeypatch.setattr("pytiled_parser.backends._CHUNK_SIZE", 7)
+
+    assert parse_map(map_file, xml_backend="lxml") == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": 1, "layers": [{"b": 2}, {"c": 3}], "d": [4]}',
+        '{"layers": [{"layers": [{"e": 5.5}]}], "f": "\u00e9"}',
+        '{"layers": []}',
+        '{"layers": 5}',
+        "{}",
+    ],
+)
+def test_ijson_iterparse_equal(encoding, document):
+    pytest.importorskip("ijson")
+    data = document.encode(encoding)
+
+    assert list(backends._iterparse_json_ijson(data, encoding, "layers")) == list(
+        backends._iterparse_json_text(document, "layers")
+    )
+
+
+@pytest.mark.parametrize("document", [b"[1, 2]", b"5", b'"layers"'])
+def test_ijson_iterparse_rejects_non_objects(document):
+    pytest.importorskip("ijson")
+
+    with pytest.raises(ValueError):
+        list(backends._iterparse_json_ijson(document, "utf-8", "layers"))
+
+
+def test_set_backends():
+    backends.set_json_backend("json")
+    backends.set_xml_backend("etree")
+
+    assert type(backends.get_json_backend()) is backends.JSONBackend
+    assert type(backends.get_xml_backend()) is backends.XMLBackend
+
+    backend = backends.JSONBackend()
+    backends.set_json_backend(backend)
+    assert backends.get_json_backend() is backend
+
+
+def test_set_backend_is_used_by_parse():
+    calls = []
+
+    class RecordingBackend(backends.JSONBackend):
+        def loads(self, data, encoding):
+            calls.append(encoding)
+            return super().loads(data, encoding)
+
+    backends.set_json_backend(RecordingBackend())
+
+    parse_tileset(TEST_DATA / "tilesets" / "image" / "tileset.json")
+
+    assert calls == ["utf-8"]
+
+
+@pytest.mark.parametrize(
+    "get_backend", [backends.get_json_backend, backends.get_xml_backend]
+)
+def test_unknown_backend(get_backend):
+    with pytest.raises(ValueError, match="Unknown backend"):
+        get_backend("yaml")
+
+
+def test_missing_backend(monkeypatch):
+    monkeypatch.setitem(backends._REQUIRES, "orjson", None)
+
+    assert "orjson" not in backends.available_json_backends()
+    with pytest.raises(ValueError, match="requires orjson"):
+        backends.get_json_backend("orjson")
@@ -0,0 +1,126 @@
+"""Tests for loading maps from zip and pack bundles"""
+
+import operator
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map, parse_world
+from pytiled_parser.bundle import PackBundle, ZipBundle, open_bundle, write_pack
+from pytiled_parser.cache import template_cache, tileset_cache
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+WORLD_TESTS = TEST_DATA / "world_tests"
+
+
+def write_zip(output: Path, directory: Path, compression: int) -> None:
+    with zipfile.ZipFile(output, "w", compression) as archive:
+        for path in directory.rglob("*"):
+            archive.write(path, "levels/" + path.relative_to(directory).as_posix())
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+@pytest.fixture(params=["stored", "deflated", "pack"])
+def bundle_path(request, tmp_path):
+    def create(directory: Path) -> Path:
+        if request.param == "pack":
+            output = tmp_path / "levels.pack"
+            files = {
+                "levels/" + path.relative_to(directory).as_posix(): path.read_bytes()
+                for path in directory.rglob("*")
+                if path.is_file()
+            }
+            write_pack(output, files)
+        else:
+            output = tmp_path / "levels.zip"
+            compression = {
+                "stored": zipfile.ZIP_STORED,
+                "deflated": zipfile.ZIP_DEFLATED,
+            }[request.param]
+            write_zip(output, directory, compression)
+        return output
+
+    return create
+
+
+def test_read_files(bundle_path):
+    directory = MAP_TESTS / "template"
+
+    with open_bundle(bundle_path(directory)) as bundle:
+        assert sorted(bundle.names()) == sorted(
+            "levels/" + path.relative_to(directory).as_posix()
+            for path in directory.rglob("*")
+            if path.is_file()
+        )
+        for name in bundle.names():
+            assert bundle.read(Path(name)) == (directory / name[7:]).read_bytes()
+
+        assert "map.tmx" in bundle.list_dir(Path("levels"))
+
+        with pytest.raises(FileNotFoundError):
+            bundle.read(Path("levels/missing.tmx"))
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_parse_map(bundle_path, map_name):
+    directory = MAP_TESTS / "template"
+    expected = parse_map(directory / map_name)
+
+    with open_bundle(bundle_path(directory)) as bundle:
+        casted_map = bundle.parse_map("levels/" + map_name)
+
+    assert casted_map.layers == expected.layers
+    assert sorted(casted_map.tilesets) == sorted(expected.tilesets)
+    for firstgid, tileset in casted_map.tilesets.items():
+        assert tileset.name == expected.tilesets[firstgid].name
+
+
+def test_parse_world(bundle_path):
+    directory = WORLD_TESTS / "both"
+    expected = parse_world(directory / "world.world")
+
+    with open_bundle(bundle_path(directory)) as bundle:
+        casted_world = bundle.parse_world("levels/world.world")
+
+    for world in (expected, casted_world):
+        world.maps.sort(key=operator.attrgetter("map_file"))
+
+    assert [world_map.map_file.name for world_map in casted_world.maps] == [
+        world_map.map_file.name for world_map in expected.maps
+    ]
+    assert [world_map.coordinates for world_map in casted_world.maps] == [
+        world_map.coordinates for world_map in expected.maps
+    ]
+
+
+def test_bundle_type(tmp_path):
+    write_pack(tmp_path / "levels.pack", MAP_TESTS / "template")
+    write_zip(tmp_path / "levels.zip", MAP_TESTS / "template", zipfile.ZIP_STORED)
+
+    with open_bundle(tmp_path / "levels.pack") as bundle:
+        assert isinstance(bundle, PackBundle)
+        assert "map.tmx" in bundle.names()
+
+    with open_bundle(tmp_path / "levels.zip") as bundle:
+        assert isinstance(bundle, ZipBundle)
+
+    with pytest.raises(ValueError):
+        PackBundle(tmp_path / "levels.zip")
+
+
+def test_bundle_tilesets_are_cached(bundle_path):
+    with open_bundle(bundle_path(MAP_TESTS / "external_tileset_dif_dir")) as bundle:
+        bundle.parse_map("levels/map.tmx", cache_tilesets=True)
+        bundle.parse_map("levels/map.tmx", cache_tilesets=True)
+
+    assert tileset_cache.misses == 1
+    assert tileset_cache.hits == 1
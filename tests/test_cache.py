@@ -0,0 +1,183 @@
+"""Tests for the process-wide file caches"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map
+from pytiled_parser.bundle import open_bundle, write_pack
+from pytiled_parser.cache import FileCache, template_cache, tileset_cache
+from pytiled_parser.layer_filter import LayerFilter
+from pytiled_parser.resolver import MemoryResolver, default_resolver
+from pytiled_parser.util import load_object_template
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+    yield
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_tileset_shared_between_maps(map_name):
+    map_path = MAP_TESTS / "external_tileset_dif_dir" / map_name
+
+    first = parse_map(map_path, cache_tilesets=True)
+    second = parse_map(map_path, cache_tilesets=True)
+
+    assert tileset_cache.misses == 1
+    assert tileset_cache.hits == 1
+
+    # Each map gets its own view, but the tiles are shared.
+    assert first.tilesets[1] is not second.tilesets[1]
+    assert first.tilesets[1] == second.tilesets[1]
+    assert first.tilesets[1].tiles is second.tilesets[1].tiles
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_tileset_shared_between_map_options(map_name):
+    map_path = MAP_TESTS / "external_tileset_dif_dir" / map_name
+
+    parse_map(map_path, cache_tilesets=True)
+    parse_map(map_path, cache_tilesets=True, metadata_only=True)
+    parse_map(
+        map_path,
+        cache_tilesets=True,
+        layer_filter=LayerFilter(include_names="Tile Layer 1"),
+    )
+    parse_map(map_path, cache_tilesets=True, resolve_objects=True)
+
+    assert tileset_cache.misses == 1
+    assert tileset_cache.hits == 3
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_tilesets_are_not_shared_by_default(map_name):
+    map_path = MAP_TESTS / "external_tileset_dif_dir" / map_name
+
+    first = parse_map(map_path)
+    second = parse_map(map_path)
+
+    assert tileset_cache.hits == tileset_cache.misses == 0
+    assert first.tilesets[1] == second.tilesets[1]
+    assert first.tilesets[1].tiles is not second.tilesets[1].tiles
+
+    tile = first.tilesets[1].tiles[0]
+    assert tile.properties
+    tile.properties["changed"] = True
+    assert "changed" not in second.tilesets[1].tiles[0].properties
+    assert "changed" not in parse_map(map_path).tilesets[1].tiles[0].properties
+
+
+def test_tileset_view_firstgid(tmp_path):
+    map_dir = tmp_path / "map"
+    shutil.copytree(MAP_TESTS / "external_tileset_dif_dir", map_dir)
+
+    map_file = map_dir / "map.tmx"
+    first = parse_map(map_file, cache_tilesets=True)
+
+    map_file.write_text(
+        map_file.read_text().replace('firstgid="1"', 'firstgid="5"'), "utf-8"
+    )
+    second = parse_map(map_file, cache_tilesets=True)
+
+    assert tileset_cache.hits == 1
+    assert first.tilesets[1].firstgid == 1
+    assert second.tilesets[5].firstgid == 5
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_templates_shared_between_maps(map_name):
+    map_path = MAP_TESTS / "template" / map_name
+
+    first = parse_map(map_path)
+    misses = template_cache.misses
+    second = parse_map(map_path)
+
+    assert template_cache.misses == misses
+    assert first == second
+
+
+def test_tmx_template_not_modified_by_instances():
+    template_path = MAP_TESTS / "template" / "template-rectangle.tx"
+    template, _, _ = load_object_template(template_path, "utf-8")
+    template_object = template.find("./object")
+    attributes = dict(template_object.attrib)
+    children = list(template_object)
+
+    parse_map(MAP_TESTS / "template" / "map.tmx")
+
+    assert template_object.attrib == attributes
+    assert list(template_object) == children
+
+
+def test_file_cache_invalidated_on_change(tmp_path):
+    cache = FileCache()
+    file = tmp_path / "file.txt"
+    file.write_text("one")
+
+    assert cache.get_or_load(file, lambda: 1) == 1
+    assert cache.get_or_load(file, lambda: 2) == 1
+
+    file.write_text("three")
+    assert cache.get_or_load(file, lambda: 3) == 3
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_file_cache_eviction(tmp_path):
+    cache = FileCache(max_entries=2, max_bytes=10)
+    files = []
+    for index in range(3):
+        file = tmp_path / f"{index}.txt"
+        file.write_text("abcd")
+        files.append(file)
+        cache.put(file, index)
+
+    # The least recently used entry is evicted by the entry limit
+    assert len(cache) == 2
+    assert cache.get(files[0]) is None
+
+    cache.get(files[1])
+    cache.max_entries = 10
+    big_file = tmp_path / "big.txt"
+    big_file.write_text("abcdefgh")
+    cache.put(big_file, "big")
+
+    # The memory budget evicts until everything fits
+    assert cache.get(files[1]) is None
+    assert cache.get(files[2]) is None
+    assert cache.get(big_file) == "big"
+    assert cache.total_bytes == 8
+
+
+def test_file_cache_invalidate(tmp_path):
+    cache = FileCache()
+    file = tmp_path / "file.txt"
+    file.write_text("one")
+    write_pack(tmp_path / "files.pack", {"file.txt": b"one"})
+
+    with open_bundle(tmp_path / "files.pack") as bundle:
+        sources = [
+            (file, default_resolver),
+            (Path("file.txt"), MemoryResolver({"file.txt": "one"})),
+            (Path("file.txt"), bundle),
+        ]
+        for path, resolver in sources:
+            cache.put(path, 1, (), resolver)
+            cache.put(path, 2, ("extra",), resolver)
+        assert len(cache) == 6
+
+        for remaining, (path, resolver) in zip([4, 2, 0], sources):
+            cache.invalidate(path, resolver)
+            assert len(cache) == remaining
+            assert cache.get(path, (), resolver) is None
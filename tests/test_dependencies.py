@@ -0,0 +1,89 @@
+"""Tests for scanning the dependencies of maps"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser.dependencies import (
+    Dependencies,
+    dependency_cache,
+    scan_dependencies,
+)
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+LAYER_TESTS = TEST_DATA / "layer_tests"
+IMAGES = TEST_DATA / "images"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    dependency_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "map_name, tileset_ext, template_ext",
+    [("map.tmx", ".tsx", ".tx"), ("map.json", ".json", ".json")],
+)
+def test_templates(map_name, tileset_ext, template_ext):
+    map_dir = MAP_TESTS / "template"
+
+    assert scan_dependencies(map_dir / map_name) == Dependencies(
+        tilesets=[
+            map_dir / ("tileset" + tileset_ext),
+            map_dir / ("tile_set_image_for_template" + tileset_ext),
+            map_dir / ("tile_set_single_image" + tileset_ext),
+        ],
+        templates=[
+            map_dir / ("template-rectangle" + template_ext),
+            map_dir / ("template-tile-spritesheet" + template_ext),
+            map_dir / ("template-tile-image" + template_ext),
+        ],
+        images=[
+            IMAGES / "tmw_desert_spacing.png",
+            IMAGES / "tile_04.png",
+            IMAGES / "tile_02.png",
+        ],
+    )
+
+
+def test_tileset_in_other_directory():
+    map_dir = MAP_TESTS / "external_tileset_dif_dir"
+
+    dependencies = scan_dependencies(map_dir / "map.tmx")
+
+    assert dependencies.tilesets == [map_dir / "tileset" / "tileset.tsx"]
+    assert dependencies.images == [
+        IMAGES / "tile_01.png",
+        IMAGES / "tile_02.png",
+        IMAGES / "tile_03.png",
+        IMAGES / "tile_04.png",
+    ]
+
+
+@pytest.mark.parametrize("map_name", ["map.tmx", "map.json"])
+def test_image_layers(map_name):
+    map_dir = LAYER_TESTS / "all_layer_types"
+
+    dependencies = scan_dependencies(map_dir / map_name)
+
+    assert IMAGES / "tile_04.png" in dependencies.images
+
+
+def test_compressed_layers_are_not_decoded():
+    # Scanning works regardless of whether the compression is supported
+    dependencies = scan_dependencies(LAYER_TESTS / "b64_zstd" / "map.tmx")
+
+    assert [tileset.name for tileset in dependencies.tilesets] == ["tileset.json"]
+
+
+def test_files_are_cached():
+    scan_dependencies(MAP_TESTS / "template" / "map.tmx")
+    misses = dependency_cache.misses
+
+    scan_dependencies(MAP_TESTS / "template" / "map.tmx")
+
+    assert dependency_cache.misses == misses
+    assert dependency_cache.hits == misses
@@ -0,0 +1,186 @@
+"""Tests for sharing equal values between the parts of parsed maps"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import Color, OrderedPair, Size, parse_map, parse_map_data
+from pytiled_parser.interning import Interner
+from pytiled_parser.layer import ObjectLayer
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+
+TMX_OBJECT = (
+    '  <object id="{id}" name="crate" type="prop" x="{id}" y="2" width="16" '
+    'height="16"><properties><property name="health" type="int" value="10"/>'
+    '<property name="tint" type="color" value="#ff102030"/></properties></object>'
+)
+
+
+def make_tmx_map(count):
+    objects = "\n".join(TMX_OBJECT.format(id=index + 1) for index in range(count))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+        'renderorder="right-down" '
+        'width="4" height="4" tilewidth="16" tileheight="16" infinite="0" '
+        f'nextlayerid="2" nextobjectid="{count + 1}">\n'
+        f' <objectgroup id="1" name="Objects">\n{objects}\n </objectgroup>\n'
+        "</map>\n"
+    )
+
+
+def make_json_map(count):
+    objects = [
+        {
+            "id": index + 1,
+            "name": "crate",
+            "type": "prop",
+            "x": index + 1,
+            "y": 2,
+            "width": 16,
+            "height": 16,
+            "rotation": 0,
+            "visible": True,
+            "properties": [
+                {"name": "health", "type": "int", "value": 10},
+                {"name": "tint", "type": "color", "value": "#ff102030"},
+            ],
+        }
+        for index in range(count)
+    ]
+    return json.dumps(
+        {
+            "height": 4,
+            "width": 4,
+            "infinite": False,
+            "layers": [
+                {
+                    "draworder": "topdown",
+                    "id": 1,
+                    "name": "Objects",
+                    "objects": objects,
+                    "opacity": 1,
+                    "type": "objectgroup",
+                    "visible": True,
+                    "x": 0,
+                    "y": 0,
+                }
+            ],
+            "nextlayerid": 2,
+            "nextobjectid": count + 1,
+            "orientation": "orthogonal",
+            "renderorder": "right-down",
+            "tileheight": 16,
+            "tilewidth": 16,
+            "tilesets": [],
+            "version": "1.9",
+        }
+    )
+
+
+MAPS = {"tmx": make_tmx_map(10), "json": make_json_map(10)}
+
+
+def test_equal_values_are_shared():
+    interner = Interner()
+    first = interner.intern("".join(["cr", "ate"]))
+
+    assert interner.intern("".join(["cra", "te"])) is first
+    assert interner.intern(Size(16, 16)) is interner.intern(Size(16, 16))
+    assert interner.intern(Path("a.png")) is interner.intern(Path("a.png"))
+    assert len(interner) == 3
+
+
+def test_values_of_different_types_are_not_shared():
+    interner = Interner()
+
+    assert type(interner.intern(1)) is int
+    assert type(interner.intern(1.0)) is float
+    assert type(interner.intern(True)) is bool
+    assert interner.intern(Size(16, 16)) is not interner.intern(OrderedPair(16, 16))
+    assert type(interner.intern(Size(16.0, 16.0)).width) is float
+
+
+def test_unhashable_values_are_returned_unchanged():
+    interner = Interner()
+    value = (1, [2])
+
+    assert interner.intern(value) is value
+    assert len(interner) == 0
+
+
+def test_equal_properties_are_shared():
+    interner = Interner()
+    tint = Color(1, 2, 3, 4)
+    first = interner.intern_properties({"health": 10, "tint": tint})
+
+    assert first == {"health": 10, "tint": tint}
+    assert interner.intern_properties({"health": 10, "tint": tint}) is first
+    assert interner.intern_properties({"health": 11, "tint": tint}) is not first
+
+    floats = interner.intern_properties({"health": 10.0, "tint": tint})
+    assert floats is not first
+    assert type(floats["health"]) is float
+
+
+def test_class_properties_are_not_shared():
+    interner = Interner()
+    properties = {"stats": {"health": 10}}
+
+    assert interner.intern_properties(properties) is properties
+    assert interner.intern_properties({"stats": {"health": 10}}) is not properties
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_objects_share_values(extension):
+    tiled_map = parse_map_data(
+        MAPS[extension], Path(f"map.{extension}"), interner=Interner()
+    )
+    layer = tiled_map.layers[0]
+    assert isinstance(layer, ObjectLayer)
+
+    first = layer.tiled_objects[0]
+    assert first.properties == {"health": 10, "tint": Color(16, 32, 48, 255)}
+    for tiled_object in layer.tiled_objects[1:]:
+        assert tiled_object.properties is first.properties
+        assert tiled_object.size is first.size
+        assert tiled_object.class_ is first.class_
+        assert tiled_object.coordinates is not first.coordinates
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_interner_is_shared_between_maps(extension):
+    interner = Interner()
+    map_file = Path(f"map.{extension}")
+    first = parse_map_data(MAPS[extension], map_file, interner=interner)
+    second = parse_map_data(MAPS[extension], map_file, interner=interner)
+
+    first_object = first.layers[0].tiled_objects[0]  # type: ignore
+    second_object = second.layers[0].tiled_objects[0]  # type: ignore
+    assert second_object.properties is first_object.properties
+
+    separate = parse_map_data(MAPS[extension], map_file)
+    separate_object = separate.layers[0].tiled_objects[0]  # type: ignore
+    assert separate_object.properties is not first_object.properties
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_interning_does_not_change_parsed_maps(extension):
+    map_file = TEST_DATA / "layer_tests" / "all_layer_types" / f"map.{extension}"
+
+    assert parse_map(map_file, interner=Interner()) == parse_map(map_file)
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_values_are_not_shared_by_default(extension):
+    tiled_map = parse_map_data(MAPS[extension], Path(f"map.{extension}"))
+    first, second = tiled_map.layers[0].tiled_objects[:2]  # type: ignore
+
+    assert first.properties == second.properties
+    assert first.properties is not second.properties
+    first.properties["health"] = 0
+    assert second.properties["health"] == 10
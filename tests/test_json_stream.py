@@ -0,0 +1,129 @@
+"""Tests for parsing JSON maps while they are read"""
+
+import json
+import os
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser.context import ParseContext
+from pytiled_parser.parsers.json import tiled_map
+from pytiled_parser.util import iterparse_json, parse_json
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+
+ALL_JSON_MAPS = sorted(
+    path
+    for path in (TEST_DATA / "layer_tests").glob("*/map.json")
+    if path.parent.name not in ("b64_zstd", "unknown_type")
+) + sorted(
+    path
+    for path in (TEST_DATA / "map_tests").glob("*/map.json")
+    if path.parent.name != "json_invalid_tileset"
+)
+
+
+@pytest.mark.parametrize("map_file", ALL_JSON_MAPS, ids=lambda path: path.parent.name)
+def test_stream_matches_tree(map_file):
+    data = map_file.read_bytes()
+
+    expected = tiled_map.parse(map_file, "utf-8", parse_json(data, "utf-8"))
+
+    assert tiled_map.parse_stream(map_file, "utf-8", data) == expected
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "{}",
+        ' { "layers" : [ ] } ',
+        '{"a": 1, "layers": [{"b": [2, 3]}, {"c": {"d": null}}], "e": "layers"}',
+        '{"layers": null, "f": [1.5, true]}',
+    ],
+)
+def test_iterparse_json(document):
+    expected = json.loads(document)
+
+    members = list(iterparse_json(document.encode("utf-8"), "utf-8", "layers"))
+
+    layers = [value for key, value in members if key == "layers"]
+    if isinstance(expected.get("layers"), list):
+        assert layers == expected.pop("layers")
+    assert dict(member for member in members if member[0] != "layers") == {
+        key: value for key, value in expected.items() if key != "layers"
+    }
+
+
+@pytest.mark.parametrize(
+    "document",
+    ["", "[]", '{"a": 1,}', '{"a" 1}', '{"layers": [1,]}', '{"a": 1} x', '{"a": 1'],
+)
+def test_iterparse_json_invalid(document):
+    with pytest.raises(ValueError):
+        list(iterparse_json(document.encode("utf-8"), "utf-8", "layers"))
+
+
+def make_map(layers, side):
+    data = [index % 48 + 1 for index in range(side * side)]
+    return json.dumps(
+        {
+            "height": side,
+            "width": side,
+            "infinite": False,
+            "layers": [
+                {
+                    "data": data,
+                    "height": side,
+                    "id": layer_id,
+                    "name": f"Layer {layer_id}",
+                    "opacity": 1,
+                    "type": "tilelayer",
+                    "visible": True,
+                    "width": side,
+                    "x": 0,
+                    "y": 0,
+                }
+                for layer_id in range(1, layers + 1)
+            ],
+            "nextlayerid": layers + 1,
+            "nextobjectid": 1,
+            "orientation": "orthogonal",
+            "renderorder": "right-down",
+            "tiledversion": "1.9.0",
+            "tileheight": 32,
+            "tilesets": [],
+            "tilewidth": 32,
+            "type": "map",
+            "version": "1.9",
+        }
+    ).encode("utf-8")
+
+
+def peak_memory(parse):
+    tracemalloc.start()
+    try:
+        parse()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_releases_raw_layers():
+    data = make_map(layers=32, side=48)
+    map_file = Path("map.json")
+    # orjson decodes the whole document at once, so only the json module streams
+    context = ParseContext(json_backend="json")
+
+    tree_peak = peak_memory(
+        lambda: tiled_map.parse(
+            map_file, "utf-8", parse_json(data, "utf-8", "json"), context
+        )
+    )
+    stream_peak = peak_memory(
+        lambda: tiled_map.parse_stream(map_file, "utf-8", data, context)
+    )
+
+    # The tree holds the decoded data of every layer at once
+    assert stream_peak < tree_peak * 0.85
@@ -0,0 +1,90 @@
+"""Tests for parsing only some of the layers of maps"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import ImageLayer, LayerFilter, LayerGroup, parse_map
+from pytiled_parser.cache import tileset_cache
+from pytiled_parser.parsers.json import layer as json_layer
+from pytiled_parser.parsers.tmx import layer as tmx_layer
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+ALL_LAYER_TYPES = TEST_DATA / "layer_tests" / "all_layer_types"
+
+FORMATS = ["json", "tmx"]
+
+
+def layer_names(layers):
+    """Get the names of a list of layers, with groups as (name, children) tuples."""
+    return [
+        (
+            (layer.name, layer_names(layer.layers))
+            if isinstance(layer, LayerGroup)
+            else layer.name
+        )
+        for layer in layers
+    ]
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+@pytest.mark.parametrize(
+    "layer_filter, expected",
+    [
+        (
+            LayerFilter(exclude_types=[ImageLayer]),
+            ["Tile Layer 1", ("Group 1", ["Object Layer 1"])],
+        ),
+        (LayerFilter(include_types=["objectgroup"]), [("Group 1", ["Object Layer 1"])]),
+        (
+            LayerFilter(exclude_names=["Group 1"]),
+            ["Tile Layer 1", "Image Layer 1", "Image Layer 2"],
+        ),
+        (LayerFilter(include_names=["Group 1"]), [("Group 1", ["Object Layer 1"])]),
+        (
+            LayerFilter(include_names="Group 1", exclude_types="objectgroup"),
+            [("Group 1", [])],
+        ),
+        (LayerFilter(include_types="tilelayer"), ["Tile Layer 1"]),
+        (LayerFilter(include_classes=["missing"]), []),
+        (
+            lambda info: info.name.startswith("Image"),
+            ["Image Layer 1", "Image Layer 2"],
+        ),
+    ],
+)
+def test_layer_filter(extension, layer_filter, expected):
+    map_file = ALL_LAYER_TYPES / f"map.{extension}"
+
+    tiled_map = parse_map(map_file, layer_filter=layer_filter)
+
+    assert layer_names(tiled_map.layers) == expected
+
+
+@pytest.mark.parametrize("module", [json_layer, tmx_layer])
+def test_skipped_layers_are_not_decoded(module, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Skipped layers should not be parsed")
+
+    monkeypatch.setattr(module, "_decode_tile_layer_data", fail)
+    monkeypatch.setattr(module, "_convert_raw_tile_layer_data", fail)
+    monkeypatch.setattr(module, "parse_object", fail)
+
+    extension = "json" if module is json_layer else "tmx"
+    tiled_map = parse_map(
+        ALL_LAYER_TYPES / f"map.{extension}",
+        layer_filter=LayerFilter(include_types=[ImageLayer]),
+    )
+    assert layer_names(tiled_map.layers) == ["Image Layer 1", "Image Layer 2"]
+
+
+def test_tile_collision_shapes_are_not_filtered():
+    map_file = TEST_DATA / "map_tests" / "external_tileset_dif_dir" / "map.tmx"
+    tileset_cache.clear()
+    expected = parse_map(map_file)
+
+    tiled_map = parse_map(map_file, layer_filter=LayerFilter(include_types="tilelayer"))
+
+    assert tiled_map.tilesets == expected.tilesets
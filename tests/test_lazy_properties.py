@@ -0,0 +1,165 @@
+"""Tests for properties which are converted when they are first read"""
+
+import copy
+import json
+import pickle
+import xml.etree.ElementTree as etree
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import Color
+from pytiled_parser.interning import Interner
+from pytiled_parser.parsers.json.properties import parse as parse_json_properties
+from pytiled_parser.parsers.tmx.properties import parse as parse_tmx_properties
+from pytiled_parser.properties import LazyProperties
+
+EXPECTED = {
+    "bool": True,
+    "color": Color(16, 32, 48, 255),
+    "file": Path("images/crate.png"),
+    "float": 1.5,
+    "int": 7,
+    "string": "crate",
+}
+
+RAW_JSON = [
+    {"name": "bool", "type": "bool", "value": True},
+    {"name": "color", "type": "color", "value": "#ff102030"},
+    {"name": "file", "type": "file", "value": "images/crate.png"},
+    {"name": "float", "type": "float", "value": 1.5},
+    {"name": "int", "type": "int", "value": 7},
+    {"name": "string", "type": "string", "value": "crate"},
+]
+
+RAW_TMX = """<properties>
+ <property name="bool" type="bool" value="true"/>
+ <property name="color" type="color" value="#ff102030"/>
+ <property name="file" type="file" value="images/crate.png"/>
+ <property name="float" type="float" value="1.5"/>
+ <property name="int" type="int" value="7"/>
+ <property name="string" value="crate"/>
+</properties>
+"""
+
+
+def parse_properties(extension):
+    if extension == "json":
+        return parse_json_properties(RAW_JSON)  # type: ignore
+    return parse_tmx_properties(etree.fromstring(RAW_TMX))
+
+
+def make_counting():
+    calls = []
+
+    def convert(type_, value):
+        calls.append(value)
+        return int(value)
+
+    properties = LazyProperties(convert)
+    properties.add_raw("a", "int", "1")
+    properties.add_raw("b", "int", "2")
+    properties["c"] = 3
+    return properties, calls
+
+
+@pytest.mark.parametrize("extension", ["json", "tmx"])
+def test_parsed_properties(extension):
+    properties = parse_properties(extension)
+
+    assert isinstance(properties, LazyProperties)
+    assert isinstance(properties, dict)
+    assert properties == EXPECTED
+    for name, value in EXPECTED.items():
+        assert type(properties[name]) is type(value)
+
+
+def test_values_are_converted_once_when_read():
+    properties, calls = make_counting()
+
+    assert calls == []
+    assert properties["a"] == 1
+    assert properties["a"] == 1
+    assert calls == ["1"]
+    assert properties.get("b") == 2
+    assert properties.get("missing", 4) == 4
+    assert calls == ["1", "2"]
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        dict,
+        lambda properties: {**properties},
+        lambda properties: properties.copy(),
+        lambda properties: dict(properties.items()),
+        lambda properties: dict(zip(properties, properties.values())),
+        lambda properties: json.loads(json.dumps(properties)),
+        lambda properties: pickle.loads(pickle.dumps(properties)),
+        copy.deepcopy,
+        lambda properties: properties | {},
+        lambda properties: {} | properties,
+    ],
+    ids=[
+        "dict",
+        "unpack",
+        "copy",
+        "items",
+        "values",
+        "json",
+        "pickle",
+        "deepcopy",
+        "or",
+        "ror",
+    ],
+)
+def test_whole_dict_operations_convert_values(operation):
+    properties, _ = make_counting()
+
+    result = operation(properties)
+
+    assert type(result) is dict
+    assert result == {"a": 1, "b": 2, "c": 3}
+
+
+def test_compares_and_prints_converted_values():
+    properties, _ = make_counting()
+    other, _ = make_counting()
+
+    assert properties == {"a": 1, "b": 2, "c": 3}
+    assert {"a": 1, "b": 2, "c": 3} == properties
+    assert properties == other
+    assert properties != {"a": "1", "b": "2", "c": 3}
+    assert repr(make_counting()[0]) == "{'a': 1, 'b': 2, 'c': 3}"
+
+
+def test_changes_replace_raw_values():
+    properties, calls = make_counting()
+
+    properties["a"] = 10
+    properties.update(b=20)
+    assert properties.setdefault("a", 0) == 10
+    assert properties.setdefault("d", 4) == 4
+    assert calls == []
+    assert properties == {"a": 10, "b": 20, "c": 3, "d": 4}
+
+    properties, calls = make_counting()
+    assert properties.pop("a") == 1
+    assert properties.pop("a", None) is None
+    assert properties.popitem() == ("c", 3)
+    with pytest.raises(KeyError):
+        properties.pop("a")
+    assert properties == {"b": 2}
+
+
+def test_interning_does_not_convert_values():
+    interner = Interner()
+    properties, calls = make_counting()
+    other = LazyProperties(properties.convert)
+    other.add_raw("a", "int", "1")
+    other.add_raw("b", "int", "2")
+    other["c"] = 3
+
+    assert interner.intern_properties(properties) is properties
+    assert interner.intern_properties(other) is properties
+    assert calls == []
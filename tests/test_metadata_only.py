@@ -0,0 +1,85 @@
+"""Tests for parsing only the metadata of maps"""
+
+import os
+from pathlib import Path
+
+import attr
+import pytest
+
+from pytiled_parser import LayerGroup, ObjectLayer, TileLayer, parse_map
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.parsers.json import layer as json_layer
+from pytiled_parser.parsers.tmx import layer as tmx_layer
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+LAYER_TESTS = TEST_DATA / "layer_tests"
+
+ALL_MAPS = [
+    LAYER_TESTS / "all_layer_types" / "map.tmx",
+    LAYER_TESTS / "all_layer_types" / "map.json",
+    LAYER_TESTS / "infinite_map" / "map.json",
+    LAYER_TESTS / "infinite_map_b64" / "map.tmx",
+    LAYER_TESTS / "b64_zlib" / "map.tmx",
+    MAP_TESTS / "external_tileset_dif_dir" / "map.tmx",
+    MAP_TESTS / "template" / "map.tmx",
+    MAP_TESTS / "template" / "map.json",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+def skeleton(layers):
+    """Strip the contents from a list of fully parsed layers."""
+    stripped = []
+    for layer in layers:
+        if isinstance(layer, TileLayer):
+            layer = attr.evolve(layer, data=None, chunks=None)
+        elif isinstance(layer, ObjectLayer):
+            layer = attr.evolve(layer, tiled_objects=[])
+        elif isinstance(layer, LayerGroup):
+            layer = attr.evolve(layer, layers=skeleton(layer.layers))
+        stripped.append(layer)
+    return stripped
+
+
+@pytest.mark.parametrize("map_file", ALL_MAPS)
+def test_metadata_only(map_file):
+    expected = parse_map(map_file)
+
+    casted_map = parse_map(map_file, metadata_only=True)
+
+    assert casted_map.layers == skeleton(expected.layers)
+    assert casted_map.properties == expected.properties
+    assert casted_map.map_size == expected.map_size
+    # Tilesets which are only used by templates are found while parsing objects
+    assert set(casted_map.tilesets) <= set(expected.tilesets)
+    for firstgid, tileset in casted_map.tilesets.items():
+        assert tileset == expected.tilesets[firstgid]
+
+
+@pytest.mark.parametrize("module", [json_layer, tmx_layer])
+def test_tile_data_is_not_decoded(module, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Tile data should not be decoded")
+
+    monkeypatch.setattr(module, "_decode_tile_layer_data", fail)
+    monkeypatch.setattr(module, "_convert_raw_tile_layer_data", fail)
+    monkeypatch.setattr(module, "parse_object", fail)
+
+    extension = "json" if module is json_layer else "tmx"
+    parse_map(LAYER_TESTS / "all_layer_types" / f"map.{extension}", metadata_only=True)
+
+
+def test_full_maps_are_not_affected_by_cached_tilesets():
+    map_file = MAP_TESTS / "template" / "map.tmx"
+
+    parse_map(map_file, metadata_only=True)
+
+    tiled_map = parse_map(map_file)
+    assert any(layer.tiled_objects for layer in tiled_map.layers)
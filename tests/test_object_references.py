@@ -0,0 +1,214 @@
+"""Tests for resolving object properties to the objects of a map"""
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map_data
+from pytiled_parser.interning import Interner
+from pytiled_parser.properties import ObjectReference
+
+TMX_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.9" tiledversion="1.9.0" orientation="orthogonal"
+ renderorder="right-down" width="1" height="1" tilewidth="16" tileheight="16"
+ infinite="0" nextlayerid="4" nextobjectid="4">
+ <properties>
+  <property name="spawn" type="object" value="3"/>
+ </properties>
+ <tileset firstgid="1" name="tiles" tilewidth="16" tileheight="16" tilecount="1"
+  columns="1">
+  <tile id="0">
+   <properties>
+    <property name="target" type="object" value="1"/>
+   </properties>
+  </tile>
+ </tileset>
+ <objectgroup id="1" name="Switches">
+  <properties>
+   <property name="first" type="object" value="1"/>
+  </properties>
+  <object id="1" name="switch" x="0" y="0">
+   <properties>
+    <property name="door" type="object" value="3"/>
+    <property name="unset" type="object" value="0"/>
+   </properties>
+  </object>
+  <object id="2" name="other switch" x="0" y="0">
+   <properties>
+    <property name="door" type="object" value="3"/>
+   </properties>
+  </object>
+ </objectgroup>
+ <group id="2" name="Group">
+  <objectgroup id="3" name="Doors">
+   <object id="3" name="door" x="0" y="0">
+    <properties>
+     <property name="switch" type="object" value="1"/>
+    </properties>
+   </object>
+  </objectgroup>
+ </group>
+</map>
+"""
+
+
+def make_object(object_id, name, properties):
+    return {
+        "id": object_id,
+        "name": name,
+        "type": "",
+        "x": 0,
+        "y": 0,
+        "width": 0,
+        "height": 0,
+        "rotation": 0,
+        "visible": True,
+        "properties": [
+            {"name": key, "type": "object", "value": value}
+            for key, value in properties.items()
+        ],
+    }
+
+
+def make_object_layer(layer_id, name, objects, properties=None):
+    layer = {
+        "draworder": "topdown",
+        "id": layer_id,
+        "name": name,
+        "objects": objects,
+        "opacity": 1,
+        "type": "objectgroup",
+        "visible": True,
+        "x": 0,
+        "y": 0,
+    }
+    if properties is not None:
+        layer["properties"] = properties
+    return layer
+
+
+JSON_MAP = json.dumps(
+    {
+        "height": 1,
+        "width": 1,
+        "infinite": False,
+        "layers": [
+            make_object_layer(
+                1,
+                "Switches",
+                [
+                    make_object(1, "switch", {"door": 3, "unset": 0}),
+                    make_object(2, "other switch", {"door": 3}),
+                ],
+                [{"name": "first", "type": "object", "value": 1}],
+            ),
+            {
+                "id": 2,
+                "layers": [
+                    make_object_layer(
+                        3, "Doors", [make_object(3, "door", {"switch": 1})]
+                    )
+                ],
+                "name": "Group",
+                "opacity": 1,
+                "type": "group",
+                "visible": True,
+                "x": 0,
+                "y": 0,
+            },
+        ],
+        "nextlayerid": 4,
+        "nextobjectid": 4,
+        "orientation": "orthogonal",
+        "properties": [{"name": "spawn", "type": "object", "value": 3}],
+        "renderorder": "right-down",
+        "tileheight": 16,
+        "tilewidth": 16,
+        "tilesets": [
+            {
+                "columns": 1,
+                "firstgid": 1,
+                "margin": 0,
+                "name": "tiles",
+                "spacing": 0,
+                "tilecount": 1,
+                "tileheight": 16,
+                "tilewidth": 16,
+                "tiles": [
+                    {
+                        "id": 0,
+                        "properties": [
+                            {"name": "target", "type": "object", "value": 1}
+                        ],
+                    }
+                ],
+            }
+        ],
+        "version": "1.9",
+    }
+)
+
+MAPS = {"tmx": TMX_MAP, "json": JSON_MAP}
+
+
+def parse(extension, **kwargs):
+    return parse_map_data(MAPS[extension], Path(f"map.{extension}"), **kwargs)
+
+
+def get_objects(tiled_map):
+    switches = tiled_map.layers[0].tiled_objects
+    door = tiled_map.layers[1].layers[0].tiled_objects[0]
+    return switches[0], switches[1], door
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_references_resolve_to_objects(extension):
+    tiled_map = parse(extension, resolve_objects=True)
+    switch, other_switch, door = get_objects(tiled_map)
+
+    assert isinstance(switch.properties["door"], ObjectReference)
+    assert switch.properties["door"] == 3
+    assert switch.properties["door"].object is door
+    assert other_switch.properties["door"].object is door
+    assert door.properties["switch"].object is switch
+    assert tiled_map.layers[0].properties["first"].object is switch
+    assert tiled_map.properties["spawn"].object is door
+    assert switch.properties["unset"] == 0
+    assert switch.properties["unset"].object is None
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_tileset_references_are_not_resolved(extension):
+    tiled_map = parse(extension, resolve_objects=True)
+    target = tiled_map.tilesets[1].tiles[0].properties["target"]  # type: ignore
+
+    assert not isinstance(target, ObjectReference)
+
+
+def test_references_are_off_by_default():
+    switch, _, _ = get_objects(parse("json"))
+
+    assert type(switch.properties["door"]) is int
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_maps_sharing_an_interner_keep_their_own_objects(extension):
+    interner = Interner()
+    first = parse(extension, resolve_objects=True, interner=interner)
+    second = parse(extension, resolve_objects=True, interner=interner)
+
+    first_switch, _, first_door = get_objects(first)
+    second_switch, _, second_door = get_objects(second)
+    assert first_switch.properties["door"].object is first_door
+    assert second_switch.properties["door"].object is second_door
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_references_survive_pickling(extension):
+    tiled_map = pickle.loads(pickle.dumps(parse(extension, resolve_objects=True)))
+    switch, _, door = get_objects(tiled_map)
+
+    assert switch.properties["door"].object is door
+    assert door.properties["switch"].object is switch
@@ -0,0 +1,258 @@
+"""Tests for filling in class properties from the custom types of a Tiled project"""
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import Color, parse_map_data, parse_tileset_data
+from pytiled_parser.property_types import PropertyTypes, load_property_types
+from pytiled_parser.resolver import MemoryResolver
+
+RAW_PROPERTY_TYPES = [
+    {
+        "id": 1,
+        "name": "Direction",
+        "type": "enum",
+        "storageType": "string",
+        "values": ["north", "east", "south", "west"],
+        "valuesAsFlags": False,
+    },
+    {
+        "id": 2,
+        "name": "Layers",
+        "type": "enum",
+        "storageType": "int",
+        "values": ["ground", "water", "air"],
+        "valuesAsFlags": True,
+    },
+    {
+        "id": 3,
+        "name": "Stats",
+        "type": "class",
+        "useAs": ["property"],
+        "members": [
+            {"name": "health", "type": "int", "value": 10},
+            {"name": "speed", "type": "float", "value": 1.5},
+        ],
+    },
+    {
+        "id": 4,
+        "name": "Enemy",
+        "type": "class",
+        "useAs": ["property"],
+        "members": [
+            {"name": "alive", "type": "bool", "value": True},
+            {"name": "facing", "type": "string", "propertyType": "Direction"},
+            {"name": "layers", "type": "int", "propertyType": "Layers", "value": 1},
+            {"name": "sprite", "type": "file", "value": "enemy.png"},
+            {
+                "name": "stats",
+                "type": "class",
+                "propertyType": "Stats",
+                "value": {"speed": 2.5},
+            },
+            {"name": "tint", "type": "color", "value": "#ff102030"},
+        ],
+    },
+]
+
+# The facing of the enemy has no default value, so is only set when it is given
+EXPECTED_DEFAULTS = {
+    "alive": True,
+    "layers": 1,
+    "sprite": Path("enemy.png"),
+    "stats": {"health": 10, "speed": 2.5},
+    "tint": Color(16, 32, 48, 255),
+}
+
+EXPECTED = {
+    "boss": {
+        **EXPECTED_DEFAULTS,
+        "alive": False,
+        "facing": "west",
+        "layers": 5,
+        "stats": {"health": 99, "speed": 2.5},
+    },
+    "minion": EXPECTED_DEFAULTS,
+    "direction": "north",
+}
+
+TMX_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.9" tiledversion="1.9.0" orientation="orthogonal"
+ renderorder="right-down" width="1" height="1" tilewidth="16" tileheight="16"
+ infinite="0" nextlayerid="1" nextobjectid="1">
+ <properties>
+  <property name="boss" type="class" propertytype="Enemy">
+   <properties>
+    <property name="alive" type="bool" value="false"/>
+    <property name="facing" propertytype="Direction" value="west"/>
+    <property name="layers" type="int" propertytype="Layers" value="5"/>
+    <property name="stats" type="class" propertytype="Stats">
+     <properties>
+      <property name="health" type="int" value="99"/>
+     </properties>
+    </property>
+   </properties>
+  </property>
+  <property name="direction" propertytype="Direction" value="north"/>
+  <property name="minion" type="class" propertytype="Enemy"/>
+ </properties>
+</map>
+"""
+
+JSON_MAP = json.dumps(
+    {
+        "height": 1,
+        "width": 1,
+        "infinite": False,
+        "layers": [],
+        "nextlayerid": 1,
+        "nextobjectid": 1,
+        "orientation": "orthogonal",
+        "properties": [
+            {
+                "name": "boss",
+                "type": "class",
+                "propertytype": "Enemy",
+                "value": {
+                    "alive": False,
+                    "facing": "west",
+                    "layers": 5,
+                    "stats": {"health": 99},
+                },
+            },
+            {
+                "name": "direction",
+                "type": "string",
+                "propertytype": "Direction",
+                "value": "north",
+            },
+            {"name": "minion", "type": "class", "propertytype": "Enemy", "value": {}},
+        ],
+        "renderorder": "right-down",
+        "tileheight": 16,
+        "tilewidth": 16,
+        "tilesets": [],
+        "version": "1.9",
+    }
+)
+
+MAPS = {"tmx": TMX_MAP, "json": JSON_MAP}
+
+
+@pytest.fixture
+def property_types():
+    return PropertyTypes(RAW_PROPERTY_TYPES)  # type: ignore
+
+
+def parse(extension, property_types=None):
+    return parse_map_data(
+        MAPS[extension], Path(f"map.{extension}"), property_types=property_types
+    )
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_class_properties_are_filled_in(property_types, extension):
+    tiled_map = parse(extension, property_types)
+
+    assert tiled_map.properties == EXPECTED
+    assert type(tiled_map.properties["boss"]["layers"]) is int
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_class_properties_without_types(extension):
+    tiled_map = parse(extension)
+
+    assert tiled_map.properties == {
+        "boss": {
+            "alive": False,
+            "facing": "west",
+            "layers": 5,
+            "stats": {"health": 99},
+        },
+        "direction": "north",
+        "minion": {},
+    }
+
+
+def test_values_are_not_shared(property_types):
+    first = property_types.coerce("Enemy", {})
+    second = property_types.coerce("Enemy", None)
+
+    assert first == second == EXPECTED_DEFAULTS
+    assert first is not second
+    assert first["stats"] is not second["stats"]
+
+
+def test_unknown_members_are_kept(property_types):
+    value = property_types.coerce("Stats", {"health": "3", "removed": "yes"})
+
+    assert value == {"health": 3, "speed": 1.5, "removed": "yes"}
+
+
+def test_enums_are_converted_to_their_storage_type(property_types):
+    assert property_types.coerce("Layers", "6") == 6
+    assert property_types.coerce("Direction", "east") == "east"
+
+
+def test_coercers_are_compiled_once(property_types):
+    coercer = property_types.get_coercer("Enemy")
+
+    assert property_types.get_coercer("Enemy") is coercer
+    assert property_types.get_coercer("Stats") is property_types.get_coercer("Stats")
+    with pytest.raises(KeyError):
+        property_types.get_coercer("Missing")
+
+
+def test_equal_by_content(property_types):
+    other = PropertyTypes(json.loads(json.dumps(RAW_PROPERTY_TYPES)))
+    different = PropertyTypes(RAW_PROPERTY_TYPES[:2])  # type: ignore
+
+    assert other == property_types
+    assert hash(other) == hash(property_types)
+    assert repr(other) == repr(property_types)
+    assert different != property_types
+    assert pickle.loads(pickle.dumps(property_types)) == property_types
+
+
+def test_load_property_types(property_types):
+    project = {"folders": ["."], "propertyTypes": RAW_PROPERTY_TYPES}
+    resolver = MemoryResolver({"game.tiled-project": json.dumps(project)})
+
+    loaded = load_property_types(Path("game.tiled-project"), resolver=resolver)
+
+    assert loaded == property_types
+    assert "Enemy" in loaded
+    assert "Missing" not in loaded
+
+
+def test_tileset_properties(property_types):
+    tileset = json.dumps(
+        {
+            "columns": 0,
+            "margin": 0,
+            "name": "enemies",
+            "spacing": 0,
+            "tilecount": 0,
+            "tileheight": 16,
+            "tilewidth": 16,
+            "type": "tileset",
+            "properties": [
+                {"name": "stats", "type": "class", "propertytype": "Stats", "value": {}}
+            ],
+        }
+    )
+
+    parsed = parse_tileset_data(
+        tileset, Path("enemies.json"), property_types=property_types
+    )
+
+    assert parsed.properties == {"stats": {"health": 10, "speed": 1.5}}
+
+
+def test_project_without_property_types():
+    project = Path(__file__).parent / "test_data" / "tests.tiled-project"
+
+    assert load_property_types(project) == PropertyTypes([])
@@ -0,0 +1,106 @@
+"""Tests for reloading maps and worlds when their files change"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser.cache import listing_cache, template_cache, tileset_cache
+from pytiled_parser.reload import ReloadManager
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+WORLD_TESTS = TEST_DATA / "world_tests"
+
+
+def touch(path: Path) -> None:
+    # Timestamps may be coarser than the time between these steps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def replace_text(path: Path, old: str, new: str) -> None:
+    path.write_text(path.read_text().replace(old, new))
+    touch(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+    listing_cache.clear()
+
+
+@pytest.fixture
+def map_dir(tmp_path):
+    shutil.copytree(MAP_TESTS / "template", tmp_path / "map")
+    return tmp_path / "map"
+
+
+def test_only_affected_maps_are_reloaded(map_dir):
+    reloaded = []
+    manager = ReloadManager(on_reload=lambda file, value: reloaded.append(file))
+    tmx_map = manager.load_map(map_dir / "map.tmx")
+    manager.load_map(map_dir / "map.json")
+
+    assert manager.poll() == {}
+    assert manager.dependents(map_dir / "template-rectangle.tx") == [
+        map_dir / "map.tmx"
+    ]
+
+    replace_text(map_dir / "template-rectangle.tx", 'width="63.6586"', 'width="10"')
+
+    result = manager.poll()
+    assert list(result) == [map_dir / "map.tmx"]
+    assert reloaded == [map_dir / "map.tmx"]
+    assert manager.get(map_dir / "map.tmx") is result[map_dir / "map.tmx"]
+    assert result[map_dir / "map.tmx"] != tmx_map
+
+    assert manager.poll() == {}
+
+
+def test_unchanged_tilesets_are_reused(map_dir):
+    manager = ReloadManager()
+    manager.load_map(map_dir / "map.tmx")
+    misses = tileset_cache.misses
+
+    touch(map_dir / "map.tmx")
+    assert list(manager.poll()) == [map_dir / "map.tmx"]
+
+    assert tileset_cache.misses == misses
+
+
+def test_failed_reload_keeps_previous_version(map_dir):
+    manager = ReloadManager()
+    tiled_map = manager.load_map(map_dir / "map.json")
+
+    (map_dir / "map.json").write_text("{")
+    touch(map_dir / "map.json")
+
+    assert manager.poll() == {}
+    assert map_dir / "map.json" in manager.errors
+    assert manager.get(map_dir / "map.json") is tiled_map
+
+    # It is not retried until the file changes again
+    assert manager.poll() == {}
+
+    shutil.copy(MAP_TESTS / "template" / "map.json", map_dir / "map.json")
+    touch(map_dir / "map.json")
+    assert list(manager.poll()) == [map_dir / "map.json"]
+    assert manager.errors == {}
+
+
+def test_world_pattern_matches(tmp_path):
+    world_dir = tmp_path / "world"
+    shutil.copytree(WORLD_TESTS / "pattern_matched", world_dir)
+    manager = ReloadManager()
+
+    assert len(manager.load_world(world_dir / "world.world").maps) == 2
+
+    shutil.copy(world_dir / "map_p0-n1.json", world_dir / "map_p1-n1.json")
+    touch(world_dir)
+
+    result = manager.poll()
+    assert len(result[world_dir / "world.world"].maps) == 3
@@ -0,0 +1,148 @@
+"""Tests for parsing from memory and custom resolvers"""
+
+import io
+import operator
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import (
+    parse_map,
+    parse_map_data,
+    parse_tileset,
+    parse_tileset_data,
+    parse_world,
+    parse_world_data,
+)
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.resolver import MemoryResolver
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+WORLD_TESTS = TEST_DATA / "world_tests"
+
+
+def load_directory(directory: Path, prefix: str = "") -> MemoryResolver:
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root) / name
+            files[prefix + path.relative_to(directory).as_posix()] = path.read_bytes()
+    return MemoryResolver(files)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_map_from_memory_resolver(map_name):
+    resolver = load_directory(MAP_TESTS / "template", "levels/")
+
+    expected = parse_map(MAP_TESTS / "template" / map_name)
+    casted_map = parse_map(Path("levels") / map_name, resolver=resolver)
+
+    assert casted_map.layers == expected.layers
+    assert casted_map.properties == expected.properties
+    assert sorted(casted_map.tilesets) == sorted(expected.tilesets)
+    for firstgid, tileset in casted_map.tilesets.items():
+        assert tileset.name == expected.tilesets[firstgid].name
+        assert tileset.tile_count == expected.tilesets[firstgid].tile_count
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_map_data_sources(map_name):
+    map_dir = MAP_TESTS / "external_tileset_dif_dir"
+    data = (map_dir / map_name).read_bytes()
+    expected = parse_map(map_dir / map_name)
+
+    for source in [data, data.decode("utf-8"), io.BytesIO(data)]:
+        casted_map = parse_map_data(source, map_dir / map_name)
+        assert casted_map == expected
+
+
+def test_callback_resolver():
+    map_dir = MAP_TESTS / "external_tileset_dif_dir"
+    requested = []
+
+    def read(path):
+        requested.append(Path(path))
+        return (map_dir / path).read_bytes()
+
+    casted_map = parse_map_data(
+        (map_dir / "map.tmx").read_bytes(), Path("map.tmx"), resolver=read
+    )
+
+    assert requested == [Path("tileset/tileset.tsx")]
+    assert casted_map.tilesets[1].name == "tileset"
+
+
+def test_memory_resolver_tilesets_are_cached():
+    resolver = load_directory(MAP_TESTS / "external_tileset_dif_dir")
+
+    parse_map(Path("map.tmx"), resolver=resolver, cache_tilesets=True)
+    parse_map(Path("map.json"), resolver=resolver, cache_tilesets=True)
+
+    # The map files reference the tsx and json tilesets respectively
+    assert tileset_cache.misses == 2
+    parse_map(Path("map.tmx"), resolver=resolver, cache_tilesets=True)
+    assert tileset_cache.hits == 1
+
+
+def test_memory_resolvers_with_different_contents():
+    map_dir = MAP_TESTS / "external_tileset_dif_dir"
+    data = (map_dir / "tileset" / "tileset.tsx").read_bytes()
+    map_data = (map_dir / "map.tmx").read_bytes()
+
+    # Names of the same length, so only the contents tell the tilesets apart
+    for index in range(20):
+        name = f"tileset{index:02}".encode()
+        renamed = data.replace(b'name="tileset"', b'name="%s"' % name)
+        resolver = MemoryResolver({"tileset/tileset.tsx": renamed})
+        casted_map = parse_map_data(
+            map_data, Path("map.tmx"), resolver=resolver, cache_tilesets=True
+        )
+        assert casted_map.tilesets[1].name == name.decode()
+
+    resolver = MemoryResolver({"tileset/tileset.tsx": data})
+    parse_map_data(map_data, Path("map.tmx"), resolver=resolver, cache_tilesets=True)
+    hits = tileset_cache.hits
+    parse_map_data(
+        map_data,
+        Path("map.tmx"),
+        resolver=MemoryResolver(resolver.files),
+        cache_tilesets=True,
+    )
+    assert tileset_cache.hits == hits + 1
+
+
+def test_tileset_data():
+    tileset_file = TEST_DATA / "tilesets" / "image" / "tileset.tsx"
+
+    assert parse_tileset_data(tileset_file.read_bytes()) == parse_tileset(tileset_file)
+
+
+def test_world_from_memory_resolver():
+    world_dir = WORLD_TESTS / "both"
+    resolver = load_directory(world_dir, "worlds/")
+
+    expected = parse_world(world_dir / "world.world")
+    casted_world = parse_world_data(
+        (world_dir / "world.world").read_bytes(),
+        Path("worlds/world.world"),
+        resolver=resolver,
+    )
+
+    for world in (expected, casted_world):
+        world.maps.sort(key=operator.attrgetter("map_file"))
+
+    assert [world_map.map_file.name for world_map in casted_world.maps] == [
+        world_map.map_file.name for world_map in expected.maps
+    ]
+    assert [world_map.coordinates for world_map in casted_world.maps] == [
+        world_map.coordinates for world_map in expected.maps
+    ]
@@ -0,0 +1,57 @@
+"""Tests that the classes parsed maps are made of have no instance dicts"""
+
+import os
+import pickle
+from pathlib import Path
+
+import attr
+import pytest
+
+from pytiled_parser import layer, parse_map, tiled_object, tileset, wang_set
+from pytiled_parser.layer import LayerGroup, ObjectLayer, TileLayer
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+
+SLOTTED_CLASSES = [
+    value
+    for module in (layer, tiled_object, tileset, wang_set)
+    for value in vars(module).values()
+    if isinstance(value, type)
+    and attr.has(value)
+    and value.__module__ == module.__name__
+]
+
+
+@pytest.mark.parametrize("cls", SLOTTED_CLASSES, ids=lambda cls: cls.__name__)
+def test_classes_are_slotted(cls):
+    assert "__slots__" in vars(cls)
+    assert cls.__dictoffset__ == 0
+
+
+def walk(layers):
+    for item in layers:
+        yield item
+        if isinstance(item, LayerGroup):
+            yield from walk(item.layers)
+
+
+@pytest.mark.parametrize("extension", ["json", "tmx"])
+def test_parsed_maps_have_no_instance_dicts(extension):
+    tiled_map = parse_map(
+        TEST_DATA / "layer_tests" / "all_layer_types" / f"map.{extension}"
+    )
+
+    values = list(walk(tiled_map.layers))
+    for item in values:
+        if isinstance(item, ObjectLayer):
+            values.extend(item.tiled_objects)
+        elif isinstance(item, TileLayer) and item.chunks:
+            values.extend(item.chunks)
+    values.extend(tiled_map.tilesets.values())
+
+    assert values
+    for value in values:
+        assert not hasattr(value, "__dict__"), type(value).__name__
+
+    assert pickle.loads(pickle.dumps(tiled_map)) == tiled_map
@@ -0,0 +1,132 @@
+"""Tests for map snapshots and the snapshot cache directory"""
+
+import hashlib
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map, parser
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.snapshot import _HEADER, dump_map, load_map, read_dependencies
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+MAP_TESTS = TEST_DATA / "map_tests"
+LAYER_TESTS = TEST_DATA / "layer_tests"
+
+ALL_MAPS = [
+    MAP_TESTS / "external_tileset_dif_dir" / "map.tmx",
+    MAP_TESTS / "hexagonal" / "map.json",
+    MAP_TESTS / "embedded_tileset" / "map.tmx",
+    MAP_TESTS / "template" / "map.json",
+    MAP_TESTS / "template" / "map.tmx",
+    LAYER_TESTS / "all_layer_types" / "map.tmx",
+    LAYER_TESTS / "infinite_map" / "map.json",
+    LAYER_TESTS / "infinite_map_b64" / "map.tmx",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+@pytest.mark.parametrize("map_file", ALL_MAPS)
+def test_round_trip(map_file):
+    tiled_map = parse_map(map_file)
+
+    assert load_map(dump_map(tiled_map)) == tiled_map
+
+
+def test_invalid_snapshot():
+    snapshot = dump_map(parse_map(ALL_MAPS[0]))
+
+    with pytest.raises(ValueError):
+        load_map(b"not a snapshot")
+
+    with pytest.raises(ValueError):
+        load_map(snapshot[:8] + b"\xff" + snapshot[9:])
+
+
+def test_corrupted_snapshot():
+    snapshot = dump_map(parse_map(ALL_MAPS[0]))
+    middle = (_HEADER.size + len(snapshot)) // 2
+
+    flipped = snapshot[:middle] + bytes([snapshot[middle] ^ 1]) + snapshot[middle + 1 :]
+
+    with pytest.raises(ValueError, match="corrupted"):
+        load_map(flipped)
+
+    with pytest.raises(ValueError, match="corrupted"):
+        load_map(snapshot[:-1])
+
+
+def test_snapshot_cannot_call_functions():
+    snapshot = dump_map(parse_map(ALL_MAPS[0]))
+    # A pickle which calls os.getcwd when loaded, given a matching digest
+    payload = b"\x80\x04cos\ngetcwd\n)R."
+    assert pickle.loads(payload) == os.getcwd()
+    header = _HEADER.unpack_from(snapshot, 0)
+    manifest = snapshot[_HEADER.size : _HEADER.size + header[3]]
+    header = header[:5] + (hashlib.sha256(payload).digest(),)
+
+    with pytest.raises(pickle.UnpicklingError, match="os.getcwd"):
+        load_map(_HEADER.pack(*header) + manifest + payload)
+
+
+def test_cache_dir(tmp_path, monkeypatch):
+    map_file = MAP_TESTS / "template" / "map.tmx"
+    cache_dir = tmp_path / "cache"
+
+    expected = parse_map(map_file, cache_dir=cache_dir)
+    snapshots = list(cache_dir.iterdir())
+    assert len(snapshots) == 1
+    dependencies = read_dependencies(snapshots[0].read_bytes())
+    assert {Path(dependency.path).name for dependency in dependencies} == {
+        "map.tmx",
+        "tile_set_image_for_template.tsx",
+        "template-tile-image.tx",
+        "template-tile-spritesheet.tx",
+        "template-rectangle.tx",
+        "tile_set_single_image.tsx",
+        "tileset.tsx",
+    }
+
+    def fail(*args):
+        raise AssertionError("The map should have been loaded from the cache")
+
+    monkeypatch.setattr(parser, "_parse_map", fail)
+    assert parse_map(map_file, cache_dir=cache_dir) == expected
+
+
+def test_cache_dir_dependency_changed(tmp_path):
+    map_dir = tmp_path / "map"
+    shutil.copytree(MAP_TESTS / "external_tileset_dif_dir", map_dir)
+    cache_dir = tmp_path / "cache"
+
+    tiled_map = parse_map(map_dir / "map.tmx", cache_dir=cache_dir)
+    assert tiled_map.tilesets[1].name == "tileset"
+
+    tileset_file = map_dir / "tileset" / "tileset.tsx"
+    tileset_file.write_text(
+        tileset_file.read_text().replace('name="tileset"', 'name="changed_name"')
+    )
+
+    tiled_map = parse_map(map_dir / "map.tmx", cache_dir=cache_dir)
+    assert tiled_map.tilesets[1].name == "changed_name"
+
+
+def test_cache_dir_corrupted_snapshot(tmp_path):
+    map_file = MAP_TESTS / "embedded_tileset" / "map.tmx"
+    cache_dir = tmp_path / "cache"
+
+    expected = parse_map(map_file, cache_dir=cache_dir)
+    for snapshot in cache_dir.iterdir():
+        snapshot.write_bytes(b"corrupted")
+
+    assert parse_map(map_file, cache_dir=cache_dir) == expected
+    assert parse_map(map_file, cache_dir=cache_dir) == expected
@@ -0,0 +1,80 @@
+"""Tests for reading and detecting the format of source files"""
+
+import builtins
+import os
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map, parse_map_data
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.util import check_format, sniff_format
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+MAP_TESTS = TESTS_DIR / "test_data" / "map_tests"
+
+
+@pytest.mark.parametrize(
+    "data,file_path,expected",
+    [
+        (b'<?xml version="1.0" encoding="UTF-8"?>\n<map/>', None, "tmx"),
+        (b"\xef\xbb\xbf\n  <map/>", None, "tmx"),
+        (b'{ "type": "map" }', None, "json"),
+        (b"\r\n\t{}", Path("map.tmx"), "json"),
+        (b"", Path("tileset.tsx"), "tmx"),
+        (b"  ", Path("map.tmj"), "json"),
+        (b"|||garbage|||", None, "json"),
+        ("\ufeff\n<map/>".encode("utf-16-le"), None, "tmx"),
+        ("\ufeff\n<map/>".encode("utf-16-be"), None, "tmx"),
+        ("\ufeff\n<map/>".encode("utf-32-le"), None, "tmx"),
+        ("\ufeff{}".encode("utf-16-le"), Path("map.tmx"), "json"),
+    ],
+)
+def test_sniff_format(data, file_path, expected):
+    assert sniff_format(data, file_path) == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-16-be", "utf-32-be", "cp037"])
+def test_sniff_format_with_encoding(encoding):
+    assert sniff_format(" <map/>".encode(encoding), None, encoding) == "tmx"
+    assert sniff_format(' {"type": "map"}'.encode(encoding), None, encoding) == "json"
+
+
+def test_check_format(tmp_path):
+    map_file = tmp_path / "map.tmx"
+    map_file.write_text("<map/>", encoding="utf-16")
+    assert check_format(map_file, "utf-16") == "tmx"
+    map_file.write_bytes(b"")
+    assert check_format(map_file, "utf-8") == "tmx"
+
+
+def test_utf16_map():
+    map_file = MAP_TESTS / "embedded_tileset" / "map.tmx"
+    text = map_file.read_text("utf-8").replace('encoding="UTF-8"', 'encoding="UTF-16"')
+
+    casted_map = parse_map_data(text.encode("utf-16"), map_file, encoding="utf-16")
+
+    assert casted_map == parse_map(map_file)
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+@pytest.mark.parametrize(
+    "map_test", ["external_tileset_dif_dir", "cross_format_tileset"]
+)
+def test_each_file_opened_once(monkeypatch, map_test, map_name):
+    tileset_cache.clear()
+    template_cache.clear()
+
+    opened = Counter()
+    original_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        opened[os.path.realpath(file)] += 1
+        return original_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    parse_map(MAP_TESTS / map_test / map_name)
+
+    assert len(opened) == 2
+    assert max(opened.values()) == 1
@@ -0,0 +1,145 @@
+"""Tests for streaming the maps of a world"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import OrderedPair, Size, World, WorldMap
+from pytiled_parser.resolver import MemoryResolver
+from pytiled_parser.streaming import WorldStreamer
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+WORLD_DIR = TEST_DATA / "world_tests" / "static_defined"
+
+
+def create_world(count, resolver_class=MemoryResolver):
+    map_data = (WORLD_DIR / "map_01.json").read_bytes()
+    files = {f"map_{index}.json": map_data for index in range(count)}
+    files["tileset.json"] = (WORLD_DIR / "tileset.json").read_bytes()
+
+    world = World(
+        maps=[
+            WorldMap(
+                map_file=Path(f"map_{index}.json"),
+                size=Size(160, 160),
+                coordinates=OrderedPair(index * 160, 0),
+            )
+            for index in range(count)
+        ]
+    )
+    return world, resolver_class(files)
+
+
+def test_visible_and_adjacent_maps_are_loaded():
+    world, resolver = create_world(5)
+
+    with WorldStreamer(world, resolver=resolver) as streamer:
+        streamer.update(10, 10, 100, 100)
+        assert [world_map for world_map, _ in streamer.visible_maps()] == [
+            world.maps[0]
+        ]
+        assert streamer.misses == 1
+
+        streamer.wait()
+        assert streamer.get(world.maps[1]) is not None
+        assert streamer.get(world.maps[2]) is None
+        assert streamer.prefetches == 1
+
+        # Moving onto the prefetched map is a hit
+        streamer.update(170, 10, 100, 100)
+        assert streamer.hits == 1
+        assert streamer.misses == 1
+
+        streamer.wait()
+        assert streamer.get(world.maps[2]) is not None
+        assert streamer.loads == 3
+        assert streamer.average_load_time > 0
+
+
+def test_camera_spanning_maps():
+    world, resolver = create_world(5)
+
+    with WorldStreamer(world, resolver=resolver) as streamer:
+        streamer.update(100, 10, 100, 100)
+        assert [world_map for world_map, _ in streamer.visible_maps()] == [
+            world.maps[0],
+            world.maps[1],
+        ]
+
+
+def test_far_maps_are_evicted():
+    world, resolver = create_world(5)
+
+    with WorldStreamer(world, resolver=resolver, max_bytes=0) as streamer:
+        streamer.update(10, 10, 100, 100)
+        streamer.wait()
+        streamer.update(650, 10, 100, 100)
+        streamer.wait()
+
+        assert streamer.get(world.maps[0]) is None
+        assert streamer.get(world.maps[1]) is None
+        assert streamer.get(world.maps[3]) is not None
+        assert streamer.get(world.maps[4]) is not None
+        assert streamer.evictions == 2
+        assert streamer.total_bytes == 2 * len((WORLD_DIR / "map_01.json").read_bytes())
+
+
+def test_visible_maps_are_loaded_once():
+    reads = []
+    reading = threading.Event()
+    release = threading.Event()
+
+    class SlowResolver(MemoryResolver):
+        def read(self, path):
+            if path.name == "map_0.json":
+                reads.append(path)
+                reading.set()
+                release.wait(5)
+            return super().read(path)
+
+    world, resolver = create_world(3, SlowResolver)
+
+    with WorldStreamer(world, resolver=resolver) as streamer:
+        first = threading.Thread(target=streamer.update, args=(10, 10, 100, 100))
+        first.start()
+        assert reading.wait(5)
+
+        # This update finds the map being loaded by the first, and waits for it
+        second = threading.Thread(target=streamer.update, args=(10, 10, 100, 100))
+        second.start()
+        second.join(0.1)
+        release.set()
+        first.join()
+        second.join()
+        streamer.wait()
+
+        assert len(reads) == 1
+        assert streamer.misses == 2
+        assert streamer.loads == 2
+        assert streamer.get(world.maps[0]) is not None
+
+
+def test_failed_load_does_not_leave_maps_pending():
+    failures = ["map_0.json"]
+
+    class FlakyResolver(MemoryResolver):
+        def read(self, path):
+            if path.name in failures:
+                failures.remove(path.name)
+                raise OSError("Temporarily unavailable")
+            return super().read(path)
+
+    world, resolver = create_world(3, FlakyResolver)
+
+    with WorldStreamer(world, resolver=resolver) as streamer:
+        # The camera sees the first two maps, and loading the first fails
+        with pytest.raises(OSError):
+            streamer.update(100, 10, 100, 100)
+        assert streamer.get(world.maps[1]) is not None
+
+        streamer.update(100, 10, 100, 100)
+        streamer.wait()
+        assert streamer.get(world.maps[0]) is not None
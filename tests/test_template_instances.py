@@ -0,0 +1,316 @@
+"""Tests for objects created from object templates sharing the template"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map, parse_map_data
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.parsers.json import tiled_object as json_tiled_object
+from pytiled_parser.parsers.tmx import tiled_object as tmx_tiled_object
+from pytiled_parser.properties import copy_template_properties
+from pytiled_parser.resolver import MemoryResolver
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_MAP = TESTS_DIR / "test_data" / "map_tests" / "template"
+
+PARSERS = {"json": json_tiled_object, "tmx": tmx_tiled_object}
+
+TMX_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<template>
+ <object name="crate" type="prop" width="16" height="24" rotation="5">
+  <properties>
+   <property name="health" type="int" value="10"/>
+   <property name="loot" value="coins"/>
+  </properties>
+ </object>
+</template>
+"""
+
+TMX_INSTANCES = [
+    'id="{id}" x="1" y="2"',
+    'id="{id}" name="big" x="3" y="4" width="32"',
+    'id="{id}" x="5" y="6" height="48" visible="0" rotation="90"',
+    'id="{id}" x="7" y="8" class="scenery"',
+    'id="{id}" x="9" y="10" type="other"',
+]
+
+JSON_TEMPLATE = {
+    "object": {
+        "height": 24,
+        "id": 1,
+        "name": "crate",
+        "rotation": 5,
+        "class": "prop",
+        "visible": True,
+        "width": 16,
+        "properties": [
+            {"name": "health", "type": "int", "value": 10},
+            {"name": "loot", "type": "string", "value": "coins"},
+        ],
+    },
+    "type": "template",
+}
+
+
+def make_tmx_map(instances, properties=""):
+    objects = "\n".join(
+        f'  <object template="crate.tx" {attributes.format(id=index + 1)}>'
+        f"{properties}</object>"
+        for index, attributes in enumerate(instances)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+        'renderorder="right-down" '
+        'width="4" height="4" tilewidth="16" tileheight="16" infinite="0" '
+        f'nextlayerid="2" nextobjectid="{len(instances) + 1}">\n'
+        f' <objectgroup id="1" name="Objects">\n{objects}\n </objectgroup>\n'
+        "</map>\n"
+    )
+
+
+def make_json_map(instances):
+    return json.dumps(
+        {
+            "height": 4,
+            "width": 4,
+            "infinite": False,
+            "layers": [
+                {
+                    "draworder": "topdown",
+                    "id": 1,
+                    "name": "Objects",
+                    "objects": instances,
+                    "opacity": 1,
+                    "type": "objectgroup",
+                    "visible": True,
+                    "x": 0,
+                    "y": 0,
+                }
+            ],
+            "nextlayerid": 2,
+            "nextobjectid": len(instances) + 1,
+            "orientation": "orthogonal",
+            "renderorder": "right-down",
+            "tileheight": 16,
+            "tilewidth": 16,
+            "tilesets": [],
+            "version": "1.9",
+        }
+    )
+
+
+JSON_INSTANCES = [
+    {"id": 1, "template": "crate.json", "x": 1, "y": 2},
+    {"id": 2, "template": "crate.json", "name": "big", "x": 3, "y": 4},
+    {
+        "id": 3,
+        "template": "crate.json",
+        "x": 5,
+        "y": 6,
+        "properties": [{"name": "health", "type": "int", "value": 20}],
+    },
+]
+
+
+def parse(extension, map_data):
+    resolver = MemoryResolver(
+        {
+            "crate.tx": TMX_TEMPLATE,
+            "crate.json": json.dumps(JSON_TEMPLATE),
+            f"map.{extension}": map_data,
+        }
+    )
+    return parse_map_data(map_data, Path(f"map.{extension}"), resolver=resolver)
+
+
+def parse_in_full(monkeypatch, extension, parse_function, *args):
+    """Parse a map, always merging each object with its template."""
+    with monkeypatch.context() as patch:
+        patch.setattr(PARSERS[extension], "_parse_overrides", lambda *args: None)
+        return parse_function(*args)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+    yield
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+@pytest.mark.parametrize("map_name", ["map.json", "map.tmx"])
+def test_overrides_match_merged_template(monkeypatch, map_name):
+    map_file = TEMPLATE_MAP / map_name
+
+    expected = parse_in_full(monkeypatch, map_file.suffix[1:], parse_map, map_file)
+    template_cache.clear()
+    tileset_cache.clear()
+
+    assert parse_map(map_file) == expected
+
+
+@pytest.mark.parametrize(
+    "extension, map_data",
+    [
+        ("tmx", make_tmx_map(TMX_INSTANCES)),
+        (
+            "tmx",
+            make_tmx_map(
+                TMX_INSTANCES,
+                '<properties><property name="health" type="int" value="5"/>'
+                '<property name="new" value="yes"/></properties>',
+            ),
+        ),
+        ("json", make_json_map(JSON_INSTANCES)),
+    ],
+    ids=["tmx", "tmx-properties", "json"],
+)
+def test_attribute_overrides_match_merged_template(monkeypatch, extension, map_data):
+    expected = parse_in_full(monkeypatch, extension, parse, extension, map_data)
+    template_cache.clear()
+
+    assert parse(extension, map_data) == expected
+
+
+@pytest.mark.parametrize(
+    "extension, map_data",
+    [
+        ("tmx", make_tmx_map([TMX_INSTANCES[0]] * 50)),
+        ("json", make_json_map([JSON_INSTANCES[0]] * 50)),
+    ],
+    ids=["tmx", "json"],
+)
+def test_template_parsed_once(monkeypatch, extension, map_data):
+    parser = PARSERS[extension]
+    calls = []
+    parse_template_object = parser._parse_template_object
+
+    def counting_parse(template_object, *args):
+        calls.append(template_object)
+        return parse_template_object(template_object, *args)
+
+    monkeypatch.setattr(parser, "_parse_template_object", counting_parse)
+
+    tiled_objects = parse(extension, map_data).layers[0].tiled_objects
+
+    assert len(tiled_objects) == 50
+    assert len(calls) == 1
+    # Every object shares the immutable values of the template, and has its own
+    # properties
+    for tiled_object in tiled_objects[1:]:
+        assert tiled_object.size is tiled_objects[0].size
+        assert tiled_object.properties == tiled_objects[0].properties
+        assert tiled_object.properties is not tiled_objects[0].properties
+
+
+@pytest.mark.parametrize(
+    "extension, map_data",
+    [
+        ("tmx", make_tmx_map(TMX_INSTANCES)),
+        ("json", make_json_map(JSON_INSTANCES)),
+    ],
+    ids=["tmx", "json"],
+)
+def test_properties_are_plain_dicts(extension, map_data):
+    first, second = parse(extension, map_data).layers[0].tiled_objects[:2]
+    assert type(first.properties) is dict
+    assert first.properties == {"health": 10, "loot": "coins"}
+    assert json.loads(json.dumps(first.properties)) == first.properties
+    assert first.properties | {"new": True} == {
+        "health": 10,
+        "loot": "coins",
+        "new": True,
+    }
+
+    first.properties["health"] = 1
+    first.properties["new"] = True
+    del first.properties["loot"]
+
+    assert first.properties == {"health": 1, "new": True}
+    assert second.properties == {"health": 10, "loot": "coins"}
+
+
+def test_instance_properties_override_template():
+    tiled_object = (
+        parse("json", make_json_map(JSON_INSTANCES)).layers[0].tiled_objects[2]
+    )
+
+    assert tiled_object.properties == {"health": 20, "loot": "coins"}
+
+
+TMX_POLYGON_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<template>
+ <object>
+  <polygon points="0,0 16,0 16,16"/>
+ </object>
+</template>
+"""
+
+# Tiled leaves out the name, rotation and visibility of some templates
+JSON_POLYGON_TEMPLATE = {
+    "object": {
+        "id": 1,
+        "polygon": [{"x": 0, "y": 0}, {"x": 16, "y": 0}, {"x": 16, "y": 16}],
+        "width": 0,
+        "height": 0,
+    },
+    "type": "template",
+}
+
+
+def parse_polygons(extension):
+    resolver = MemoryResolver(
+        {
+            "polygon.tx": TMX_POLYGON_TEMPLATE,
+            "polygon.json": json.dumps(JSON_POLYGON_TEMPLATE),
+        }
+    )
+    if extension == "tmx":
+        map_data = make_tmx_map(['id="{id}" x="1" y="2"'] * 2).replace(
+            "crate.tx", "polygon.tx"
+        )
+    else:
+        map_data = make_json_map(
+            [
+                {"id": index + 1, "template": "polygon.json", "x": 1, "y": 2}
+                for index in range(2)
+            ]
+        )
+    tiled_map = parse_map_data(map_data, Path(f"map.{extension}"), resolver=resolver)
+    return tiled_map.layers[0].tiled_objects  # type: ignore
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_mutable_values_are_not_shared(extension):
+    first, second = parse_polygons(extension)
+
+    assert first.name == ""
+    assert first.rotation == 0
+    assert first.visible
+    assert first.points == second.points
+    assert first.points is not second.points
+    assert first.properties is not second.properties
+
+    first.points.append(first.points[0])
+    first.properties["changed"] = True
+
+    # Neither the other object, nor objects parsed later on, see the changes
+    for tiled_object in [second, *parse_polygons(extension)]:
+        assert len(tiled_object.points) == 3
+        assert tiled_object.properties == {}
+
+
+def test_class_properties_are_copied():
+    template = {"stats": {"health": 10}, "loot": "coins"}
+    properties = copy_template_properties(template, {"loot": "gems"})
+
+    properties["stats"]["health"] = 1
+
+    assert properties == {"stats": {"health": 1}, "loot": "gems"}
+    assert template == {"stats": {"health": 10}, "loot": "coins"}
+    assert copy_template_properties(template, {})["stats"] == {"health": 10}
@@ -0,0 +1,268 @@
+"""Tests for adding the tilesets of object templates to the maps using them"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import parse_map_data
+from pytiled_parser.cache import template_cache, tileset_cache
+from pytiled_parser.layer import LayerGroup, ObjectLayer
+from pytiled_parser.resolver import MemoryResolver
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = TESTS_DIR / "test_data" / "map_tests" / "template"
+
+TEMPLATE_FILES = [
+    "template-rectangle",
+    "template-tile-image",
+    "template-tile-spritesheet",
+    "tile_set_image_for_template",
+    "tile_set_single_image",
+    "tileset",
+]
+
+TMX_COLLISION_TILESET = """<?xml version="1.0" encoding="UTF-8"?>
+<tileset version="1.9" tiledversion="1.9.2" name="collisions" tilewidth="32"
+ tileheight="32" tilecount="1" columns="0">
+ <tile id="0">
+  <objectgroup draworder="index" id="2">
+   <object id="1" template="template-tile-image.tx" x="0" y="0"/>
+  </objectgroup>
+ </tile>
+</tileset>
+"""
+
+JSON_COLLISION_TILESET = {
+    "columns": 0,
+    "margin": 0,
+    "name": "collisions",
+    "spacing": 0,
+    "tilecount": 1,
+    "tileheight": 32,
+    "tilewidth": 32,
+    "tiles": [
+        {
+            "id": 0,
+            "objectgroup": {
+                "draworder": "index",
+                "id": 2,
+                "name": "",
+                "objects": [
+                    {"id": 1, "template": "template-tile-image.json", "x": 0, "y": 0}
+                ],
+                "opacity": 1,
+                "type": "objectgroup",
+                "visible": True,
+                "x": 0,
+                "y": 0,
+            },
+        }
+    ],
+    "type": "tileset",
+}
+
+TEMPLATE_OBJECT_COUNT = 20
+# Objects alternate between the templates of two tilesets
+TEMPLATES = ["template-tile-spritesheet", "template-tile-image"]
+
+
+def make_tmx_map(tilesets):
+    objects = "\n".join(
+        f'   <object id="{index + 1}" template="{TEMPLATES[index % 2]}.tx" '
+        'x="0" y="0"/>'
+        for index in range(TEMPLATE_OBJECT_COUNT)
+    )
+    tileset_elements = "\n".join(
+        f' <tileset firstgid="{firstgid}" source="{source}.tsx"/>'
+        for firstgid, source in tilesets
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.9" tiledversion="1.9.2" orientation="orthogonal" '
+        'renderorder="right-down" width="1" height="1" tilewidth="32" '
+        'tileheight="32" infinite="0" nextlayerid="3" '
+        f'nextobjectid="{TEMPLATE_OBJECT_COUNT + 1}">\n'
+        f"{tileset_elements}\n"
+        ' <group id="1" name="Group">\n'
+        '  <objectgroup id="2" name="Objects">\n'
+        f"{objects}\n"
+        "  </objectgroup>\n"
+        " </group>\n"
+        "</map>\n"
+    )
+
+
+def make_json_map(tilesets):
+    objects = [
+        {
+            "id": index + 1,
+            "template": f"{TEMPLATES[index % 2]}.json",
+            "x": 0,
+            "y": 0,
+        }
+        for index in range(TEMPLATE_OBJECT_COUNT)
+    ]
+    return json.dumps(
+        {
+            "height": 1,
+            "width": 1,
+            "infinite": False,
+            "layers": [
+                {
+                    "id": 1,
+                    "layers": [
+                        {
+                            "draworder": "topdown",
+                            "id": 2,
+                            "name": "Objects",
+                            "objects": objects,
+                            "opacity": 1,
+                            "type": "objectgroup",
+                            "visible": True,
+                            "x": 0,
+                            "y": 0,
+                        }
+                    ],
+                    "name": "Group",
+                    "opacity": 1,
+                    "type": "group",
+                    "visible": True,
+                    "x": 0,
+                    "y": 0,
+                }
+            ],
+            "nextlayerid": 3,
+            "nextobjectid": TEMPLATE_OBJECT_COUNT + 1,
+            "orientation": "orthogonal",
+            "renderorder": "right-down",
+            "tileheight": 32,
+            "tilewidth": 32,
+            "tilesets": [
+                {"firstgid": firstgid, "source": f"{source}.json"}
+                for firstgid, source in tilesets
+            ],
+            "version": "1.9",
+        }
+    )
+
+
+MAKE_MAP = {"tmx": make_tmx_map, "json": make_json_map}
+TILESET_EXTENSIONS = {"tmx": "tsx", "json": "json"}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tileset_cache.clear()
+    template_cache.clear()
+    yield
+    tileset_cache.clear()
+    template_cache.clear()
+
+
+def make_resolver(extension):
+    template_extension = "tx" if extension == "tmx" else "json"
+    tileset_extension = TILESET_EXTENSIONS[extension]
+    files = {}
+    for name in TEMPLATE_FILES:
+        for suffix in (template_extension, tileset_extension):
+            path = TEMPLATE_DIR / f"{name}.{suffix}"
+            if path.exists():
+                files[path.name] = path.read_bytes()
+    files[f"collisions.{tileset_extension}"] = (
+        TMX_COLLISION_TILESET
+        if extension == "tmx"
+        else json.dumps(JSON_COLLISION_TILESET)
+    )
+    return MemoryResolver(files)
+
+
+def parse(extension, tilesets, resolver=None, cache_tilesets=False):
+    if resolver is None:
+        resolver = make_resolver(extension)
+    map_data = MAKE_MAP[extension](tilesets)
+    return parse_map_data(
+        map_data,
+        Path(f"map.{extension}"),
+        resolver=resolver,
+        cache_tilesets=cache_tilesets,
+    )
+
+
+def get_objects(tiled_map):
+    group = tiled_map.layers[0]
+    assert isinstance(group, LayerGroup)
+    layer = group.layers[0]  # type: ignore
+    assert isinstance(layer, ObjectLayer)
+    return layer.tiled_objects
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_objects_within_groups_use_new_tilesets(extension):
+    tiled_map = parse(extension, [(1, "tileset")])
+
+    names = {firstgid: tileset.name for firstgid, tileset in tiled_map.tilesets.items()}
+    assert names == {
+        1: "tile_set_image",
+        49: "tile_set_image_for_template",
+        50: "tile_set_single_image",
+    }
+    for index, tiled_object in enumerate(get_objects(tiled_map)):
+        assert tiled_object.gid == (50 if index % 2 else 49)  # type: ignore
+        assert tiled_object.new_tileset is None  # type: ignore
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_tilesets_already_in_the_map_are_reused(extension):
+    tiled_map = parse(extension, [(1, "tileset"), (49, "tile_set_image_for_template")])
+
+    assert sorted(tiled_map.tilesets) == [1, 49, 50]
+    assert get_objects(tiled_map)[0].gid == 49  # type: ignore
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_map_without_tilesets(extension):
+    tiled_map = parse(extension, [])
+
+    assert sorted(tiled_map.tilesets) == [1, 2]
+    assert get_objects(tiled_map)[0].gid == 1  # type: ignore
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+def test_collision_shapes_of_tiles_use_new_tilesets(extension):
+    tiled_map = parse(extension, [(1, "tileset"), (49, "collisions")])
+
+    collisions = tiled_map.tilesets[49]
+    tile_object = collisions.tiles[0].objects.tiled_objects[0]  # type: ignore
+    assert tile_object.new_tileset is None
+    assert tiled_map.tilesets[tile_object.gid].name == "tile_set_single_image"
+
+
+def get_collision_tileset_name(tiled_map, firstgid):
+    tile_object = tiled_map.tilesets[firstgid].tiles[0].objects.tiled_objects[0]
+    return tiled_map.tilesets[tile_object.gid].name
+
+
+@pytest.mark.parametrize("extension", ["tmx", "json"])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_maps_sharing_a_cached_tileset(extension, reverse):
+    resolver = make_resolver(extension)
+    layouts = [
+        [(1, "tileset"), (49, "collisions")],
+        [(1, "tileset"), (49, "tile_set_single_image"), (50, "collisions")],
+    ]
+    if reverse:
+        layouts.reverse()
+
+    first, second = [
+        parse(extension, layout, resolver, cache_tilesets=True) for layout in layouts
+    ]
+    if reverse:
+        first, second = second, first
+
+    assert sorted(first.tilesets) == [1, 49, 50, 51]
+    assert get_collision_tileset_name(first, 49) == "tile_set_single_image"
+    assert sorted(second.tilesets) == [1, 49, 50, 51]
+    assert get_collision_tileset_name(second, 50) == "tile_set_single_image"
+    assert tileset_cache.hits
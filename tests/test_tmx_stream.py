@@ -0,0 +1,83 @@
+"""Tests for parsing TMX maps while they are read"""
+
+import base64
+import os
+import struct
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser.context import ParseContext
+from pytiled_parser.parsers.tmx import tiled_map
+from pytiled_parser.util import parse_xml
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+
+ALL_TMX_MAPS = sorted(
+    path
+    for path in (TEST_DATA / "layer_tests").glob("*/map.tmx")
+    if path.parent.name not in ("b64_zstd", "unknown_type")
+) + sorted((TEST_DATA / "map_tests").glob("*/map.tmx"))
+
+
+@pytest.mark.parametrize("map_file", ALL_TMX_MAPS, ids=lambda path: path.parent.name)
+def test_stream_matches_tree(map_file):
+    data = map_file.read_bytes()
+
+    expected = tiled_map.parse(map_file, "utf-8", parse_xml(data, "utf-8"))
+
+    assert tiled_map.parse_stream(map_file, "utf-8", data) == expected
+
+
+def test_stream_handles_split_multibyte_characters(monkeypatch):
+    monkeypatch.setattr("pytiled_parser.backends._CHUNK_SIZE", 7)
+    map_file = TEST_DATA / "layer_tests" / "all_layer_types" / "map.tmx"
+    data = map_file.read_bytes().replace(b"Tile Layer 1", "Tïlé Lâyer 1".encode())
+
+    casted_map = tiled_map.parse_stream(map_file, "utf-8", data)
+
+    assert casted_map.layers[0].name == "Tïlé Lâyer 1"
+
+
+def make_map(layers, side):
+    row = struct.pack(f"<{side}I", *range(1, side + 1))
+    layer_data = base64.b64encode(row * side).decode("ascii")
+    return (
+        f'<map version="1.9" tiledversion="1.9.0" orientation="orthogonal" '
+        f'renderorder="right-down" '
+        f'width="{side}" height="{side}" tilewidth="32" tileheight="32" '
+        f'infinite="0" nextlayerid="{layers + 1}" nextobjectid="1">'
+        + "".join(
+            f'<layer id="{layer_id}" name="Layer {layer_id}" width="{side}" '
+            f'height="{side}"><data encoding="base64">{layer_data}</data></layer>'
+            for layer_id in range(1, layers + 1)
+        )
+        + "</map>"
+    ).encode("utf-8")
+
+
+def peak_memory(parse):
+    tracemalloc.start()
+    try:
+        parse()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_releases_layer_text():
+    data = make_map(layers=16, side=64)
+    map_file = Path("map.tmx")
+    context = ParseContext()
+
+    tree_peak = peak_memory(
+        lambda: tiled_map.parse(map_file, "utf-8", parse_xml(data, "utf-8"), context)
+    )
+    stream_peak = peak_memory(
+        lambda: tiled_map.parse_stream(map_file, "utf-8", data, context)
+    )
+
+    # The tree holds the text of every layer at once
+    assert stream_peak < tree_peak * 0.8
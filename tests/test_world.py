@@ -1,13 +1,17 @@
 """Tests for worlds"""
 
 import importlib.util
+import json
 import operator
 import os
+import shutil
 from pathlib import Path
 
 import pytest
 
-from pytiled_parser import world
+from pytiled_parser import parse_world, parse_world_data, world
+from pytiled_parser.cache import listing_cache
+from pytiled_parser.resolver import MemoryResolver
 
 TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 TEST_DATA = TESTS_DIR / "test_data"
@@ -46,3 +50,132 @@ def test_world_integration(world_test):
     fix_world(expected.EXPECTED)
 
     assert casted_world == expected.EXPECTED
+
+
+def test_world_to_map():
+    casted_world = world.parse_world(WORLD_TESTS / "both" / "world.world", "utf-8")
+
+    world_map, local = casted_world.world_to_map(10, 170)
+    assert world_map.map_file.name == "map_p0-n1.json"
+    assert local == (10, 10)
+
+    world_map, local = casted_world.world_to_map(-160, 0)
+    assert world_map.map_file.name == "map_manual_one.json"
+    assert local == (0, 0)
+
+    assert casted_world.world_to_map(-10, 170) is None
+
+
+def test_neighbors():
+    casted_world = world.parse_world(WORLD_TESTS / "both" / "world.world", "utf-8")
+    maps = {world_map.map_file.name: world_map for world_map in casted_world.maps}
+
+    def neighbor_names(name):
+        return sorted(
+            neighbor.map_file.name for neighbor in casted_world.neighbors(maps[name])
+        )
+
+    assert neighbor_names("map_p0-n0.json") == [
+        "map_manual_one.json",
+        "map_p0-n1.json",
+    ]
+    # Maps which only share a corner are adjacent as well
+    assert neighbor_names("map_p0-n1.json") == [
+        "map_manual_one.json",
+        "map_p0-n0.json",
+    ]
+
+
+def test_index_matches_linear_scan():
+    maps = [
+        world.WorldMap(
+            map_file=Path(f"map_{x}_{y}.json"),
+            size=world.Size(160 if x % 3 else 320, 160),
+            coordinates=world.OrderedPair(x * 160, y * 160),
+        )
+        for x in range(0, 30, 2)
+        for y in range(20)
+    ]
+    casted_world = world.World(maps=maps)
+
+    for rect in [(0, 0, 10, 10), (150, 150, 500, 20), (-50, 3000, 5000, 400)]:
+        assert casted_world.maps_in_rect(*rect) == [
+            world_map for world_map in maps if world._intersects(world_map, *rect)
+        ]
+
+    for world_map in maps:
+        assert casted_world.neighbors(world_map) == [
+            other
+            for other in maps
+            if other is not world_map
+            and world._touches(other, *world_map.coordinates, *world_map.size)
+        ]
+
+
+def test_patterns_list_directory_once():
+    listed = []
+
+    class CountingResolver(MemoryResolver):
+        def list_dir(self, path):
+            listed.append(path)
+            return super().list_dir(path)
+
+    resolver = CountingResolver(
+        {"a_1_2.json": b"{}", "b_3_4.json": b"{}", "other.json": b"{}"}
+    )
+    raw_world = {
+        "patterns": [
+            {"regexp": r"a_(\d+)_(\d+)\.json", "multiplierX": 10, "multiplierY": 10},
+            {"regexp": r"b_(\d+)_(\d+)\.json", "multiplierX": 20, "multiplierY": 20},
+        ]
+    }
+
+    casted_world = parse_world_data(
+        json.dumps(raw_world), Path("world.world"), resolver=resolver
+    )
+
+    assert len(listed) == 1
+    assert [
+        (world_map.map_file.name, world_map.coordinates)
+        for world_map in casted_world.maps
+    ] == [("a_1_2.json", (10, 20)), ("b_3_4.json", (60, 80))]
+
+
+def test_directory_listings_are_cached(tmp_path):
+    shutil.copytree(WORLD_TESTS / "pattern_matched", tmp_path / "world")
+    world_file = tmp_path / "world" / "world.world"
+    listing_cache.clear()
+
+    first = parse_world(world_file, cache_listing=True)
+    second = parse_world(world_file, cache_listing=True)
+    assert listing_cache.hits == 1
+    assert len(first.maps) == len(second.maps) == 2
+
+    shutil.copy(
+        tmp_path / "world" / "map_p0-n1.json", tmp_path / "world" / "map_p1-n1.json"
+    )
+    # Timestamps may be coarser than the time between these steps
+    stat = os.stat(tmp_path / "world")
+    os.utime(tmp_path / "world", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    third = parse_world(world_file, cache_listing=True)
+    assert len(third.maps) == 3
+
+
+def test_directory_listings_are_not_cached_by_default(tmp_path):
+    shutil.copytree(WORLD_TESTS / "pattern_matched", tmp_path / "world")
+    world_file = tmp_path / "world" / "world.world"
+    listing_cache.clear()
+
+    first = parse_world(world_file)
+    stat = os.stat(tmp_path / "world")
+    shutil.copy(
+        tmp_path / "world" / "map_p0-n1.json", tmp_path / "world" / "map_p1-n1.json"
+    )
+    # Leave the directory looking unchanged, as on a filesystem with coarse mtimes
+    os.utime(tmp_path / "world", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = parse_world(world_file)
+    assert len(first.maps) == 2
+    assert len(second.maps) == 3
+    assert listing_cache.hits == listing_cache.misses == 0
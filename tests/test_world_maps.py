@@ -0,0 +1,54 @@
+"""Tests for loading the maps within a world"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import load_world_maps, parse_map, parse_world
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATA = TESTS_DIR / "test_data"
+WORLD_TESTS = TEST_DATA / "world_tests"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_world_maps(workers):
+    world = parse_world(WORLD_TESTS / "both" / "world.world")
+
+    tiled_maps = load_world_maps(world, workers=workers)
+
+    assert sorted(tiled_maps) == sorted(world_map.map_file for world_map in world.maps)
+    for file, tiled_map in tiled_maps.items():
+        assert tiled_map == parse_map(file)
+
+
+def test_load_selected_maps():
+    world = parse_world(WORLD_TESTS / "static_defined" / "world.world")
+
+    tiled_maps = load_world_maps(world, maps=world.maps[:1], workers=2)
+
+    assert list(tiled_maps) == [world.maps[0].map_file]
+
+
+def test_tilesets_are_shared():
+    world = parse_world(WORLD_TESTS / "both" / "world.world")
+
+    tiled_maps = list(load_world_maps(world, workers=3, cache_tilesets=True).values())
+
+    first, *others = [tiled_map.tilesets[1] for tiled_map in tiled_maps]
+    for tileset in others:
+        assert tileset == first
+        assert tileset.image is first.image
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_tilesets_are_not_shared_by_default(workers):
+    world = parse_world(WORLD_TESTS / "both" / "world.world")
+
+    tiled_maps = list(load_world_maps(world, workers=workers).values())
+
+    first, *others = [tiled_map.tilesets[1] for tiled_map in tiled_maps]
+    for tileset in others:
+        assert tileset == first
+        assert tileset.image is not first.image